@@ -0,0 +1,170 @@
+# analytics.py
+# Statistik pemakaian dengan memori tetap: unique user harian/bulanan pakai
+# HyperLogLog, plus counter per command, disimpan berkala ke file
+import base64
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+from collections import Counter
+from datetime import date, timedelta
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class HyperLogLog:
+    """Sketch HyperLogLog untuk estimasi jumlah unique item dalam memori tetap"""
+    __slots__ = ('precision', 'registers')
+
+    def __init__(self, precision=None, registers=None):
+        self.precision = precision or config.ANALYTICS['precision']
+        self.registers = registers if registers is not None else bytearray(1 << self.precision)
+
+    def add(self, item):
+        hashed = int.from_bytes(hashlib.blake2b(str(item).encode(), digest_size=8).digest(), 'big')
+        index = hashed >> (64 - self.precision)
+        remaining = hashed & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - remaining.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other):
+        """Gabungkan sketch lain ke sketch ini (union)"""
+        self.registers = bytearray(max(a, b) for a, b in zip(self.registers, other.registers))
+
+    def count(self):
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        # Koreksi untuk jumlah kecil (linear counting)
+        if estimate <= 2.5 * size and zeros:
+            estimate = size * math.log(size / zeros)
+        return int(round(estimate))
+
+    def dump(self):
+        return base64.b64encode(bytes(self.registers)).decode()
+
+    @classmethod
+    def load(cls, data, precision):
+        return cls(precision, bytearray(base64.b64decode(data)))
+
+
+class UsageAnalytics:
+    """Unique user harian & rolling bulanan, plus counter per command"""
+
+    def __init__(self, path=None):
+        self.path = path or config.ANALYTICS['persist_path']
+        self.window_days = config.ANALYTICS['window_days']
+        self._daily = {}  # date -> HyperLogLog, maksimal window_days entry
+        self._commands = Counter()
+        self._commands_today = Counter()
+        self._today = date.today()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._stop = threading.Event()
+
+    def _rotate(self, today):
+        # Ganti hari: reset counter harian dan buang sketch di luar window
+        if today != self._today:
+            self._today = today
+            self._commands_today.clear()
+        oldest = today - timedelta(days=self.window_days - 1)
+        for day in [day for day in self._daily if day < oldest]:
+            del self._daily[day]
+
+    def record(self, user_id, command=None):
+        """Catat satu pemakaian bot oleh user_id (dan command-nya kalau ada)"""
+        today = date.today()
+        with self._lock:
+            self._rotate(today)
+            sketch = self._daily.get(today)
+            if sketch is None:
+                sketch = self._daily[today] = HyperLogLog()
+            sketch.add(user_id)
+            if command:
+                self._commands[command] += 1
+                self._commands_today[command] += 1
+            self._dirty = True
+
+    def snapshot(self):
+        """Ambil ringkasan statistik saat ini"""
+        today = date.today()
+        with self._lock:
+            self._rotate(today)
+            daily = self._daily.get(today)
+            monthly = HyperLogLog()
+            for sketch in self._daily.values():
+                monthly.merge(sketch)
+            return {
+                'daily_users': daily.count() if daily else 0,
+                'monthly_users': monthly.count(),
+                'commands_today': dict(self._commands_today),
+                'commands_total': dict(self._commands)
+            }
+
+    def save(self):
+        """Simpan state ke file (atomic rename)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            state = {
+                'precision': config.ANALYTICS['precision'],
+                'today': self._today.isoformat(),
+                'daily': {day.isoformat(): sketch.dump() for day, sketch in self._daily.items()},
+                'commands': dict(self._commands),
+                'commands_today': dict(self._commands_today)
+            }
+            self._dirty = False
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as handle:
+            json.dump(state, handle)
+        os.replace(tmp_path, self.path)
+
+    def load(self):
+        """Muat state dari file kalau ada"""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as handle:
+                state = json.load(handle)
+            precision = state['precision']
+            if precision != config.ANALYTICS['precision']:
+                logger.warning("Analytics precision changed, discarding saved sketches")
+                return
+            with self._lock:
+                self._daily = {
+                    date.fromisoformat(day): HyperLogLog.load(data, precision)
+                    for day, data in state['daily'].items()
+                }
+                self._commands = Counter(state['commands'])
+                self._today = date.fromisoformat(state['today'])
+                self._commands_today = Counter(state['commands_today'])
+                self._rotate(date.today())
+        except (OSError, ValueError, KeyError) as e:
+            logger.error("Failed to load analytics state: %s", e)
+
+    def _persist_loop(self):
+        while not self._stop.wait(config.ANALYTICS['persist_interval']):
+            try:
+                self.save()
+            except OSError as e:
+                logger.error("Failed to persist analytics: %s", e)
+
+    def start(self):
+        """Muat state lama dan jalankan thread penyimpanan berkala"""
+        self.load()
+        thread = threading.Thread(target=self._persist_loop, name='analytics-persist', daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self._stop.set()
+        self.save()
+
+
+analytics = UsageAnalytics()
@@ -1,16 +1,25 @@
 from flask import Flask, request, Response
 import telegram
-from osint_bot import setup_bot
+from telegram.ext import Dispatcher
+from osint_bot import setup_bot, setup_handlers, driver_pool, browser_supervisor
+from metrics import render_metrics, render_health
+from warmup import readiness, start_warmup
 import os
 
 app = Flask(__name__)
 bot = setup_bot()
+# Handler sudah jalan di lane masing-masing, jadi dispatcher tidak perlu worker sendiri
+dispatcher = Dispatcher(bot, None, workers=0)
+setup_handlers(dispatcher)
+browser_supervisor.start()
+browser_supervisor.install_signal_handler()
+start_warmup(driver_pool)
 
 @app.route('/api/webhook', methods=['POST'])
 def webhook():
     if request.method == "POST":
         update = telegram.Update.de_json(request.get_json(force=True), bot)
-        setup_bot(update)
+        dispatcher.process_update(update)
         return Response('ok', status=200)
     return Response('error', status=400)
 
@@ -22,6 +31,16 @@ def set_webhook():
         return Response('Webhook setup ok', status=200)
     return Response('Webhook setup failed', status=400)
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    payload, content_type = render_metrics()
+    return Response(payload, status=200, content_type=content_type)
+
+@app.route('/healthz', methods=['GET'])
+def healthz():
+    status, payload = render_health(readiness.status)
+    return Response(payload, status=status, content_type='application/json')
+
 @app.route('/')
 def home():
     return 'Bot is running!' 
\ No newline at end of file
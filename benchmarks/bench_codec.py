@@ -0,0 +1,120 @@
+# bench_codec.py
+# Benchmark ukuran payload dan waktu encode/decode: codec biner vs pickle vs JSON dict mentah,
+# untuk hasil profil, hasil deep search, dan halaman yang sudah di-render
+#
+# Jalankan: python benchmarks/bench_codec.py [iterations]
+import json
+import os
+import pickle
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import codec  # noqa: E402
+from models import PROFILE_FIELDS, ProfileResult, SearchResult  # noqa: E402
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup  # noqa: E402
+
+BIO = (
+    "Software engineer di Jakarta. Suka open source, fotografi, dan kopi. "
+    "Kontributor beberapa proyek Python dan pembicara di meetup lokal. "
+) * 3
+
+
+def sample_profile(n):
+    return ProfileResult(
+        username=f"johndoe{n}",
+        name=f"John Doe {n}",
+        bio=BIO,
+        url=f"https://www.instagram.com/johndoe{n}",
+        status='public',
+        followers=12345 + n,
+        following=321,
+        posts=87,
+        verified=n % 2 == 0,
+        extra={'category': 'Personal Account', 'is_private': False}
+    )
+
+
+def sample_search():
+    return SearchResult(
+        'Instagram',
+        found=True,
+        profile=sample_profile(0),
+        possible_matches=[ProfileResult(username=f"john.doe{n}", url=f"https://github.com/john.doe{n}") for n in range(3)],
+        metadata={'github': {'dns_info': {'records': ['140.82.112.3', '140.82.112.4']}}}
+    )
+
+
+def sample_deep():
+    return {
+        'found': True,
+        'data': {
+            'social_media': {platform: sample_profile(n) for n, platform in enumerate(['twitter', 'instagram', 'github'])},
+            'possible_matches': [ProfileResult(username=f"johndoe_{n}", url=f"https://twitter.com/johndoe_{n}") for n in range(5)],
+            'metadata': {
+                platform: {'google_mentions': [{'title': f"John Doe {platform} {n}", 'url': f"https://example.com/{n}", 'snippet': BIO} for n in range(3)]}
+                for platform in ['twitter', 'instagram', 'github']
+            }
+        },
+        'error': None
+    }
+
+
+def sample_pages():
+    keyboard = InlineKeyboardMarkup([
+        [InlineKeyboardButton("◀️", callback_data='page:AbCdEfGh:0'), InlineKeyboardButton("▶️", callback_data='page:AbCdEfGh:2')],
+        [InlineKeyboardButton("🔄 Refresh", callback_data='refresh:AbCdEfGh')],
+        [InlineKeyboardButton("🏠 Menu Utama", callback_data='menu')]
+    ])
+    return [(f"🔎 *HASIL DEEP SEARCH:* `johndoe`\n\n{BIO * 4}\n📄 Halaman {n}/3", keyboard) for n in range(1, 4)]
+
+
+def as_dict(value):
+    """Bentuk dict mentah (pra-model) untuk pembanding JSON"""
+    if isinstance(value, ProfileResult):
+        data = {field: getattr(value, field) for field in PROFILE_FIELDS if getattr(value, field) is not None}
+        data.update(value.extra or {})
+        return data
+    if isinstance(value, SearchResult):
+        data = as_dict(value.profile)
+        data['possible_matches'] = [as_dict(match) for match in value.possible_matches]
+        data['metadata'] = value.metadata
+        return {'found': value.found, 'data': data, 'error': value.error}
+    if isinstance(value, InlineKeyboardMarkup):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: as_dict(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [as_dict(item) for item in value]
+    return value
+
+
+def timed(func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def bench(label, value, iterations):
+    raw = as_dict(value)
+    formats = [
+        ('codec', lambda: codec.dumps(value), codec.loads),
+        ('pickle', lambda: pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+        ('json dict', lambda: json.dumps(raw, ensure_ascii=False).encode('utf-8'), json.loads)
+    ]
+    print(label)
+    for name, dump, load in formats:
+        payload = dump()
+        encode_us = timed(dump, iterations)
+        decode_us = timed(lambda: load(payload), iterations)
+        print(f"  {name:<10} size={len(payload):>6}B encode={encode_us:8.1f}us decode={decode_us:8.1f}us")
+
+
+if __name__ == '__main__':
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"iterations={iterations}\n")
+    bench('profile (SearchResult)', sample_search(), iterations)
+    bench('deep search (dict + ProfileResult)', sample_deep(), iterations)
+    bench('rendered pages (3 halaman)', sample_pages(), iterations)
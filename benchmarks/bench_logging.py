@@ -0,0 +1,121 @@
+# bench_logging.py
+# Benchmark overhead logging di thread request: handler langsung vs queue handler,
+# dengan sink yang sengaja lambat (simulasi stdout/disk stall)
+#
+# Jalankan: python benchmarks/bench_logging.py [threads] [calls_per_thread] [stall_ms]
+import io
+import logging
+import os
+import queue
+import statistics
+import sys
+import threading
+import time
+from logging.handlers import QueueListener
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logging_setup import NonBlockingQueueHandler, SamplingFilter, TEXT_FORMAT  # noqa: E402
+
+
+class SlowStream(io.StringIO):
+    """Stream yang setiap write-nya ditahan beberapa milidetik"""
+
+    def __init__(self, stall):
+        super().__init__()
+        self.stall = stall
+
+    def write(self, text):
+        time.sleep(self.stall)
+        return len(text)
+
+
+def run_load(logger, threads, calls):
+    """Jalankan load: setiap thread log `calls` kali, kembalikan latency per call (detik)"""
+    latencies = []
+    lock = threading.Lock()
+
+    def worker(worker_id):
+        local = []
+        for i in range(calls):
+            start = time.perf_counter()
+            logger.error("Error in %s request: %s", 'Instagram', f"selector {i % 7} not found")
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    started = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return latencies, time.perf_counter() - started
+
+
+def report(label, latencies, elapsed):
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{label:<28} calls={len(latencies):<6} total={elapsed:7.3f}s "
+        f"p50={statistics.median(latencies) * 1e6:9.1f}us p99={p99 * 1e6:9.1f}us"
+    )
+
+
+def bench_direct(threads, calls, stall):
+    logger = logging.getLogger('bench.direct')
+    logger.propagate = False
+    handler = logging.StreamHandler(SlowStream(stall))
+    handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+    logger.addHandler(handler)
+    report('direct StreamHandler', *run_load(logger, threads, calls))
+
+
+def bench_queue(threads, calls, stall, sampling):
+    logger = logging.getLogger(f'bench.queue.{sampling}')
+    logger.propagate = False
+    stream_handler = logging.StreamHandler(SlowStream(stall))
+    stream_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+    log_queue = queue.Queue(maxsize=10000)
+    handler = NonBlockingQueueHandler(log_queue)
+    if sampling:
+        handler.addFilter(SamplingFilter(burst=20, window=60))
+    logger.addHandler(handler)
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    label = 'queue + sampling' if sampling else 'queue handler'
+    report(label, *run_load(logger, threads, calls))
+    listener.stop()
+    print(f"{'':<28} dropped={handler.dropped}")
+
+
+def bench_filtered_level(calls):
+    """Bandingkan f-string vs argumen lazy saat level DEBUG difilter"""
+    logger = logging.getLogger('bench.level')
+    logger.setLevel(logging.INFO)
+    payload = {'username': 'johndoe', 'platform': 'Instagram', 'data': list(range(20))}
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        logger.debug(f"Result: {payload}")
+    eager = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        logger.debug("Result: %s", payload)
+    lazy = time.perf_counter() - start
+
+    print(f"{'filtered debug f-string':<28} {eager / calls * 1e9:9.1f}ns/call")
+    print(f"{'filtered debug lazy args':<28} {lazy / calls * 1e9:9.1f}ns/call")
+
+
+if __name__ == '__main__':
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    calls = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    stall = (float(sys.argv[3]) if len(sys.argv) > 3 else 1.0) / 1000
+
+    print(f"threads={threads} calls/thread={calls} sink stall={stall * 1000:.1f}ms\n")
+    bench_direct(threads, calls, stall)
+    bench_queue(threads, calls, stall, sampling=False)
+    bench_queue(threads, calls, stall, sampling=True)
+    bench_filtered_level(100000)
@@ -0,0 +1,112 @@
+# bench_tabs.py
+# Benchmark RSS dan throughput pencarian Selenium bersamaan: satu proses Chrome per pencarian
+# (DriverPool) vs beberapa tab ber-context sendiri per proses Chrome (TabPool).
+# Butuh Chrome + chromedriver; halaman uji di-serve HTTP lokal biar tidak tergantung jaringan
+# (data: URL tidak bisa dipakai: Chrome menolak navigasi top-frame ke data: dari script).
+#
+# Jalankan: python benchmarks/bench_tabs.py [concurrent] [lookups]
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium.webdriver.common.by import By  # noqa: E402
+
+from browser_supervisor import _process_tree  # noqa: E402
+from driver_pool import DriverPool  # noqa: E402
+from osint_bot import setup_driver  # noqa: E402
+from tab_pool import TabPool  # noqa: E402
+
+# Kira-kira seberat halaman profil: banyak elemen + sedikit JS
+PAGE = (
+    "<html><head><title>bench</title></head><body>"
+    + "".join(f"<div class='post'><img alt='p{n}'><span>caption {n} " + "lorem ipsum " * 20 + "</span></div>" for n in range(300))
+    + "<h2 id='name'>John Doe</h2><script>document.body.dataset.ready = '1';</script></body></html>"
+).encode('utf-8')
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve():
+    """Server halaman uji di port acak, return URL-nya"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}/profile"
+
+
+def tree_rss(pool):
+    """Total RSS semua proses chromedriver + Chrome milik pool"""
+    total = 0
+    for driver in pool.drivers():
+        for process in _process_tree(driver.service.process.pid):
+            try:
+                total += process.memory_info().rss
+            except Exception:
+                pass
+    return total
+
+
+def lookup(pool, url):
+    with pool.driver() as driver:
+        driver.get(url)
+        driver.find_element(By.ID, 'name').text
+        len(driver.find_elements(By.CSS_SELECTOR, 'div.post'))
+
+
+def bench(label, pool, url, concurrent, lookups):
+    peak = 0
+    done = threading.Event()
+
+    def sample():
+        nonlocal peak
+        while not done.is_set():
+            peak = max(peak, tree_rss(pool))
+            time.sleep(0.2)
+
+    pool.prewarm()
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrent) as executor:
+        list(executor.map(lambda _: lookup(pool, url), range(lookups)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    sampler.join()
+    processes = sum(len(_process_tree(driver.service.process.pid)) for driver in pool.drivers())
+    print(
+        f"  {label:<10} chrome={pool.size:>2} processes={processes:>3} peak_rss={peak / 2**20:8.1f}MB "
+        f"per_lookup={peak / 2**20 / concurrent:6.1f}MB throughput={lookups / elapsed:5.2f}/s"
+    )
+    pool.drain(30)
+
+
+if __name__ == '__main__':
+    concurrent = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else concurrent * 4
+    tabs_per_browser = 4
+    url = serve()
+    print(f"concurrent={concurrent} lookups={lookups}\n")
+    bench('drivers', DriverPool(setup_driver, max_size=concurrent), url, concurrent, lookups)
+    bench(
+        'tabs',
+        TabPool(
+            lambda: setup_driver(page_load_strategy='none'),
+            max_browsers=-(-concurrent // tabs_per_browser),
+            tabs_per_browser=tabs_per_browser
+        ),
+        url, concurrent, lookups
+    )
@@ -0,0 +1,57 @@
+# check_codec_compat.py
+# Cek kompatibilitas layout compact: payload dari versi yang field ProfileResult-nya
+# lebih sedikit (lama) atau lebih banyak (baru, field ditambah di belakang) harus tetap
+# terbaca dengan `extra` dan field yang sama-sama dikenal tidak bergeser
+#
+# Jalankan: python benchmarks/check_codec_compat.py
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import codec  # noqa: E402
+from models import PROFILE_FIELDS, ProfileResult, SearchResult  # noqa: E402
+
+
+def sample_profile():
+    values = {field: f"{field}-value" for field in PROFILE_FIELDS}
+    return ProfileResult(**values, extra={'category': 'Personal Account'})
+
+
+def encode_profile_list(values):
+    """Payload codec berisi ProfileResult dengan list compact apa adanya (meniru versi lain)"""
+    encoder = codec.Encoder()
+    parts = []
+    encoder._ext(codec.EXT_PROFILE, encoder._nested(values), parts)
+    return codec.MAGIC + bytes((codec.WIRE_VERSION, 0)) + b''.join(parts)
+
+
+def check(label, decoded, expected_fields, expected_extra):
+    for field in PROFILE_FIELDS:
+        expected = expected_fields.get(field)
+        actual = getattr(decoded, field)
+        assert actual == expected, f"{label}: {field}={actual!r}, harusnya {expected!r}"
+    assert decoded.extra == expected_extra, f"{label}: extra={decoded.extra!r}"
+    print(f"  ok  {label}")
+
+
+if __name__ == '__main__':
+    profile = sample_profile()
+    known = {field: getattr(profile, field) for field in PROFILE_FIELDS}
+
+    # Versi baru: satu field ditambah di belakang, versi ini harus mengabaikannya
+    newer = profile.to_compact() + ['nilai-field-baru']
+    check('payload versi baru (field ekstra di ekor)', codec.loads(encode_profile_list(newer)), known, profile.extra)
+
+    # Versi lama: field terakhir belum ada, sisanya harus None dan extra tetap utuh
+    older = profile.to_compact()[:-1]
+    expected = dict(known, **{PROFILE_FIELDS[-1]: None})
+    check('payload versi lama (field terakhir belum ada)', codec.loads(encode_profile_list(older)), expected, profile.extra)
+
+    # Round-trip biasa, termasuk di dalam SearchResult
+    result = SearchResult('Instagram', found=True, profile=profile, possible_matches=[ProfileResult(username='x')])
+    decoded = codec.loads(codec.dumps(result))
+    check('round-trip SearchResult', decoded.profile, known, profile.extra)
+    assert decoded.possible_matches[0].username == 'x' and decoded.possible_matches[0].extra is None
+    check('round-trip profil kosong', codec.loads(codec.dumps(ProfileResult())), {}, None)
+    print("semua cek lolos")
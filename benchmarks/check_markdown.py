@@ -0,0 +1,111 @@
+# check_markdown.py
+# Cek halaman hasil /cari dan /nama valid sebagai MarkdownV2: tidak ada karakter reserved
+# tanpa escape dan semua entity (*bold*, _italic_, `code`, ...) tertutup. Telegram menolak
+# pesan seperti itu dengan "can't parse entities", jadi hasilnya tidak pernah tampil.
+#
+# Jalankan: python benchmarks/check_markdown.py
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import ProfileResult  # noqa: E402
+from osint_bot import paginate_blocks, render_result_pages  # noqa: E402
+
+RESERVED = set('_*[]()~`>#+-=|{}.!')
+MARKS = ('||', '*', '_', '~', '`')
+
+
+def markdown_problems(text):
+    """Daftar masalah MarkdownV2 di `text`; kosong kalau aman dikirim"""
+    problems = []
+    opened = []
+    index = 0
+    while index < len(text):
+        char = text[index]
+        if char == '\\':
+            if index + 1 >= len(text):
+                problems.append("backslash di akhir teks")
+            index += 2
+            continue
+        if opened and opened[-1] == '`':
+            # Di dalam code cuma ` dan \ yang berarti
+            if char == '`':
+                opened.pop()
+            index += 1
+            continue
+        mark = next((mark for mark in MARKS if text.startswith(mark, index)), None)
+        if mark:
+            if opened and opened[-1] == mark:
+                opened.pop()
+            elif mark in opened:
+                problems.append(f"entity {mark!r} bersilangan di posisi {index}")
+            else:
+                opened.append(mark)
+            index += len(mark)
+            continue
+        if char in RESERVED:
+            problems.append(f"{char!r} tanpa escape di posisi {index}: {text[max(index - 15, 0):index + 15]!r}")
+        index += 1
+    problems.extend(f"entity {mark!r} tidak ditutup" for mark in opened)
+    return problems
+
+
+def sample_profile(platform):
+    return ProfileResult(
+        username='john.doe_99', name='John (JD) Doe!', url=f'https://{platform.lower()}.com/john.doe_99',
+        bio='Dev | coffee + code. Tags: #python [beta] ~ a-b=c {x}! ' * 3,
+        location='St. Louis', work='ACME-Corp.', education='U.N.I.', followers='1.2K', friends=None, posts=42
+    )
+
+
+def check(label, entry):
+    pages = render_result_pages(entry)
+    for number, page in enumerate(pages, start=1):
+        problems = markdown_problems(page)
+        assert not problems, f"{label} halaman {number}: " + "; ".join(problems)
+    print(f"  ok  {label} ({len(pages)} halaman)")
+
+
+if __name__ == '__main__':
+    deep = {
+        'found': True,
+        'data': {
+            'social_media': {'Twitter': sample_profile('Twitter'), 'GitHub': sample_profile('GitHub')},
+            'possible_matches': [ProfileResult(username='john.doe_1', url='https://github.com/john.doe_1')],
+            'archived_data': {'Twitter': {'wayback_snapshots': [{'url': 'https://web.archive.org/web/2024/x.com/john.doe_99'}]}},
+            'metadata': {
+                'Twitter': {
+                    'google_mentions': [{'title': 'John (JD) Doe - Profile | X.com'}],
+                    'dns_info': {'records': ['104.244.42.1']},
+                    'whois_info': {'registrar': 'Example, Inc.'}
+                }
+            }
+        }
+    }
+    check('deep search', {'kind': 'deep', 'query': 'john.doe_99', 'results': deep})
+    check('deep search kosong', {'kind': 'deep', 'query': 'x', 'results': {'found': False, 'error': 'Timeout (30s).'}})
+
+    name = {
+        'found': True,
+        'platforms': {'Facebook': [sample_profile('Facebook')], 'LinkedIn': [sample_profile('LinkedIn')]},
+        'possible_matches': [{'name': 'J. Doe', 'platform': 'Twitter'}, {'name': 'John-Doe'}],
+        'metadata': {'sumber_data': 'google.com', 'total.platform': {'facebook.com': 1, 'linkedin.com': '2+'}}
+    }
+    check('pencarian nama', {'kind': 'name', 'query': 'John Doe', 'results': name})
+
+    # Banyak platform sekaligus biar hasilnya terpecah ke beberapa halaman
+    many = dict(name, platforms={f'Platform{n}': [sample_profile(f'p{n}')] * 3 for n in range(12)})
+    check('pencarian nama berhalaman', {'kind': 'name', 'query': 'John Doe', 'results': many})
+
+    # Satu baris lebih panjang dari halaman: dipotong di setiap posisi, termasuk di tengah
+    # escape, di dalam *bold*, `code` dan entity bersarang
+    line = "• " + "*ab\\.c\\_ tebal* `x\\`y.z` _it *bo\\(ld* x_ ~st~ " * 6 + "\n"
+    assert not markdown_problems(line), markdown_problems(line)
+    for max_chars in range(50, len(line) + 45):
+        for page in paginate_blocks("", [line, "ok\n"], max_chars=max_chars):
+            problems = markdown_problems(page)
+            assert not problems, f"baris panjang max_chars={max_chars}: " + "; ".join(problems)
+            assert len(page) <= max_chars, f"baris panjang max_chars={max_chars}: {len(page)} karakter"
+    print("  ok  baris panjang dipotong di semua posisi")
+    print("semua cek lolos")
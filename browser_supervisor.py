@@ -0,0 +1,187 @@
+# browser_supervisor.py
+# Supervisor proses Chrome: catat PID chromedriver + Chrome yang di-spawn bot,
+# bunuh yang yatim, recycle driver yang RSS-nya kebesaran, dan drain saat SIGTERM
+import json
+import logging
+import os
+import signal
+import threading
+
+import psutil
+
+import config
+from metrics import BROWSER_DRIVERS, BROWSER_PROCESSES, BROWSER_REAPED, BROWSER_RSS_BYTES
+
+logger = logging.getLogger(__name__)
+
+
+def _process_tree(pid):
+    """Proses chromedriver beserta semua child-nya (Chrome, renderer, GPU, ...)"""
+    try:
+        root = psutil.Process(pid)
+        return [root] + root.children(recursive=True)
+    except psutil.Error:
+        return []
+
+
+def _kill(processes):
+    for process in processes:
+        try:
+            process.kill()
+        except psutil.Error:
+            pass
+    psutil.wait_procs(processes, timeout=5)
+
+
+class BrowserSupervisor:
+    """Pantau proses browser milik pool driver, simpan PID-nya ke file biar bisa dibersihkan setelah crash"""
+
+    def __init__(self, pool, pid_file=None):
+        self.pool = pool
+        self.pid_file = pid_file or config.BROWSER_SUPERVISOR['pid_file']
+        self._tracked = {}  # pid -> create_time, untuk semua proses yang pernah kita spawn
+        self._owners = {}  # id(driver) -> pid chromedriver
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        pool.on_launch = self.track
+        pool.on_discard = self.untrack
+
+    @staticmethod
+    def _driver_pid(driver):
+        try:
+            return driver.service.process.pid
+        except AttributeError:
+            return None
+
+    def _save(self):
+        tmp_path = f"{self.pid_file}.tmp"
+        with open(tmp_path, 'w') as handle:
+            json.dump({str(pid): created for pid, created in self._tracked.items()}, handle)
+        os.replace(tmp_path, self.pid_file)
+
+    def _refresh(self, pid):
+        # Chrome bisa spawn renderer baru kapan saja, jadi tree-nya dicatat ulang
+        for process in _process_tree(pid):
+            try:
+                self._tracked[process.pid] = process.create_time()
+            except psutil.Error:
+                pass
+
+    def track(self, driver):
+        """Catat proses chromedriver dan Chrome milik driver yang baru di-launch"""
+        pid = self._driver_pid(driver)
+        if pid is None:
+            return
+        with self._lock:
+            self._owners[id(driver)] = pid
+            self._refresh(pid)
+            self._save()
+
+    def untrack(self, driver):
+        """Driver sudah di-quit: pastikan tidak ada proses yang tertinggal"""
+        with self._lock:
+            pid = self._owners.pop(id(driver), None)
+        if pid is not None:
+            leftovers = _process_tree(pid)
+            if leftovers:
+                BROWSER_REAPED.labels('quit_leftover').inc(len(leftovers))
+                _kill(leftovers)
+        self.reap_orphans()
+
+    def reap_orphans(self):
+        """Bunuh proses tercatat yang tidak lagi dimiliki driver hidup mana pun"""
+        with self._lock:
+            owned = set()
+            for pid in self._owners.values():
+                owned.update(process.pid for process in _process_tree(pid))
+            orphans = []
+            for pid, created in list(self._tracked.items()):
+                if pid in owned:
+                    continue
+                del self._tracked[pid]
+                try:
+                    process = psutil.Process(pid)
+                    # Cocokkan create_time biar tidak membunuh PID yang sudah dipakai ulang
+                    if abs(process.create_time() - created) < 1:
+                        orphans.append(process)
+                except psutil.Error:
+                    pass
+            self._save()
+        if orphans:
+            logger.warning("Killing %s orphaned browser processes", len(orphans))
+            BROWSER_REAPED.labels('orphan').inc(len(orphans))
+            _kill(orphans)
+        return len(orphans)
+
+    def check_memory(self):
+        """Update metrics proses browser dan recycle driver yang RSS-nya melewati batas"""
+        limit = config.BROWSER_SUPERVISOR['max_rss_mb'] * 1024 * 1024
+        total_processes = total_rss = 0
+        for driver in self.pool.drivers():
+            pid = self._driver_pid(driver)
+            if pid is None:
+                continue
+            with self._lock:
+                self._refresh(pid)
+            rss = 0
+            processes = _process_tree(pid)
+            for process in processes:
+                try:
+                    rss += process.memory_info().rss
+                except psutil.Error:
+                    pass
+            total_processes += len(processes)
+            total_rss += rss
+            if rss > limit:
+                logger.warning("Recycling driver %s using %.0f MB", pid, rss / 1024 / 1024)
+                BROWSER_REAPED.labels('rss').inc()
+                self.pool.recycle(driver)
+        BROWSER_DRIVERS.set(self.pool.size)
+        BROWSER_PROCESSES.set(total_processes)
+        BROWSER_RSS_BYTES.set(total_rss)
+
+    def _loop(self):
+        while not self._stop.wait(config.BROWSER_SUPERVISOR['interval']):
+            try:
+                self.check_memory()
+                self.reap_orphans()
+            except Exception as e:
+                logger.error("Browser supervisor error: %s", e)
+
+    def start(self):
+        """Bersihkan sisa proses dari run sebelumnya, lalu jalankan pemantau berkala"""
+        if os.path.exists(self.pid_file):
+            try:
+                with open(self.pid_file) as handle:
+                    self._tracked = {int(pid): created for pid, created in json.load(handle).items()}
+            except (OSError, ValueError) as e:
+                logger.error("Failed to read browser PID file: %s", e)
+        self.reap_orphans()
+        thread = threading.Thread(target=self._loop, name='browser-supervisor', daemon=True)
+        thread.start()
+        return thread
+
+    def drain(self, timeout=None):
+        """Tunggu pencarian yang berjalan selesai, tutup semua driver, dan bersihkan proses"""
+        self._stop.set()
+        self.pool.drain(timeout or config.BROWSER_SUPERVISOR['drain_timeout'])
+        self.reap_orphans()
+        BROWSER_DRIVERS.set(0)
+
+    def install_signal_handler(self):
+        """Drain saat SIGTERM, lalu lanjutkan ke handler sebelumnya (mode webhook)"""
+        previous = signal.getsignal(signal.SIGTERM)
+
+        def handle(signum, frame):
+            logger.info("SIGTERM received, draining browser pool")
+            self.drain()
+            if callable(previous):
+                previous(signum, frame)
+            else:
+                raise SystemExit(0)
+
+        try:
+            signal.signal(signal.SIGTERM, handle)
+        except ValueError:
+            # Bukan main thread (misal di-import worker server), lewati
+            logger.warning("Cannot install SIGTERM handler outside the main thread")
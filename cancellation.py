@@ -0,0 +1,124 @@
+# cancellation.py
+# Token pembatalan pencarian: dicek di setiap batas stage, dan bisa memutus
+# request HTTP / page load yang sedang menggantung lewat callback
+import contextvars
+import secrets
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextlib import contextmanager
+
+import config
+
+# Token milik pencarian yang sedang jalan di context ini (ikut ter-copy ke thread pool)
+_current_token = contextvars.ContextVar('cancel_token', default=None)
+
+
+class Cancelled(BaseException):
+    """
+    Pencarian dibatalkan user. Turunan BaseException (seperti asyncio.CancelledError)
+    biar tidak tertelan `except Exception` di scraper dan langsung naik ke handler.
+    """
+
+
+class CancelToken:
+    """Flag pembatalan satu pencarian, plus callback untuk memutus kerja yang sedang menggantung"""
+
+    def __init__(self, owner=None):
+        self.owner = owner
+        self._cancelled = Future()
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.done()
+
+    def cancel(self):
+        with self._lock:
+            if self._cancelled.done():
+                return
+            self._cancelled.set_result(True)
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def check(self):
+        """Raise Cancelled kalau token sudah dibatalkan"""
+        if self._cancelled.done():
+            raise Cancelled()
+
+    def on_cancel(self, callback):
+        """Daftarkan callback yang dipanggil saat cancel (langsung kalau sudah), return fungsi unregister"""
+        with self._lock:
+            if not self._cancelled.done():
+                self._callbacks.append(callback)
+                return lambda: self._discard(callback)
+        callback()
+        return lambda: None
+
+    def _discard(self, callback):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def wait(self, future):
+        """Tunggu future, atau raise Cancelled begitu token dibatalkan (future dibiarkan selesai sendiri)"""
+        done, _ = wait([future, self._cancelled], return_when=FIRST_COMPLETED)
+        if future in done:
+            return future.result()
+        raise Cancelled()
+
+
+class CancelRegistry:
+    """Token yang sedang aktif, dengan ID pendek untuk callback_data tombol Cancel"""
+
+    def __init__(self):
+        self._tokens = {}
+        self._lock = threading.Lock()
+
+    def create(self, owner=None):
+        """Buat token baru, return (token_id, token)"""
+        token = CancelToken(owner)
+        with self._lock:
+            token_id = secrets.token_urlsafe(config.RESULT_STORE['id_bytes'])
+            while token_id in self._tokens:
+                token_id = secrets.token_urlsafe(config.RESULT_STORE['id_bytes'])
+            self._tokens[token_id] = token
+        return token_id, token
+
+    def cancel(self, token_id, user_id=None):
+        """Batalkan token; cuma pemilik pencarian yang boleh. Return True kalau berhasil"""
+        with self._lock:
+            token = self._tokens.get(token_id)
+        if token is None or (token.owner is not None and user_id != token.owner):
+            return False
+        token.cancel()
+        return True
+
+    def discard(self, token_id):
+        with self._lock:
+            self._tokens.pop(token_id, None)
+
+
+cancel_registry = CancelRegistry()
+
+
+def current_token():
+    return _current_token.get()
+
+
+def check():
+    """Raise Cancelled kalau pencarian di context ini sudah dibatalkan"""
+    token = _current_token.get()
+    if token is not None:
+        token.check()
+
+
+@contextmanager
+def use(token):
+    """Jalankan blok dengan token ini sebagai token aktif"""
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
@@ -0,0 +1,125 @@
+# circuit_breaker.py
+# Circuit breaker per platform: setelah beberapa kegagalan berturut-turut,
+# pencarian ke platform itu langsung ditolak sampai probe background bilang sehat lagi
+import logging
+import threading
+import time
+
+import config
+from metrics import CIRCUIT_OPEN
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """State breaker untuk satu platform (closed / open)"""
+    __slots__ = ('platform', 'failures', 'opened_at', 'trial_at', 'lock')
+
+    def __init__(self, platform):
+        self.platform = platform
+        self.failures = 0
+        self.opened_at = None  # None = closed
+        self.trial_at = None
+        self.lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        return self.opened_at is not None
+
+    def allow(self):
+        """Boleh request? Saat open, cuma satu request percobaan per reset_timeout"""
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self.trial_at >= config.CIRCUIT_BREAKER['reset_timeout']:
+                self.trial_at = now
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            was_open = self.opened_at is not None
+            self.failures = 0
+            self.opened_at = self.trial_at = None
+        if was_open:
+            CIRCUIT_OPEN.labels(self.platform).set(0)
+            logger.warning("Circuit closed for %s", self.platform)
+
+    def record_failure(self):
+        """Catat kegagalan; return True kalau breaker baru saja terbuka"""
+        with self.lock:
+            self.failures += 1
+            if self.opened_at is not None or self.failures < config.CIRCUIT_BREAKER['failure_threshold']:
+                return False
+            self.opened_at = self.trial_at = time.monotonic()
+        CIRCUIT_OPEN.labels(self.platform).set(1)
+        logger.warning("Circuit opened for %s after %s consecutive failures", self.platform, self.failures)
+        return True
+
+
+class CircuitBreakers:
+    """Kumpulan breaker per platform, plus thread probe yang menutup breaker yang pulih"""
+
+    def __init__(self, probe):
+        self.probe = probe  # fungsi(platform) -> bool, True kalau platform sehat
+        self._breakers = {}
+        self._lock = threading.Lock()
+        self._probe_thread = None
+
+    def get(self, platform):
+        key = platform.lower()
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(key, CircuitBreaker(key))
+        return breaker
+
+    def allow(self, platform):
+        if not config.CIRCUIT_BREAKER['enabled']:
+            return True
+        return self.get(platform).allow()
+
+    def is_open(self, platform):
+        """Cek read-only: tidak memakai jatah request percobaan seperti allow()"""
+        if not config.CIRCUIT_BREAKER['enabled']:
+            return False
+        return self.get(platform).is_open
+
+    def record_success(self, platform):
+        self.get(platform).record_success()
+
+    def record_failure(self, platform):
+        if self.get(platform).record_failure():
+            self._ensure_probe()
+
+    def open_platforms(self):
+        return [breaker.platform for breaker in list(self._breakers.values()) if breaker.is_open]
+
+    def _ensure_probe(self):
+        # Thread probe cuma jalan selama ada breaker yang terbuka
+        with self._lock:
+            if self._probe_thread and self._probe_thread.is_alive():
+                return
+            self._probe_thread = threading.Thread(target=self._probe_loop, name='circuit-probe', daemon=True)
+            self._probe_thread.start()
+
+    def _probe_loop(self):
+        while True:
+            time.sleep(config.CIRCUIT_BREAKER['probe_interval'])
+            platforms = self.open_platforms()
+            if not platforms:
+                with self._lock:
+                    self._probe_thread = None
+                # Breaker bisa saja terbuka lagi di antara cek dan reset di atas
+                if self.open_platforms():
+                    self._ensure_probe()
+                return
+            for platform in platforms:
+                try:
+                    healthy = self.probe(platform)
+                except Exception as e:
+                    logger.error("Circuit probe error for %s: %s", platform, e)
+                    healthy = False
+                if healthy:
+                    self.record_success(platform)
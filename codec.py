@@ -0,0 +1,253 @@
+# codec.py
+# Encoding biner ringkas (subset msgpack) untuk hasil pencarian dan halaman yang di-render.
+# Record model disimpan posisional (lihat models.py), body besar dikompres zlib.
+#
+# Format payload: MAGIC + versi wire (1 byte) + flags (1 byte) + satu value msgpack.
+# Body dikompres sekaligus (bukan per string) biar bio/snippet yang berulang
+# antar profil ikut terkompres.
+# Ext type yang dipakai:
+#   1 -> ProfileResult (payload = list compact [extra, field...], lihat models.py)
+#   2 -> SearchResult (payload = list compact)
+#   3 -> InlineKeyboardMarkup (payload = baris [[text, callback_data], ...])
+import struct
+import zlib
+from collections import namedtuple
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+import config
+from models import ProfileResult, SearchResult
+
+MAGIC = b'OB'
+# Naik hanya kalau layout wire berubah; field baru di record cukup ditambah di belakang.
+# Versi 1 menaruh `extra` ProfileResult di ekor list; payload-nya cuma pernah ada di memori
+# result store, jadi tidak dibaca lagi
+WIRE_VERSION = 2
+MIN_WIRE_VERSION = 2
+
+FLAG_ZLIB = 0x01
+
+EXT_PROFILE = 1
+EXT_SEARCH = 2
+EXT_KEYBOARD = 3
+
+# Ext dari versi yang lebih baru dibiarkan utuh biar bisa ditulis ulang tanpa hilang
+UnknownExt = namedtuple('UnknownExt', 'code data')
+
+_pack_float = struct.Struct('>d').pack
+_unpack_float = struct.Struct('>d').unpack_from
+
+
+class CodecError(ValueError):
+    """Payload bukan format ini, versinya lebih baru, atau terpotong"""
+
+
+def _header(prefix_small, code8, code16, code32, size, small_limit):
+    if size < small_limit:
+        return bytes((prefix_small | size,))
+    if code8 is not None and size < 0x100:
+        return bytes((code8, size))
+    if size < 0x10000:
+        return bytes((code16,)) + struct.pack('>H', size)
+    return bytes((code32,)) + struct.pack('>I', size)
+
+
+class Encoder:
+    """Encoder msgpack; body di atas `compress_threshold` byte dikompres kalau memang jadi lebih kecil"""
+
+    def __init__(self, compress_threshold=None, compress_level=None):
+        self.compress_threshold = compress_threshold or config.CODEC['compress_threshold']
+        self.compress_level = compress_level or config.CODEC['compress_level']
+
+    def encode(self, value):
+        body = self._nested(value)
+        flags = 0
+        if len(body) >= self.compress_threshold:
+            packed = zlib.compress(body, self.compress_level)
+            if len(packed) < len(body):
+                body, flags = packed, FLAG_ZLIB
+        return MAGIC + bytes((WIRE_VERSION, flags)) + body
+
+    def _ext(self, code, payload, parts):
+        size = len(payload)
+        if size < 0x100:
+            parts.append(bytes((0xc7, size, code)))
+        elif size < 0x10000:
+            parts.append(b'\xc8' + struct.pack('>Hb', size, code))
+        else:
+            parts.append(b'\xc9' + struct.pack('>Ib', size, code))
+        parts.append(payload)
+
+    def _nested(self, value):
+        parts = []
+        self._encode(value, parts)
+        return b''.join(parts)
+
+    def _encode(self, value, parts):
+        if value is None:
+            parts.append(b'\xc0')
+        elif value is True:
+            parts.append(b'\xc3')
+        elif value is False:
+            parts.append(b'\xc2')
+        elif isinstance(value, int):
+            self._encode_int(value, parts)
+        elif isinstance(value, str):
+            data = value.encode('utf-8')
+            parts.append(_header(0xa0, 0xd9, 0xda, 0xdb, len(data), 32))
+            parts.append(data)
+        elif isinstance(value, float):
+            parts.append(b'\xcb' + _pack_float(value))
+        elif isinstance(value, UnknownExt):
+            # Dicek sebelum tuple karena UnknownExt juga tuple
+            self._ext(value.code, value.data, parts)
+        elif isinstance(value, (list, tuple)):
+            parts.append(_header(0x90, None, 0xdc, 0xdd, len(value), 16))
+            for item in value:
+                self._encode(item, parts)
+        elif isinstance(value, dict):
+            parts.append(_header(0x80, None, 0xde, 0xdf, len(value), 16))
+            for key, item in value.items():
+                self._encode(key, parts)
+                self._encode(item, parts)
+        elif isinstance(value, ProfileResult):
+            self._ext(EXT_PROFILE, self._nested(value.to_compact()), parts)
+        elif isinstance(value, SearchResult):
+            self._ext(EXT_SEARCH, self._nested(value.to_compact()), parts)
+        elif isinstance(value, InlineKeyboardMarkup):
+            rows = [[[button.text, button.callback_data] for button in row] for row in value.inline_keyboard]
+            self._ext(EXT_KEYBOARD, self._nested(rows), parts)
+        elif isinstance(value, (bytes, bytearray)):
+            parts.append(_header(0, 0xc4, 0xc5, 0xc6, len(value), 0))
+            parts.append(bytes(value))
+        else:
+            raise TypeError(f"Tipe {type(value).__name__} tidak bisa di-encode")
+
+    @staticmethod
+    def _encode_int(value, parts):
+        if 0 <= value < 0x80:
+            parts.append(bytes((value,)))
+        elif -32 <= value < 0:
+            parts.append(struct.pack('b', value))
+        elif 0 <= value < 0x10000:
+            parts.append(b'\xcc' + bytes((value,)) if value < 0x100 else b'\xcd' + struct.pack('>H', value))
+        elif 0 <= value < 0x100000000:
+            parts.append(b'\xce' + struct.pack('>I', value))
+        elif 0 <= value < 0x10000000000000000:
+            parts.append(b'\xcf' + struct.pack('>Q', value))
+        elif -0x8000000000000000 <= value < 0:
+            parts.append(b'\xd3' + struct.pack('>q', value))
+        else:
+            raise TypeError(f"Integer {value} di luar jangkauan 64-bit")
+
+
+class Decoder:
+    """Decoder pasangan Encoder; field record yang tidak dikenal dari versi baru diabaikan"""
+
+    def decode(self, data):
+        if data[:2] != MAGIC:
+            raise CodecError("Bukan payload codec")
+        if len(data) < 4 or not MIN_WIRE_VERSION <= data[2] <= WIRE_VERSION:
+            raise CodecError(f"Versi wire tidak didukung: {data[2] if len(data) > 2 else None}")
+        try:
+            body = zlib.decompress(data[4:]) if data[3] & FLAG_ZLIB else memoryview(data)[4:]
+            value, offset = self._decode(memoryview(body), 0)
+        except (IndexError, struct.error, zlib.error, UnicodeDecodeError) as e:
+            raise CodecError(f"Payload rusak: {e}") from e
+        if offset != len(body):
+            raise CodecError("Ada byte sisa setelah value")
+        return value
+
+    def _sequence(self, data, offset, size):
+        items = []
+        for _ in range(size):
+            item, offset = self._decode(data, offset)
+            items.append(item)
+        return items, offset
+
+    def _mapping(self, data, offset, size):
+        result = {}
+        for _ in range(size):
+            key, offset = self._decode(data, offset)
+            result[key], offset = self._decode(data, offset)
+        return result, offset
+
+    def _ext(self, code, payload):
+        if code in (EXT_PROFILE, EXT_SEARCH, EXT_KEYBOARD):
+            value, _ = self._decode(memoryview(payload), 0)
+            if code == EXT_PROFILE:
+                return ProfileResult.from_compact(value)
+            if code == EXT_SEARCH:
+                return SearchResult.from_compact(value)
+            return InlineKeyboardMarkup([
+                [InlineKeyboardButton(text, callback_data=callback_data) for text, callback_data in row]
+                for row in value
+            ])
+        return UnknownExt(code, payload)
+
+    def _decode(self, data, offset):
+        code = data[offset]
+        offset += 1
+        if code < 0x80:
+            return code, offset
+        if code >= 0xe0:
+            return code - 0x100, offset
+        if 0xa0 <= code <= 0xbf:
+            end = offset + (code & 0x1f)
+            return str(data[offset:end], 'utf-8'), end
+        if 0x90 <= code <= 0x9f:
+            return self._sequence(data, offset, code & 0x0f)
+        if 0x80 <= code <= 0x8f:
+            return self._mapping(data, offset, code & 0x0f)
+        if code == 0xc0:
+            return None, offset
+        if code == 0xc2:
+            return False, offset
+        if code == 0xc3:
+            return True, offset
+        if code in (0xd9, 0xda, 0xdb, 0xc4, 0xc5, 0xc6):
+            width = {0xd9: 1, 0xda: 2, 0xdb: 4, 0xc4: 1, 0xc5: 2, 0xc6: 4}[code]
+            size = int.from_bytes(data[offset:offset + width], 'big')
+            start = offset + width
+            chunk = data[start:start + size]
+            if len(chunk) != size:
+                raise IndexError("string terpotong")
+            return (str(chunk, 'utf-8') if code >= 0xd9 else bytes(chunk)), start + size
+        if code in (0xcc, 0xcd, 0xce, 0xcf):
+            width = 1 << (code - 0xcc)
+            return int.from_bytes(data[offset:offset + width], 'big'), offset + width
+        if code in (0xd0, 0xd1, 0xd2, 0xd3):
+            width = 1 << (code - 0xd0)
+            return int.from_bytes(data[offset:offset + width], 'big', signed=True), offset + width
+        if code == 0xcb:
+            return _unpack_float(data, offset)[0], offset + 8
+        if code in (0xdc, 0xdd, 0xde, 0xdf):
+            width = 2 if code in (0xdc, 0xde) else 4
+            size = int.from_bytes(data[offset:offset + width], 'big')
+            if code in (0xdc, 0xdd):
+                return self._sequence(data, offset + width, size)
+            return self._mapping(data, offset + width, size)
+        if code in (0xc7, 0xc8, 0xc9):
+            width = {0xc7: 1, 0xc8: 2, 0xc9: 4}[code]
+            size = int.from_bytes(data[offset:offset + width], 'big')
+            ext_code = struct.unpack_from('b', data, offset + width)[0]
+            start = offset + width + 1
+            payload = bytes(data[start:start + size])
+            if len(payload) != size:
+                raise IndexError("ext terpotong")
+            return self._ext(ext_code, payload), start + size
+        raise CodecError(f"Tipe msgpack 0x{code:02x} tidak didukung")
+
+
+_encoder = Encoder()
+_decoder = Decoder()
+
+
+def dumps(value):
+    """Encode hasil pencarian / halaman / value biasa jadi bytes"""
+    return _encoder.encode(value)
+
+
+def loads(data):
+    """Kebalikan dumps(); tuple kembali sebagai list"""
+    return _decoder.decode(data)
@@ -208,12 +208,13 @@ HEADERS = {
 }
 
 # Error messages
-ERROR_MESSAGES = {
+ERROR_MESSAGES.update({
     "API_ERROR": "Terjadi kesalahan saat mengakses API: {}",
     "RATE_LIMIT": "Rate limit tercapai untuk platform {}",
     "NO_RESULTS": "Tidak ditemukan hasil untuk username {}",
-    "INVALID_TOKEN": "API token tidak valid untuk platform {}"
-}
+    "INVALID_TOKEN": "API token tidak valid untuk platform {}",
+    "busy": "⏳ Server sedang sibuk, silakan coba lagi beberapa saat lagi."
+})
 
 # Success messages
 SUCCESS_MESSAGES = {
@@ -232,6 +233,235 @@ REQUEST_TIMEOUT = 10
 CACHE_ENABLED = True
 CACHE_DURATION = 3600  # 1 hour in seconds
 
+# Result store: hasil pencarian disimpan di server, tombol cuma bawa ID
+RESULT_STORE = {
+    'ttl': 1800,  # Masa berlaku hasil dalam detik
+    'max_entries': 1000,  # Maksimum hasil yang disimpan sekaligus
+    'id_bytes': 6,  # Panjang ID acak (6 byte = 8 karakter)
+    'compact': False  # Simpan hasil & halaman sebagai bytes codec (hemat memori, tambah CPU saat get)
+}
+
+# Pagination hasil pencarian (limit pesan Telegram 4096 karakter)
+PAGINATION = {
+    'max_page_chars': 3500,  # Panjang maksimum satu halaman
+    'footer_reserve': 40  # Ruang untuk footer nomor halaman
+}
+
+# Metrics Prometheus
+METRICS = {
+    'enabled': True,
+    'port': 9100,  # Port /metrics terpisah saat mode polling
+    'buckets': (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+}
+
+# Admin bot (Telegram user ID) yang boleh pakai command diagnosa
+ADMIN_IDS = []
+
+# Tracing per request dan log JSON
+TRACING = {
+    'json_logs': True,  # Tulis log sebagai JSON satu baris
+    'log_spans': True,  # Tulis satu baris log untuk setiap span yang selesai
+    'recent_traces': 200,  # Jumlah trace terbaru yang disimpan
+    'slowest_count': 3,  # Jumlah trace paling lambat yang ditampilkan /trace
+    'max_tree_depth': 6  # Kedalaman maksimum span tree yang ditampilkan
+}
+
+# Statistik pemakaian (HyperLogLog, memori tetap)
+ANALYTICS = {
+    'precision': 12,  # 2^12 register = 4 KB per hari, error ~1.6%
+    'window_days': 30,  # Window rolling untuk unique user bulanan
+    'persist_path': 'analytics.json',  # File penyimpanan state
+    'persist_interval': 300  # Simpan ke file tiap N detik
+}
+
+# Logging non-blocking
+LOGGING = {
+    'queue_size': 10000,  # Maksimum record yang antri; lebih dari ini dibuang
+    'sample_burst': 20,  # Maksimum log WARNING+ dengan template sama per window
+    'sample_window': 60  # Panjang window sampling dalam detik
+}
+
+# HTTP client bersama
+HTTP_CLIENT = {
+    'pool_connections': 20,  # Jumlah host yang pool-nya disimpan
+    'pool_maxsize': 20,  # Koneksi keep-alive per host
+    'per_host_limit': 8,  # Maksimum request bersamaan ke satu host
+    'adaptive_timeout': True,  # Timeout per host dari latency yang teramati
+    'latency_window': 200,  # Jumlah sampel latency terakhir per host
+    'latency_min_samples': 20,  # Sampel minimal sebelum timeout adaptif dipakai
+    'timeout_percentile': 0.99,
+    'timeout_multiplier': 1.5,  # Timeout = persentil x multiplier + margin
+    'timeout_margin': 0.5,  # Margin dalam detik
+    'min_timeout': 1.0,  # Batas bawah timeout dalam detik
+    'max_timeout': 30,  # Batas atas, juga dipakai kalau pemanggil tidak kasih timeout
+    'cancellable_workers': 32  # Thread untuk request yang bisa dibatalkan user
+}
+
+# Hedged GET untuk endpoint yang latency-nya sering melonjak (Wayback, Google)
+HEDGING = {
+    'enabled': True,
+    'percentile': 0.95,  # Kirim hedge kalau belum ada jawaban sampai persentil ini
+    'budget_ratio': 0.1,  # Maksimal ~10% request tambahan
+    'budget_burst': 5,  # Token hedge maksimum yang bisa ditabung
+    'max_workers': 16  # Ukuran thread pool hedging
+}
+
+# Resolver DNS dengan cache
+DNS = {
+    'timeout': 2,  # Timeout per nameserver dalam detik
+    'lifetime': 4,  # Batas waktu total satu lookup (dan collect paralel)
+    'max_workers': 12,  # Lookup DNS paralel
+    'max_entries': 5000,  # Jumlah entry cache maksimum
+    'min_ttl': 30,  # TTL record dijepit ke [min_ttl, max_ttl] detik
+    'max_ttl': 3600,
+    'negative_ttl': 600  # Lama NXDOMAIN / NoAnswer disimpan
+}
+
+# Query Wayback CDX
+WAYBACK = {
+    'snapshots': 4,  # Jumlah snapshot terbaru yang diambil
+    'max_bytes': 16 * 1024  # Batas byte yang dibaca dari response CDX
+}
+
+# Cache WHOIS per registrable domain
+WHOIS = {
+    'ttl': 24 * 3600,  # Lama hasil WHOIS disimpan dalam detik
+    'timeout': 10,  # Batas waktu menunggu satu lookup
+    'max_workers': 4,  # Lookup WHOIS bersamaan maksimum
+    'max_entries': 500
+}
+
+# Pool Chrome WebDriver
+DRIVER_POOL = {
+    'max_size': 4,  # Driver yang boleh dipakai bersamaan
+    'prewarm': 2,  # Driver yang di-launch saat startup
+    'acquire_timeout': 30  # Batas waktu menunggu driver kosong dalam detik
+}
+
+# Mode multi-tab: beberapa pencarian per proses Chrome, tiap tab punya browser context sendiri
+BROWSER_TABS = {
+    'enabled': False,  # False = satu proses Chrome per pencarian (DRIVER_POOL)
+    'max_browsers': 2,  # Proses Chrome maksimum
+    'tabs_per_browser': 4,  # Pencarian bersamaan per proses Chrome
+    'isolate_contexts': True,  # Cookie & storage terpisah per tab (Target.createBrowserContext)
+    'poll_interval': 0.1  # Jarak cek status loading halaman dalam detik
+}
+
+# Supervisor proses Chrome
+BROWSER_SUPERVISOR = {
+    'pid_file': 'browser_pids.json',  # Daftar PID browser, dipakai bersihkan sisa crash
+    'interval': 60,  # Jeda cek memori dan proses yatim dalam detik
+    'max_rss_mb': 1024,  # Driver dengan RSS di atas ini di-recycle
+    'drain_timeout': 30  # Lama menunggu pencarian selesai saat SIGTERM
+}
+
+# Warm start sebelum instance dianggap ready
+WARMUP = {
+    'enabled': True,
+    'timeout': 60,  # Batas waktu total warm start dalam detik
+    'connect_timeout': 5,  # Timeout buka koneksi ke satu host
+    'extra_hosts': [  # Host selain API_ENDPOINTS yang sering dipakai
+        'www.google.com',
+        'web.archive.org',
+        'www.instagram.com',
+        'twitter.com',
+        'www.facebook.com',
+        'github.com'
+    ]
+}
+
+# Circuit breaker per platform
+CIRCUIT_BREAKER = {
+    'enabled': True,
+    'failure_threshold': 5,  # Kegagalan berturut-turut sebelum breaker terbuka
+    'probe_interval': 30,  # Jeda probe kesehatan platform dalam detik
+    'reset_timeout': 300  # Saat open, izinkan satu request percobaan tiap sekian detik
+}
+
+# Cache username yang pasti tidak ada (Bloom filter per platform)
+NEGATIVE_CACHE = {
+    'enabled': True,
+    'capacity': 50000,  # Jumlah username per generasi filter per platform
+    'error_rate': 0.01,  # Peluang false positive
+    'rotate_after': 6 * 3600  # Rotasi filter dalam detik
+}
+
+# Cek variasi username paralel
+VARIATION_CHECK = {
+    'limit': 5,  # Jumlah variasi yang dicek per query
+    'first_hits': 3,  # Berhenti setelah sekian variasi ditemukan
+    'max_workers': 16,  # Ukuran thread pool cek variasi
+    'timeout': 8  # Batas waktu total cek variasi dalam detik
+}
+
+# Sampling profiler handler (opt-in, bisa dinyalakan lewat /profile tanpa redeploy)
+PROFILING = {
+    'enabled': False,
+    'sample_rate': 0.01,  # Fraksi pemanggilan handler yang selalu diprofil
+    'slow_threshold': 30,  # Profil request yang lebih lama dari ini (detik) juga disimpan, 0 = mati
+    'interval': 0.01,  # Jarak antar sampel stack dalam detik
+    'max_depth': 64,  # Kedalaman stack maksimum per sampel
+    'keep': 10,  # Jumlah profil paling lambat yang disimpan
+    'dump_dir': 'profiles'  # Folder file collapsed stack hasil dump
+}
+
+# Lane eksekusi per kelas biaya (static = menu/halaman, api = HTTP saja, browser = Selenium)
+LANES = {
+    'lanes': {
+        'static': {'workers': 4, 'max_queue': 200},
+        'api': {'workers': 8, 'max_queue': 100},
+        # Satu worker per driver / tab
+        'browser': {
+            'workers': BROWSER_TABS['max_browsers'] * BROWSER_TABS['tabs_per_browser'] if BROWSER_TABS['enabled'] else DRIVER_POOL['max_size'],
+            'max_queue': 20
+        }
+    },
+    'shutdown_timeout': 30,  # Lama menunggu handler yang sedang jalan saat SIGTERM
+    # Kelas biaya pencarian profil per platform; platform lain dianggap browser
+    'platform_cost': {
+        'GitHub': 'api',
+        'Twitter': 'browser',
+        'Instagram': 'browser',
+        'Facebook': 'browser',
+        'LinkedIn': 'browser'
+    }
+}
+
+# Codec biner untuk hasil pencarian dan halaman yang di-render
+CODEC = {
+    'compress_threshold': 256,  # Body payload sepanjang ini (byte) ke atas dikompres zlib sekaligus
+    'compress_level': 6  # Level kompresi zlib (1 = cepat, 9 = paling kecil)
+}
+
+# Antrian pesan keluar ke Telegram (send/edit) dengan batas flood per chat dan global
+OUTBOX = {
+    'enabled': True,  # False = handler memanggil Bot API langsung seperti dulu
+    'workers': 4,  # Thread pengirim; pesan dalam satu chat tetap dikirim berurutan
+    'global_rate': 30,  # Pesan per detik untuk semua chat (batas Telegram ~30/detik)
+    'global_burst': 30,
+    'chat_rate': 1,  # Pesan per detik per chat pribadi
+    'chat_burst': 3,
+    'group_rate': 20 / 60,  # Grup dibatasi Telegram 20 pesan per menit
+    'group_burst': 5,
+    'max_retries': 3,  # Percobaan ulang setelah RetryAfter
+    'max_retry_after': 60,  # RetryAfter lebih lama dari ini langsung dilempar ke handler
+    'tracked_messages': 10000,  # Isi terakhir pesan yang diingat untuk skip edit yang tidak berubah
+    'tracked_chats': 5000  # Rate bucket per chat yang disimpan; bucket yang sudah penuh lagi dibuang duluan
+}
+
+# Ambil update mode polling
+POLLING = {
+    'timeout': 30,  # Long-poll getUpdates dalam detik; makin lama makin sedikit request kosong
+    'poll_interval': 0.0,  # Jeda antar getUpdates; 0 karena long-poll sudah menunggu di server
+    'read_latency': 2.0,  # Tambahan read timeout di atas `timeout` untuk jaringan lambat
+    'bootstrap_retries': -1,  # Percobaan hapus webhook saat start (-1 = terus mencoba)
+    'allowed_updates': ['message', 'callback_query'],  # Cuma jenis update yang memang ditangani
+    'workers': 4,  # Worker dispatcher (run_async); handler sendiri jalan di LANES
+    'connect_timeout': 5.0,
+    'read_timeout': 10.0,  # Read timeout request Bot API biasa (send, edit, answer)
+    'max_pending_age': 300  # Pesan yang antri sebelum bot start dan lebih tua dari ini dibuang; None = proses semua
+}
+
 # Chrome Settings
 CHROME_SETTINGS = {
     'arguments': [
@@ -0,0 +1,108 @@
+# dns_cache.py
+# Resolver DNS dengan cache sesuai TTL record, cache negatif untuk NXDOMAIN,
+# dan lookup paralel beberapa nama / tipe record dengan batas waktu
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import dns.exception
+import dns.resolver
+
+import config
+from metrics import DNS_CACHE_TOTAL
+
+logger = logging.getLogger(__name__)
+
+NXDOMAIN = object()  # Penanda di cache: nama domainnya tidak ada sama sekali
+
+
+class CachingResolver:
+    """Bungkus dns.resolver.Resolver dengan cache TTL dan thread pool"""
+
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries or config.DNS['max_entries']
+        self._resolver = dns.resolver.Resolver()
+        self._resolver.timeout = config.DNS['timeout']
+        self._resolver.lifetime = config.DNS['lifetime']
+        self._cache = OrderedDict()  # (name, rdtype) -> (expires, records / NXDOMAIN)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.DNS['max_workers'],
+            thread_name_prefix='dns'
+        )
+
+    def _cached(self, name, rdtype):
+        now = time.monotonic()
+        with self._lock:
+            # NXDOMAIN berlaku untuk semua tipe record nama itu
+            for key in ((name, None), (name, rdtype)):
+                entry = self._cache.get(key)
+                if entry is None:
+                    continue
+                if entry[0] <= now:
+                    del self._cache[key]
+                    continue
+                return entry[1]
+        return None
+
+    def _store(self, key, records, ttl):
+        ttl = min(max(ttl, config.DNS['min_ttl']), config.DNS['max_ttl'])
+        with self._lock:
+            self._cache[key] = (time.monotonic() + ttl, records)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def resolve(self, name, rdtype='A'):
+        """
+        Resolve satu nama + tipe record. Return list string record ([] kalau
+        tidak ada), atau None kalau lookup gagal (timeout dsb, tidak di-cache).
+        """
+        name = name.lower().rstrip('.')
+        cached = self._cached(name, rdtype)
+        if cached is not None:
+            DNS_CACHE_TOTAL.labels('negative_hit' if cached is NXDOMAIN or not cached else 'hit').inc()
+            return [] if cached is NXDOMAIN else cached
+
+        DNS_CACHE_TOTAL.labels('miss').inc()
+        try:
+            answer = self._resolver.resolve(name, rdtype)
+        except dns.resolver.NXDOMAIN:
+            self._store((name, None), NXDOMAIN, config.DNS['negative_ttl'])
+            return []
+        except dns.resolver.NoAnswer:
+            self._store((name, rdtype), [], config.DNS['negative_ttl'])
+            return []
+        except dns.exception.DNSException as e:
+            logger.debug("DNS lookup failed for %s %s: %s", name, rdtype, e)
+            return None
+        records = [record.to_text() for record in answer]
+        self._store((name, rdtype), records, answer.rrset.ttl)
+        return records
+
+    def start_many(self, names, rdtypes=None):
+        """Mulai lookup paralel, return {(name, rdtype): future} untuk di-collect nanti"""
+        rdtypes = rdtypes or config.DNS_RECORD_TYPES
+        return {
+            (name, rdtype): self._executor.submit(self.resolve, name, rdtype)
+            for name in names
+            for rdtype in rdtypes
+        }
+
+    def collect(self, futures, timeout=None):
+        """Tunggu hasil start_many sampai batas waktu, return {name: {rdtype: records}}"""
+        done, _ = wait(futures.values(), timeout=timeout or config.DNS['lifetime'])
+        results = {}
+        for (name, rdtype), future in futures.items():
+            if future in done and future.result():
+                results.setdefault(name, {})[rdtype] = future.result()
+        return results
+
+    def resolve_many(self, names, rdtypes=None, timeout=None):
+        """Resolve beberapa nama dan tipe record sekaligus"""
+        return self.collect(self.start_many(names, rdtypes), timeout)
+
+
+resolver = CachingResolver()
@@ -0,0 +1,205 @@
+# driver_pool.py
+# Pool Chrome WebDriver: driver dipakai ulang antar pencarian, bukan launch-quit
+# setiap request, dan bisa di-launch duluan saat startup
+import itertools
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class DriverPoolExhausted(Exception):
+    """Semua driver sedang dipakai dan tidak ada yang kembali sampai timeout"""
+
+
+class DriverPool:
+    """Pool driver dengan batas jumlah total; driver idle disimpan LIFO biar yang hangat dipakai duluan"""
+
+    def __init__(self, factory, max_size=None):
+        self.factory = factory
+        self.max_size = max_size or config.DRIVER_POOL['max_size']
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._lock = threading.Lock()
+        self._drivers = set()  # Semua driver yang hidup (idle + dipakai)
+        self._recycle = set()  # Driver yang harus ditutup begitu tidak dipakai
+        self._leases = {}  # driver -> ID peminjaman yang sedang aktif
+        self._lease_ids = itertools.count(1)
+        self._closed = False
+        # Hook opsional (dipasang supervisor proses browser)
+        self.on_launch = None
+        self.on_discard = None
+
+    @property
+    def size(self):
+        return len(self._drivers)
+
+    @property
+    def idle(self):
+        return self._idle.qsize()
+
+    @property
+    def in_use(self):
+        return self.size - self.idle
+
+    def drivers(self):
+        """Snapshot semua driver yang hidup"""
+        with self._lock:
+            return list(self._drivers)
+
+    def _launch(self):
+        driver = self.factory()
+        with self._lock:
+            self._drivers.add(driver)
+        if self.on_launch:
+            self.on_launch(driver)
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            self._drivers.discard(driver)
+            self._recycle.discard(driver)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.error("Error closing driver: %s", e)
+        if self.on_discard:
+            self.on_discard(driver)
+
+    def recycle(self, driver):
+        """Tandai driver untuk ditutup: langsung kalau idle, atau saat dikembalikan"""
+        with self._lock:
+            if driver in self._drivers:
+                self._recycle.add(driver)
+
+    def lease(self, driver):
+        """ID peminjaman driver saat ini, dipakai abort() biar tidak salah bunuh"""
+        with self._lock:
+            return self._leases.get(driver)
+
+    def abort(self, driver, lease=None):
+        """
+        Matikan proses chromedriver milik driver yang sedang dipakai: chromedriver memproses
+        command satu per satu, jadi page load yang menggantung cuma bisa diputus begini.
+        Command yang sedang jalan langsung gagal dan driver dibuang saat dikembalikan.
+        Kalau `lease` diberikan dan driver sudah dikembalikan / dipinjam pencarian lain, diabaikan.
+        """
+        with self._lock:
+            # Dicek dan dibunuh di bawah lock yang sama dengan release(), jadi tidak ada celah
+            if driver not in self._drivers or (lease is not None and self._leases.get(driver) != lease):
+                return
+            self._recycle.add(driver)
+            try:
+                driver.service.process.kill()
+            except (AttributeError, OSError) as e:
+                logger.warning("Failed to abort driver: %s", e)
+
+    def _lend(self, driver):
+        with self._lock:
+            self._leases[driver] = next(self._lease_ids)
+        return driver
+
+    def acquire(self, timeout=None):
+        """Ambil driver idle, atau launch baru kalau pool belum penuh"""
+        timeout = timeout or config.DRIVER_POOL['acquire_timeout']
+        if self._closed:
+            raise DriverPoolExhausted("Pool driver sedang dimatikan")
+        if not self._slots.acquire(timeout=timeout):
+            raise DriverPoolExhausted(f"Tidak ada driver kosong setelah {timeout} detik")
+        try:
+            while True:
+                try:
+                    driver = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._lend(self._launch())
+                if driver not in self._recycle:
+                    return self._lend(driver)
+                self._discard(driver)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, driver, broken=False):
+        """Kembalikan driver ke pool; driver yang rusak ditutup"""
+        with self._lock:
+            # Mulai sini abort() dari peminjaman ini tidak berlaku lagi
+            self._leases.pop(driver, None)
+        try:
+            # Driver yang di-abort chromedriver-nya sudah mati, reset cuma akan gagal
+            broken = broken or self._closed or driver in self._recycle
+            if not broken:
+                try:
+                    # Bersihkan state pencarian sebelumnya
+                    driver.delete_all_cookies()
+                    driver.get('about:blank')
+                except Exception as e:
+                    # Port yang sudah mati keluar sebagai error urllib3, bukan WebDriverException
+                    logger.warning("Driver failed reset, discarding: %s", e)
+                    broken = True
+            if broken:
+                self._discard(driver)
+            else:
+                self._idle.put(driver)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """Context manager acquire/release; driver dianggap rusak kalau WebDriverException lolos"""
+        driver = self.acquire(timeout)
+        broken = False
+        try:
+            yield driver
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self.release(driver, broken=broken)
+
+    def prewarm(self, count=None):
+        """Launch beberapa driver paralel dan simpan sebagai idle, return jumlah yang berhasil"""
+        count = min(count or config.DRIVER_POOL['prewarm'], self.max_size - self.size)
+        if count <= 0:
+            return 0
+
+        def launch_idle(_):
+            driver = self._launch()
+            self._idle.put(driver)
+
+        launched = 0
+        with ThreadPoolExecutor(max_workers=count, thread_name_prefix='driver-prewarm') as executor:
+            for future in [executor.submit(launch_idle, n) for n in range(count)]:
+                try:
+                    future.result()
+                    launched += 1
+                except Exception as e:
+                    logger.error("Failed to prewarm driver: %s", e)
+        return launched
+
+    def close(self):
+        """Tutup semua driver idle (driver yang sedang dipakai ditutup saat dikembalikan)"""
+        self._closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def drain(self, timeout):
+        """Stop terima acquire baru, tunggu driver yang dipakai kembali, lalu tutup semua"""
+        self.close()
+        deadline = time.monotonic() + timeout
+        while self.size and time.monotonic() < deadline:
+            time.sleep(0.2)
+            self.close()
+        for driver in self.drivers():
+            # Masih dipakai setelah timeout: paksa tutup
+            self._discard(driver)
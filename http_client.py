@@ -0,0 +1,275 @@
+# http_client.py
+# Client HTTP bersama: connection pool keep-alive, limiter per host,
+# timeout adaptif per host, hedged GET, dan span tracing per request
+import bisect
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import config
+from cancellation import Cancelled, current_token
+from metrics import HEDGE_TOTAL, HEDGE_WINS
+from tracing import span
+
+
+def _build_session(retries=None):
+    """Bikin session dengan connection pool (dan retry opsional)"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=config.HTTP_CLIENT['pool_connections'],
+        pool_maxsize=config.HTTP_CLIENT['pool_maxsize'],
+        max_retries=retries or 0
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Session default tanpa retry, dan session dengan retry untuk endpoint yang sering 5xx
+session = _build_session()
+retry_session = _build_session(Retry(
+    total=config.REQUEST_SETTINGS['max_retries'],
+    backoff_factor=config.REQUEST_SETTINGS['backoff_factor'],
+    status_forcelist=[500, 502, 503, 504],
+    allowed_methods=['GET', 'HEAD']
+))
+
+
+# Batas atas bucket histogram latency: 10ms sampai ~60s, naik 25% per bucket
+LATENCY_BUCKETS = tuple(0.01 * 1.25 ** i for i in range(40))
+
+
+class LatencyTracker:
+    """Histogram latency bergulir untuk satu host (sampel terakhir sebanyak `window`)"""
+
+    def __init__(self, window=None):
+        self._samples = deque(maxlen=window or config.HTTP_CLIENT['latency_window'])
+        self._counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+        with self._lock:
+            if len(self._samples) == self._samples.maxlen:
+                self._counts[self._samples[0]] -= 1
+            self._samples.append(bucket)
+            self._counts[bucket] += 1
+
+    def percentile(self, quantile):
+        """Latency (batas atas bucket) di persentil tertentu, None kalau sampel belum cukup"""
+        with self._lock:
+            total = len(self._samples)
+            if total < config.HTTP_CLIENT['latency_min_samples']:
+                return None
+            target = quantile * total
+            seen = 0
+            for bucket, count in enumerate(self._counts):
+                seen += count
+                if seen >= target:
+                    break
+        return LATENCY_BUCKETS[min(bucket, len(LATENCY_BUCKETS) - 1)]
+
+
+# State per host: limiter request bersamaan dan tracker latency
+_host_limits = {}
+_latency_trackers = {}
+_per_host_lock = threading.Lock()
+
+
+def host_of(url):
+    """Ambil hostname dari URL"""
+    return urlsplit(url).hostname or ''
+
+
+def _per_host(registry, host, factory):
+    item = registry.get(host)
+    if item is None:
+        with _per_host_lock:
+            item = registry.get(host)
+            if item is None:
+                item = registry[host] = factory()
+    return item
+
+
+def host_limiter(host):
+    """Semaphore untuk host tertentu (dibuat saat pertama dipakai)"""
+    return _per_host(
+        _host_limits, host,
+        lambda: threading.BoundedSemaphore(config.HTTP_CLIENT['per_host_limit'])
+    )
+
+
+def latency_tracker(host):
+    """Tracker latency untuk host tertentu (dibuat saat pertama dipakai)"""
+    return _per_host(_latency_trackers, host, LatencyTracker)
+
+
+def timeout_for(host, ceiling=None):
+    """
+    Timeout untuk request ke host: persentil latency yang teramati plus margin,
+    dijepit ke [min_timeout, ceiling]. Timeout eksplisit dari pemanggil jadi ceiling.
+    """
+    settings = config.HTTP_CLIENT
+    ceiling = min(ceiling or settings['max_timeout'], settings['max_timeout'])
+    if not settings['adaptive_timeout']:
+        return ceiling
+    observed = latency_tracker(host).percentile(settings['timeout_percentile'])
+    if observed is None:
+        return ceiling
+    adaptive = observed * settings['timeout_multiplier'] + settings['timeout_margin']
+    return max(settings['min_timeout'], min(ceiling, adaptive))
+
+
+_cancellable_executor = ThreadPoolExecutor(
+    max_workers=config.HTTP_CLIENT['cancellable_workers'],
+    thread_name_prefix='http-cancellable'
+)
+
+
+def request(method, url, retry=False, **kwargs):
+    """
+    Kirim request lewat session bersama, tercatat sebagai span 'http'.
+    Kalau ada token pembatalan aktif, pemanggil berhenti menunggu begitu token dibatalkan.
+    """
+    client = retry_session if retry else session
+    host = host_of(url)
+    kwargs['timeout'] = timeout_for(host, kwargs.get('timeout'))
+    token = current_token()
+    if token is None:
+        return _send(client, method, url, host, **kwargs)
+    token.check()
+    # requests tidak bisa diputus dari luar, jadi dijalankan di thread lain;
+    # response yang datang setelah dibatalkan langsung ditutup
+    future = _cancellable_executor.submit(
+        contextvars.copy_context().run, _send, client, method, url, host, **kwargs
+    )
+    try:
+        return token.wait(future)
+    except Cancelled:
+        future.add_done_callback(_close_response)
+        raise
+
+
+def _send(client, method, url, host, **kwargs):
+    with span('http', method=method, host=host, timeout=round(kwargs['timeout'], 2)) as current:
+        with host_limiter(host):
+            start = time.perf_counter()
+            try:
+                response = client.request(method, url, **kwargs)
+            except requests.Timeout:
+                # Timeout tetap dicatat biar persentil tidak turun terus
+                latency_tracker(host).observe(time.perf_counter() - start)
+                raise
+            latency_tracker(host).observe(time.perf_counter() - start)
+        current.attrs['status'] = response.status_code
+        return response
+
+
+def get(url, **kwargs):
+    return request('GET', url, **kwargs)
+
+
+def head(url, **kwargs):
+    return request('HEAD', url, **kwargs)
+
+
+def iter_lines_capped(response, max_bytes, chunk_size=4096):
+    """Baca body response (stream=True) per baris, berhenti setelah max_bytes"""
+    remaining = max_bytes
+    pending = b''
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        chunk = chunk[:remaining]
+        remaining -= len(chunk)
+        lines = (pending + chunk).split(b'\n')
+        pending = lines.pop()
+        for line in lines:
+            yield line.decode('utf-8', 'replace')
+        if remaining <= 0:
+            # Baris terakhir mungkin terpotong, jadi dibuang
+            return
+    if pending:
+        yield pending.decode('utf-8', 'replace')
+
+
+class HedgeBudget:
+    """
+    Token bucket untuk hedge: setiap GET yang bisa di-hedge menambah `ratio` token,
+    setiap hedge memakai satu token. Jadi beban ekstra maksimal ~ratio dari total.
+    """
+
+    def __init__(self, ratio=None, burst=None):
+        self.ratio = ratio or config.HEDGING['budget_ratio']
+        self.burst = burst or config.HEDGING['budget_burst']
+        self._tokens = self.burst
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def withdraw(self):
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+hedge_budget = HedgeBudget()
+_hedge_executor = ThreadPoolExecutor(
+    max_workers=config.HEDGING['max_workers'],
+    thread_name_prefix='http-hedge'
+)
+
+
+def _close_response(future):
+    # Response yang kalah balapan ditutup biar koneksinya balik ke pool
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def hedged_get(url, **kwargs):
+    """
+    GET dengan hedging: kalau request pertama belum menjawab sampai p95 latency
+    host, kirim request kedua dan pakai yang duluan selesai (dibatasi hedge budget).
+    """
+    host = host_of(url)
+    delay = latency_tracker(host).percentile(config.HEDGING['percentile'])
+    if not config.HEDGING['enabled'] or delay is None:
+        return get(url, **kwargs)
+
+    hedge_budget.deposit()
+    primary = _hedge_executor.submit(contextvars.copy_context().run, get, url, **kwargs)
+    done, _ = wait([primary], timeout=delay)
+    if done:
+        HEDGE_TOTAL.labels(host, 'not_needed').inc()
+        return primary.result()
+    if not hedge_budget.withdraw():
+        HEDGE_TOTAL.labels(host, 'over_budget').inc()
+        return primary.result()
+
+    HEDGE_TOTAL.labels(host, 'sent').inc()
+    hedge = _hedge_executor.submit(contextvars.copy_context().run, get, url, **kwargs)
+    pending = {primary, hedge}
+    error = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is not None:
+                error = future.exception()
+                continue
+            if future is hedge:
+                HEDGE_WINS.labels(host).inc()
+            for other in pending:
+                other.add_done_callback(_close_response)
+            for other in done - {future}:
+                _close_response(other)
+            return future.result()
+    raise error
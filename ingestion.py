@@ -0,0 +1,74 @@
+# ingestion.py
+# Jalur masuk update mode polling: ukuran pool koneksi Bot API yang cocok dengan jumlah
+# thread yang memanggil API, catat lag update, dan buang backlog basi setelah restart
+import logging
+import time
+
+from telegram.ext import DispatcherHandlerStop
+from telegram.utils.request import Request
+
+import config
+from metrics import UPDATE_LAG, UPDATES_DROPPED
+
+logger = logging.getLogger(__name__)
+
+
+def connection_pool_size():
+    """
+    Koneksi yang dibutuhkan: worker dispatcher + 4 (Updater, Dispatcher, JobQueue, main
+    thread, hitungan PTB sendiri) + thread lain yang memanggil Bot API. Worker lane tetap
+    dihitung walau ada outbox karena answerCallbackQuery dipanggil langsung dari handler.
+    urllib3 tidak menunggu kalau pool habis, tapi buka koneksi TLS baru lalu membuangnya.
+    """
+    senders = sum(lane['workers'] for lane in config.LANES['lanes'].values())
+    if config.OUTBOX['enabled']:
+        senders += config.OUTBOX['workers']
+    return config.POLLING['workers'] + 4 + senders
+
+
+def make_request():
+    """Request Bot API dengan pool koneksi seukuran semua thread pemanggilnya"""
+    return Request(
+        con_pool_size=connection_pool_size(),
+        connect_timeout=config.POLLING['connect_timeout'],
+        read_timeout=config.POLLING['read_timeout']
+    )
+
+
+def polling_kwargs():
+    """Argumen Updater.start_polling dari config.POLLING"""
+    return {
+        'timeout': config.POLLING['timeout'],
+        'poll_interval': config.POLLING['poll_interval'],
+        'read_latency': config.POLLING['read_latency'],
+        'bootstrap_retries': config.POLLING['bootstrap_retries'],
+        'allowed_updates': config.POLLING['allowed_updates']
+    }
+
+
+class UpdateGate:
+    """
+    Handler paling awal (sebelum track_update): catat lag setiap pesan dan buang pesan
+    yang sudah antri sebelum bot start kalau umurnya lewat max_pending_age.
+    Callback query tidak punya tanggal sendiri, jadi selalu diteruskan.
+    """
+
+    def __init__(self, max_pending_age=None):
+        self.max_pending_age = max_pending_age if max_pending_age is not None else config.POLLING['max_pending_age']
+        self.started = time.time()
+
+    def __call__(self, update, context):
+        message = update.message or update.edited_message
+        if message is None or message.date is None:
+            return
+        received = time.time()
+        sent = message.date.timestamp()
+        lag = max(received - sent, 0)
+        UPDATE_LAG.labels('message').observe(lag)
+        if self.max_pending_age is not None and sent < self.started and lag > self.max_pending_age:
+            UPDATES_DROPPED.labels('stale').inc()
+            logger.info("Dropping stale update %s (%.0fs old)", update.update_id, lag)
+            raise DispatcherHandlerStop()
+
+
+update_gate = UpdateGate()
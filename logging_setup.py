@@ -0,0 +1,113 @@
+# logging_setup.py
+# Pipeline logging non-blocking: thread request cuma masukin record ke queue,
+# penulisan ke stdout/disk dikerjakan thread background
+import atexit
+import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+import config
+from tracing import JsonFormatter, current_trace_id
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Batasi log WARNING ke atas yang berulang: per template pesan, cuma
+    `burst` record pertama per window yang lolos, sisanya dihitung lalu
+    diringkas di awal window berikutnya.
+    """
+
+    def __init__(self, burst=None, window=None):
+        super().__init__()
+        self.burst = burst or config.LOGGING['sample_burst']
+        self.window = window or config.LOGGING['sample_window']
+        self._counts = {}  # (logger, template) -> [window_start, seen]
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno < logging.WARNING:
+            return True
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            state = self._counts.get(key)
+            if state is None or now - state[0] >= self.window:
+                suppressed = state[1] - self.burst if state and state[1] > self.burst else 0
+                self._counts[key] = [now, 1]
+                if suppressed:
+                    record.suppressed = suppressed
+                return True
+            state[1] += 1
+            return state[1] <= self.burst
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler yang tidak pernah block: kalau queue penuh, record dibuang dan dihitung"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Format ditunda ke thread writer; di sini cuma simpan trace_id
+        # karena contextvar tidak ikut pindah thread
+        record.trace_id = current_trace_id()
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class TextFormatter(logging.Formatter):
+    """Formatter teks biasa yang menambahkan info sampling kalau ada"""
+
+    def format(self, record):
+        text = super().format(record)
+        suppressed = getattr(record, 'suppressed', None)
+        if suppressed:
+            text += f" (+{suppressed} pesan serupa disembunyikan)"
+        return text
+
+
+listener = None
+queue_handler = None
+
+
+def setup_logging(level=logging.INFO):
+    """Pasang handler queue + listener background sebagai root handler"""
+    global listener, queue_handler
+
+    if listener:
+        return queue_handler
+
+    stream_handler = logging.StreamHandler()
+    if config.TRACING['json_logs']:
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(TextFormatter(TEXT_FORMAT))
+
+    log_queue = queue.Queue(maxsize=config.LOGGING['queue_size'])
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter())
+
+    logging.basicConfig(handlers=[queue_handler], level=level)
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(stop_logging)
+    return queue_handler
+
+
+def stop_logging():
+    """Flush sisa record di queue dan hentikan thread writer"""
+    global listener
+    if listener:
+        listener.stop()
+        listener = None
@@ -0,0 +1,338 @@
+# menus.py
+# Semua layar statis (menu, tutorial, FAQ) dibangun sekali di sini,
+# jadi navigasi menu cukup kirim ulang objek yang sudah jadi
+from collections import namedtuple
+from types import MappingProxyType
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+# Objek render immutable: teks, keyboard, dan parse mode
+Screen = namedtuple('Screen', ['text', 'reply_markup', 'parse_mode'])
+
+MAIN_KEYBOARD = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("🔍 Sosmed Finder", callback_data='sosmed_finder'),
+        InlineKeyboardButton("👥 Cari Nama", callback_data='search_name')
+    ],
+    [
+        InlineKeyboardButton("🌐 Basic OSINT", callback_data='basic_osint'),
+        InlineKeyboardButton("⚙️ Advanced", callback_data='advanced')
+    ],
+    [
+        InlineKeyboardButton("ℹ️ Help", callback_data='help')
+    ]
+])
+
+WELCOME_TEXT = (
+    "*🤖 SELAMAT DATANG DI OSINT BOT*\n\n"
+    "Bot ini akan membantu Anda mencari informasi tentang:\n"
+    "• Username di berbagai platform\n"
+    "• Nama lengkap seseorang\n"
+    "• Data OSINT dasar\n\n"
+    "Silakan pilih menu di bawah ini:"
+)
+
+# Layar untuk /start
+START_SCREEN = Screen(WELCOME_TEXT, MAIN_KEYBOARD, 'MarkdownV2')
+
+# Layar untuk /menu
+COMMAND_MENU_SCREEN = Screen(
+    "*🤖 OSINT BOT MENU*\n\n"
+    "*Basic Commands:*\n"
+    "• /cari [query] - Pencarian umum\n"
+    "• /ig [username] - Cek Instagram\n"
+    "• /email [email] - Validasi email\n"
+    "• /deep [query] - Deep OSINT search\n\n"
+    "*Advanced Commands:*\n"
+    "• /scan [domain/IP] - Advanced scanning\n"
+    "• /breach [email] - Cek data breach\n"
+    "• /domain [domain] - Domain intelligence\n"
+    "• /phone [nomor] - Phone intelligence\n\n"
+    "Pilih menu di bawah untuk informasi lebih lanjut 👇",
+    MAIN_KEYBOARD,
+    'Markdown'
+)
+
+# Layar untuk callback yang belum punya handler
+UNDER_DEVELOPMENT_SCREEN = Screen(
+    "*⚙️ Fitur Dalam Pengembangan*\n\n"
+    "Mohon maaf, fitur ini sedang dalam tahap pengembangan.\n"
+    "Silakan coba fitur lain yang tersedia.",
+    InlineKeyboardMarkup([[
+        InlineKeyboardButton("🔙 Kembali ke Menu", callback_data='menu')
+    ]]),
+    'Markdown'
+)
+
+# Layar hasil yang sudah kedaluwarsa di result store
+EXPIRED_RESULT_SCREEN = Screen(
+    "⌛ Hasil pencarian sudah kedaluwarsa, silakan cari ulang.",
+    InlineKeyboardMarkup([[
+        InlineKeyboardButton("🏠 Menu Utama", callback_data='menu')
+    ]]),
+    None
+)
+
+# Panduan per platform: command, info yang didapat, tutorial, dan FAQ
+PLATFORM_GUIDES = {
+    'fb': {
+        'command': "• `/f username` - Contoh: `/f johndoe`\n\n",
+        'info': "• Nama lengkap\n• Lokasi\n• Pekerjaan\n• Pendidikan\n• Jumlah teman\n• Status profil",
+        'tutorial': (
+            "*Langkah-langkah:*\n"
+            "1. Gunakan command `/f username`\n"
+            "2. Username bisa berupa:\n"
+            "   • Username Facebook\n"
+            "   • Nama profil\n"
+            "   • ID Facebook\n\n"
+            "*Tips:*\n"
+            "• Pastikan username sudah benar\n"
+            "• Coba variasi username\n"
+            "• Gunakan nama lengkap jika perlu"
+        ),
+        'faq': (
+            "*Q: Mengapa profil tidak ditemukan?*\n"
+            "A: • Profil mungkin private\n"
+            "   • Username salah\n"
+            "   • Profil sudah dihapus\n\n"
+            "*Q: Apakah bisa cari dengan email?*\n"
+            "A: Ya, gunakan format `/f email@domain.com`\n\n"
+            "*Q: Data apa saja yang bisa didapat?*\n"
+            "A: • Info profil dasar\n"
+            "   • Foto profil (jika public)\n"
+            "   • Status aktivitas\n"
+            "   • Informasi publik lainnya"
+        )
+    },
+    'ig': {
+        'command': "• `/i username` - Contoh: `/i johndoe`\n\n",
+        'info': "• Nama lengkap\n• Bio\n• Jumlah followers\n• Jumlah following\n• Jumlah post\n• Status profil",
+        'tutorial': (
+            "*Langkah-langkah:*\n"
+            "1. Gunakan command `/i username`\n"
+            "2. Username harus:\n"
+            "   • Tanpa karakter @\n"
+            "   • Tanpa spasi\n"
+            "   • Sesuai profil Instagram\n\n"
+            "*Tips:*\n"
+            "• Cek spelling username\n"
+            "• Perhatikan underscore (_)\n"
+            "• Coba cari di bio Instagram"
+        ),
+        'faq': (
+            "*Q: Profil private bisa dicek?*\n"
+            "A: Hanya info dasar yang tersedia\n\n"
+            "*Q: Bisa lihat story/highlight?*\n"
+            "A: Tidak, hanya info profil publik\n\n"
+            "*Q: Berapa lama hasil search valid?*\n"
+            "A: Data real-time saat pencarian\n\n"
+            "*Q: Bisa cari dengan nama lengkap?*\n"
+            "A: Gunakan `/cari` untuk pencarian nama"
+        )
+    },
+    'tw': {
+        'command': "• `/t username` - Contoh: `/t johndoe`\n\n",
+        'info': "• Nama lengkap\n• Bio\n• Jumlah followers\n• Jumlah following\n• Jumlah tweets\n• Status verifikasi",
+        'tutorial': (
+            "*Langkah-langkah:*\n"
+            "1. Gunakan command `/t username`\n"
+            "2. Username Twitter:\n"
+            "   • Tanpa @\n"
+            "   • Case sensitive\n"
+            "   • Max 15 karakter\n\n"
+            "*Tips:*\n"
+            "• Cek handle Twitter\n"
+            "• Perhatikan huruf besar/kecil\n"
+            "• Cari di bio Twitter"
+        ),
+        'faq': (
+            "*Q: Akun suspended bisa dicek?*\n"
+            "A: Tidak, hanya akun aktif\n\n"
+            "*Q: Bisa lihat tweet protected?*\n"
+            "A: Tidak, hanya tweet publik\n\n"
+            "*Q: Data real-time?*\n"
+            "A: Ya, menggunakan Twitter API\n\n"
+            "*Q: Bisa cek follower/following?*\n"
+            "A: Ya, jumlah dan status verifikasi"
+        )
+    },
+    'gh': {
+        'command': "• `/g username` - Contoh: `/g johndoe`\n\n",
+        'info': "• Nama lengkap\n• Bio\n• Repositories\n• Followers\n• Following\n• Kontribusi",
+        'tutorial': (
+            "*Langkah-langkah:*\n"
+            "1. Gunakan command `/g username`\n"
+            "2. Username GitHub:\n"
+            "   • Case sensitive\n"
+            "   • Tanpa spasi\n"
+            "   • Alfanumerik & dash\n\n"
+            "*Tips:*\n"
+            "• Cek URL GitHub\n"
+            "• Lihat kontributor repo\n"
+            "• Cari di organisasi"
+        ),
+        'faq': (
+            "*Q: Private repo bisa dilihat?*\n"
+            "A: Tidak, hanya repo publik\n\n"
+            "*Q: Bisa cek organisasi?*\n"
+            "A: Ya, jika status publik\n\n"
+            "*Q: Data kontribusi akurat?*\n"
+            "A: Ya, dari GitHub API\n\n"
+            "*Q: Bisa cek gist?*\n"
+            "A: Ya, gist publik termasuk"
+        )
+    },
+    'li': {
+        'command': "• `/l username` - Contoh: `/l johndoe`\n\n",
+        'info': "• Nama lengkap\n• Headline\n• Pengalaman\n• Pendidikan\n• Skills\n• Koneksi",
+        'tutorial': (
+            "*Langkah-langkah:*\n"
+            "1. Gunakan command `/l username`\n"
+            "2. Username LinkedIn:\n"
+            "   • Dari URL profil\n"
+            "   • Nama-nama profil\n"
+            "   • Email profil\n\n"
+            "*Tips:*\n"
+            "• Gunakan nama lengkap\n"
+            "• Cek URL profil\n"
+            "• Cari di perusahaan"
+        ),
+        'faq': (
+            "*Q: Perlu login LinkedIn?*\n"
+            "A: Tidak, pencarian tanpa login\n\n"
+            "*Q: Info pekerjaan akurat?*\n"
+            "A: Sesuai update terakhir profil\n\n"
+            "*Q: Bisa lihat koneksi?*\n"
+            "A: Hanya jumlah, tidak detail\n\n"
+            "*Q: Data endorsement tersedia?*\n"
+            "A: Ya, jika profil publik"
+        )
+    }
+}
+
+def _build_guide_screens(platform, guide):
+    """Bangun layar tutorial dan FAQ untuk satu platform"""
+    tutorial_keyboard = InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton("🔍 Mulai Cari", callback_data=f'search_{platform}'),
+            InlineKeyboardButton("❓ FAQ", callback_data=f'faq_{platform}')
+        ],
+        [
+            InlineKeyboardButton("🔙 Kembali", callback_data=f'search_{platform}'),
+            InlineKeyboardButton("🏠 Menu Utama", callback_data='menu')
+        ]
+    ])
+    faq_keyboard = InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton("🔍 Mulai Cari", callback_data=f'search_{platform}'),
+            InlineKeyboardButton("📖 Tutorial", callback_data=f'tutorial_{platform}')
+        ],
+        [
+            InlineKeyboardButton("🔙 Kembali", callback_data=f'search_{platform}'),
+            InlineKeyboardButton("🏠 Menu Utama", callback_data='menu')
+        ]
+    ])
+    return {
+        f'tutorial_{platform}': Screen(
+            f"*📖 TUTORIAL PENCARIAN {platform.upper()}*\n\n" + guide.get('tutorial', ''),
+            tutorial_keyboard,
+            'Markdown'
+        ),
+        f'faq_{platform}': Screen(
+            f"*❓ FAQ PENCARIAN {platform.upper()}*\n\n" + guide.get('faq', ''),
+            faq_keyboard,
+            'Markdown'
+        )
+    }
+
+def _build_platform_screens(platform, guide):
+    """Bangun layar pencarian, tutorial, dan FAQ untuk satu platform"""
+    search_text = (
+        f"*🔍 PENCARIAN DI {platform.upper()}*\n\n"
+        "Untuk memulai pencarian, kirim username dengan format:\n\n"
+        f"{guide['command']}"
+        "*Informasi yang akan didapat:*\n"
+        f"{guide['info']}"
+    )
+    search_keyboard = InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton("📖 Tutorial", callback_data=f'tutorial_{platform}'),
+            InlineKeyboardButton("❓ FAQ", callback_data=f'faq_{platform}')
+        ],
+        [
+            InlineKeyboardButton("🔙 Kembali", callback_data='sosmed_finder'),
+            InlineKeyboardButton("🏠 Menu Utama", callback_data='menu')
+        ]
+    ])
+    screens = {f'search_{platform}': Screen(search_text, search_keyboard, 'Markdown')}
+    screens.update(_build_guide_screens(platform, guide))
+    return screens
+
+def _build_static_screens():
+    """Bangun semua layar statis yang bisa dibuka lewat callback"""
+    screens = {
+        # Menu Utama
+        'menu': Screen(WELCOME_TEXT, MAIN_KEYBOARD, 'Markdown'),
+
+        # Menu Sosmed Finder
+        'sosmed_finder': Screen(
+            "*🔍 SOSMED FINDER*\n\n"
+            "Pilih platform untuk mencari username:\n\n"
+            "• `/f username` - Cari di Facebook\n"
+            "• `/i username` - Cari di Instagram\n"
+            "• `/t username` - Cari di Twitter\n"
+            "• `/g username` - Cari di GitHub\n"
+            "• `/l username` - Cari di LinkedIn\n\n"
+            "Contoh: `/i johndoe`",
+            InlineKeyboardMarkup([
+                [
+                    InlineKeyboardButton("Facebook", callback_data='search_fb'),
+                    InlineKeyboardButton("Instagram", callback_data='search_ig')
+                ],
+                [
+                    InlineKeyboardButton("Twitter", callback_data='search_tw'),
+                    InlineKeyboardButton("GitHub", callback_data='search_gh')
+                ],
+                [
+                    InlineKeyboardButton("LinkedIn", callback_data='search_li'),
+                    InlineKeyboardButton("🔙 Kembali", callback_data='menu')
+                ]
+            ]),
+            'Markdown'
+        ),
+
+        # Menu Pencarian Nama
+        'search_name': Screen(
+            "*🔍 PENCARIAN NAMA*\n\n"
+            "Untuk memulai pencarian nama, gunakan format berikut:\n\n"
+            "• `/nama John Doe` - Contoh: `/nama Steve Jobs`\n\n"
+            "*Informasi yang akan didapat:*\n"
+            "• Nama lengkap\n"
+            "• Lokasi\n"
+            "• Pekerjaan\n"
+            "• Pendidikan\n"
+            "• Social Media\n"
+            "• Status profil",
+            InlineKeyboardMarkup([
+                [
+                    InlineKeyboardButton("📖 Tutorial", callback_data='tutorial_name'),
+                    InlineKeyboardButton("❓ FAQ", callback_data='faq_name')
+                ],
+                [
+                    InlineKeyboardButton("🏠 Kembali ke Menu Utama", callback_data='menu')
+                ]
+            ]),
+            'Markdown'
+        )
+    }
+
+    # Tutorial dan FAQ per platform
+    for platform, guide in PLATFORM_GUIDES.items():
+        screens.update(_build_platform_screens(platform, guide))
+
+    # Tutorial dan FAQ pencarian nama (belum ada isinya)
+    screens.update(_build_guide_screens('name', {}))
+
+    return MappingProxyType(screens)
+
+STATIC_SCREENS = _build_static_screens()
@@ -0,0 +1,207 @@
+# metrics.py
+# Instrumentasi latency per stage dan per handler, diekspos format Prometheus
+import json
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest
+)
+
+import cancellation
+import config
+import tracing
+from profiler import profiler
+
+STAGE_LATENCY = Histogram(
+    'osint_stage_duration_seconds',
+    'Durasi setiap stage pencarian',
+    ['platform', 'stage', 'outcome'],
+    buckets=config.METRICS['buckets']
+)
+STAGE_TOTAL = Counter(
+    'osint_stage_total',
+    'Jumlah eksekusi setiap stage pencarian',
+    ['platform', 'stage', 'outcome']
+)
+HANDLER_LATENCY = Histogram(
+    'osint_handler_duration_seconds',
+    'Durasi handler Telegram dari awal sampai selesai',
+    ['handler', 'outcome'],
+    buckets=config.METRICS['buckets']
+)
+HANDLER_TOTAL = Counter(
+    'osint_handler_total',
+    'Jumlah pemanggilan handler Telegram',
+    ['handler', 'outcome']
+)
+
+CIRCUIT_OPEN = Gauge(
+    'osint_circuit_open',
+    'Status circuit breaker per platform (1 = open)',
+    ['platform']
+)
+
+HEDGE_TOTAL = Counter(
+    'osint_hedge_requests_total',
+    'Keputusan hedging per request GET (not_needed, sent, over_budget)',
+    ['host', 'decision']
+)
+HEDGE_WINS = Counter(
+    'osint_hedge_wins_total',
+    'Jumlah request hedge yang menjawab lebih dulu dari request pertama',
+    ['host']
+)
+
+DNS_CACHE_TOTAL = Counter(
+    'osint_dns_cache_total',
+    'Lookup DNS per hasil cache (hit, negative_hit, miss)',
+    ['result']
+)
+
+BROWSER_DRIVERS = Gauge('osint_browser_drivers', 'Jumlah driver Chrome yang hidup di pool')
+BROWSER_PROCESSES = Gauge('osint_browser_processes', 'Jumlah proses chromedriver + Chrome yang hidup')
+BROWSER_RSS_BYTES = Gauge('osint_browser_rss_bytes', 'Total RSS semua proses browser')
+BROWSER_REAPED = Counter(
+    'osint_browser_reaped_total',
+    'Proses browser yang dibunuh / driver yang di-recycle supervisor',
+    ['reason']
+)
+
+LANE_QUEUED = Gauge('osint_lane_queued', 'Job yang menunggu worker per lane', ['lane'])
+LANE_RUNNING = Gauge('osint_lane_running', 'Job yang sedang jalan per lane', ['lane'])
+LANE_WAIT = Histogram(
+    'osint_lane_wait_seconds',
+    'Waktu tunggu job di antrian lane sebelum mulai jalan',
+    ['lane'],
+    buckets=config.METRICS['buckets']
+)
+LANE_REJECTED = Counter('osint_lane_rejected_total', 'Job yang ditolak karena antrian lane penuh', ['lane'])
+
+OUTBOX_QUEUED = Gauge('osint_outbox_queued', 'Pesan Telegram yang menunggu dikirim')
+OUTBOX_WAIT = Histogram(
+    'osint_outbox_wait_seconds',
+    'Waktu tunggu pesan di outbox sebelum dikirim (termasuk jeda flood limit)',
+    buckets=config.METRICS['buckets']
+)
+OUTBOX_TOTAL = Counter(
+    'osint_outbox_total',
+    'Pesan keluar per method dan hasil (sent, coalesced, unchanged, error)',
+    ['method', 'result']
+)
+OUTBOX_RETRY_AFTER = Counter('osint_outbox_retry_after_total', 'RetryAfter (flood control) dari Telegram')
+
+UPDATE_LAG = Histogram(
+    'osint_update_lag_seconds',
+    'Jeda dari tanggal pesan sampai update diterima bot',
+    ['kind'],
+    buckets=config.METRICS['buckets']
+)
+UPDATES_DROPPED = Counter('osint_updates_dropped_total', 'Update yang dibuang sebelum sampai handler', ['reason'])
+
+
+class StageTimer:
+    """Penampung outcome stage, bisa diubah dari dalam blok with"""
+    __slots__ = ('outcome',)
+
+    def __init__(self):
+        self.outcome = 'ok'
+
+
+@contextmanager
+def track_stage(stage, platform='-'):
+    """
+    Ukur durasi satu stage. Outcome default 'ok', jadi 'error' kalau ada exception,
+    atau bisa diset manual lewat objek yang di-yield (misal 'found'/'not_found').
+    """
+    # Batas stage sekaligus titik cek pembatalan
+    cancellation.check()
+    timer = StageTimer()
+    with tracing.span(stage, platform=str(platform).lower()) as current:
+        start = time.perf_counter()
+        try:
+            yield timer
+        except cancellation.Cancelled:
+            timer.outcome = 'cancelled'
+            raise
+        except Exception:
+            timer.outcome = 'error'
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            current.outcome = timer.outcome
+            labels = (str(platform).lower(), stage, timer.outcome)
+            STAGE_LATENCY.labels(*labels).observe(elapsed)
+            STAGE_TOTAL.labels(*labels).inc()
+
+
+def instrument_handler(func):
+    """Decorator buat ukur durasi handler Telegram, sekaligus membuka trace per update"""
+    @wraps(func)
+    def wrapper(update, context, *args, **kwargs):
+        outcome = 'ok'
+        attrs = {'update_id': getattr(update, 'update_id', None)}
+        if getattr(update, 'effective_user', None):
+            attrs['user_id'] = update.effective_user.id
+        with tracing.start_trace(func.__name__, **attrs) as root, profiler.profile(func.__name__, root.trace_id):
+            start = time.perf_counter()
+            try:
+                return func(update, context, *args, **kwargs)
+            except Exception:
+                outcome = 'error'
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                HANDLER_LATENCY.labels(func.__name__, outcome).observe(elapsed)
+                HANDLER_TOTAL.labels(func.__name__, outcome).inc()
+    return wrapper
+
+
+def render_metrics():
+    """Render semua metrics, kembalikan (payload, content_type)"""
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+def render_health(health):
+    """Render status health jadi (status_code, payload JSON)"""
+    ready, payload = health() if health else (True, {'status': 'ready'})
+    return (200 if ready else 503), json.dumps(payload)
+
+
+def start_metrics_server(port=None, health=None):
+    """
+    Jalankan HTTP server terpisah untuk /metrics dan /healthz (mode polling).
+    `health` adalah fungsi yang return (ready, payload dict).
+    """
+    port = port or config.METRICS['port']
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.startswith('/metrics'):
+                status, content_type = 200, CONTENT_TYPE_LATEST
+                body = generate_latest()
+            elif self.path.startswith('/healthz'):
+                status, payload = render_health(health)
+                content_type, body = 'application/json', payload.encode()
+            else:
+                status, content_type, body = 404, 'text/plain', b'not found'
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('', port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='metrics-http', daemon=True).start()
+    return port
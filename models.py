@@ -0,0 +1,148 @@
+# models.py
+# Model hasil pencarian: satu bentuk record untuk semua platform,
+# pakai __slots__ biar hemat memori saat disimpan di result store
+
+# Urutan field menentukan bentuk serialisasi compact, jadi field baru selalu ditambah di belakang.
+# List compact: [extra, username, name, ...]; `extra` di depan biar posisinya tidak ikut bergeser
+PROFILE_FIELDS = (
+    'username', 'name', 'bio', 'url', 'status', 'location', 'work', 'education',
+    'followers', 'following', 'posts', 'friends', 'tweets', 'verified', 'created_at', 'source'
+)
+
+# Nama key lama dari scraper/API -> field model
+PROFILE_ALIASES = {
+    'description': 'bio',
+    'biography': 'bio',
+    'is_verified': 'verified',
+    'title': 'name'
+}
+
+
+def _trim(values):
+    """Buang None di ekor list biar serialisasi compact makin pendek"""
+    while values and values[-1] is None:
+        values.pop()
+    return values
+
+
+class ProfileResult:
+    """Satu profil di satu platform; field kosong disimpan sebagai None"""
+    __slots__ = PROFILE_FIELDS + ('extra',)
+
+    def __init__(
+        self, username=None, name=None, bio=None, url=None, status=None, location=None, work=None,
+        education=None, followers=None, following=None, posts=None, friends=None, tweets=None,
+        verified=None, created_at=None, source=None, extra=None
+    ):
+        self.username = username
+        self.name = name
+        self.bio = bio
+        self.url = url
+        self.status = status
+        self.location = location
+        self.work = work
+        self.education = education
+        self.followers = followers
+        self.following = following
+        self.posts = posts
+        self.friends = friends
+        self.tweets = tweets
+        self.verified = verified
+        self.created_at = created_at
+        self.source = source
+        self.extra = extra  # Field jarang dipakai (kategori, foto profil, headline, ...)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Bangun dari dict hasil scraper; key yang tidak dikenal masuk `extra`"""
+        profile = cls()
+        for key, value in (data or {}).items():
+            if value is None or value == '':
+                continue
+            field = PROFILE_ALIASES.get(key, key)
+            if field in PROFILE_FIELDS:
+                if getattr(profile, field) is None:
+                    setattr(profile, field, value)
+            elif key not in ('possible_matches', 'archived_data', 'metadata'):
+                if profile.extra is None:
+                    profile.extra = {}
+                profile.extra[key] = value
+        return profile
+
+    def to_compact(self):
+        return _trim([self.extra] + [getattr(self, field) for field in PROFILE_FIELDS])
+
+    @classmethod
+    def from_compact(cls, values):
+        # List lebih pendek (data versi lama) -> sisanya None; lebih panjang (versi baru) -> ekornya diabaikan
+        if not values:
+            return cls()
+        return cls(*values[1:len(PROFILE_FIELDS) + 1], extra=values[0])
+
+    def __repr__(self):
+        fields = ', '.join(
+            f"{field}={getattr(self, field)!r}" for field in self.__slots__ if getattr(self, field) is not None
+        )
+        return f"ProfileResult({fields})"
+
+
+class SearchResult:
+    """Hasil pencarian satu username di satu platform"""
+    __slots__ = ('platform', 'found', 'profile', 'error', 'possible_matches', 'related', 'archive', 'metadata')
+
+    def __init__(
+        self, platform, found=False, profile=None, error=None, possible_matches=None,
+        related=None, archive=None, metadata=None
+    ):
+        self.platform = platform
+        self.found = found
+        self.profile = profile if profile is not None else ProfileResult()
+        self.error = error
+        self.possible_matches = possible_matches or []
+        self.related = related or []  # Akun lain yang ketemu lewat pencarian (Facebook)
+        self.archive = archive
+        self.metadata = metadata
+
+    @classmethod
+    def from_dict(cls, platform, results):
+        """Bangun dari dict {'found', 'data', 'error', 'related_accounts'} ala scraper"""
+        data = results.get('data') or {}
+        return cls(
+            platform,
+            found=bool(results.get('found')),
+            profile=ProfileResult.from_dict(data),
+            error=results.get('error'),
+            possible_matches=[ProfileResult.from_dict(match) for match in data.get('possible_matches', [])],
+            related=[ProfileResult.from_dict(account) for account in results.get('related_accounts', [])],
+            archive=data.get('archived_data') or None,
+            metadata=data.get('metadata') or None
+        )
+
+    def to_compact(self):
+        return _trim([
+            self.platform,
+            self.found,
+            self.profile.to_compact(),
+            self.error,
+            [match.to_compact() for match in self.possible_matches] or None,
+            [account.to_compact() for account in self.related] or None,
+            self.archive,
+            self.metadata
+        ])
+
+    @classmethod
+    def from_compact(cls, values):
+        values = list(values) + [None] * (8 - len(values))
+        return cls(
+            values[0],
+            found=bool(values[1]),
+            profile=ProfileResult.from_compact(values[2] or []),
+            error=values[3],
+            possible_matches=[ProfileResult.from_compact(match) for match in values[4] or []],
+            related=[ProfileResult.from_compact(account) for account in values[5] or []],
+            archive=values[6],
+            metadata=values[7]
+        )
+
+    def __repr__(self):
+        return f"SearchResult(platform={self.platform!r}, found={self.found!r}, profile={self.profile!r}, error={self.error!r})"
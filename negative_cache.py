@@ -0,0 +1,84 @@
+# negative_cache.py
+# Cache username yang sudah pasti tidak ada per platform, pakai Bloom filter
+# dengan rotasi waktu biar memori tetap dan entry lama kedaluwarsa sendiri
+import hashlib
+import math
+import threading
+import time
+
+import config
+
+
+class BloomFilter:
+    """Bloom filter sederhana di atas bytearray, dengan double hashing"""
+    __slots__ = ('size', 'hashes', 'bits', 'count')
+
+    def __init__(self, capacity, error_rate):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class NegativeCache:
+    """
+    Dua generasi Bloom filter per platform (sekarang & sebelumnya).
+    Filter diputar tiap `rotate_after` detik atau saat kapasitasnya penuh,
+    jadi entry hidup antara 1x dan 2x periode rotasi.
+    """
+
+    def __init__(self, capacity=None, error_rate=None, rotate_after=None):
+        self.capacity = capacity or config.NEGATIVE_CACHE['capacity']
+        self.error_rate = error_rate or config.NEGATIVE_CACHE['error_rate']
+        self.rotate_after = rotate_after or config.NEGATIVE_CACHE['rotate_after']
+        self._filters = {}  # platform -> [current, previous, rotated_at]
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(username):
+        # URL profil tidak case-sensitive
+        return username.strip().lstrip('@').lower()
+
+    def _generation(self, platform, now, adding=False):
+        state = self._filters.get(platform)
+        if state is None:
+            state = self._filters[platform] = [BloomFilter(self.capacity, self.error_rate), None, now]
+        elif now - state[2] >= self.rotate_after or (adding and state[0].count >= self.capacity):
+            # Kalau sudah lewat 2x periode, generasi sebelumnya juga sudah basi
+            previous = state[0] if now - state[2] < 2 * self.rotate_after else None
+            state[:] = [BloomFilter(self.capacity, self.error_rate), previous, now]
+        return state
+
+    def add(self, platform, username):
+        """Catat username yang sudah dikonfirmasi tidak ada di platform"""
+        if not config.NEGATIVE_CACHE['enabled']:
+            return
+        with self._lock:
+            state = self._generation(platform.lower(), time.monotonic(), adding=True)
+            state[0].add(self._key(username))
+
+    def contains(self, platform, username):
+        """True kalau username kemungkinan besar sudah pernah dikonfirmasi tidak ada"""
+        if not config.NEGATIVE_CACHE['enabled']:
+            return False
+        key = self._key(username)
+        with self._lock:
+            state = self._generation(platform.lower(), time.monotonic())
+            return key in state[0] or (state[1] is not None and key in state[1])
+
+
+negative_cache = NegativeCache()
@@ -1,29 +1,52 @@
 import re
+import os
+import contextvars
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
 from datetime import datetime
 from functools import wraps
 import time
 import requests
 from bs4 import BeautifulSoup
-import dns.resolver
-import whois
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import Updater, CommandHandler, CallbackQueryHandler
+from telegram.ext import Updater, CommandHandler, CallbackQueryHandler, TypeHandler, ExtBot
 import config
+import http_client
+from result_store import result_store
+from models import ProfileResult, SearchResult
+from negative_cache import negative_cache
+from dns_cache import resolver as dns_resolver
+from whois_cache import whois_cache
+from driver_pool import DriverPool
+from tab_pool import TabPool
+from browser_supervisor import BrowserSupervisor
+from warmup import readiness, warm_start
+from circuit_breaker import CircuitBreakers
+from analytics import analytics
+from metrics import track_stage, instrument_handler, start_metrics_server
+from tracing import slow_traces, format_span_tree
+from profiler import profiler
+from outbox import OutboxBot, outbox
+from ingestion import make_request, polling_kwargs, update_gate
+from scheduler import scheduler, STATIC, API, BROWSER
+from cancellation import Cancelled, cancel_registry, current_token, check as check_cancelled, use as use_cancel_token
+from logging_setup import setup_logging
+from menus import (
+    STATIC_SCREENS, START_SCREEN, COMMAND_MENU_SCREEN,
+    UNDER_DEVELOPMENT_SCREEN, EXPIRED_RESULT_SCREEN
+)
 from selenium.webdriver.common.by import By
 import logging
 from selenium.webdriver.common.keys import Keys
 import telegram
 
-# Setup logging basic configuration
-logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.INFO
-)
+# Setup logging basic configuration (lewat queue, ditulis thread background)
+setup_logging(level=logging.INFO)
 
 # Token bot dari config
 TOKEN = config.TELEGRAM_TOKEN
@@ -61,22 +84,18 @@ def get_platform_emoji(platform):
     }
     return emoji_map.get(platform, '🔍')
 
-# Tambahkan variabel global untuk tracking
-daily_users = set()
-last_reset_date = datetime.now().date()
-total_monthly_users = set()
-last_monthly_reset = datetime.now().replace(day=1).date()
-
 def escape_markdown(text):
     """Escape karakter markdown"""
     if not isinstance(text, str):
         return str(text)
     return re.sub(r'([_*\[\]()~`>#+\-=|{}.!])', r'\\\1', text)
 
-def setup_driver():
+def setup_driver(page_load_strategy=None):
     """Setup Chrome WebDriver dengan konfigurasi optimal"""
     try:
         chrome_options = Options()
+        if page_load_strategy:
+            chrome_options.page_load_strategy = page_load_strategy
         
         # Tambahkan arguments dari config
         for arg in config.CHROME_SETTINGS['arguments']:
@@ -95,90 +114,129 @@ def setup_driver():
         return driver
         
     except Exception as e:
-        logger.error(f"Error setting up Chrome driver: {str(e)}")
+        logger.error("Error setting up Chrome driver: %s", e)
         raise e
 
+# Pool driver bersama; driver di-launch duluan saat warm start.
+# Mode multi-tab: loading halaman di-poll TabDriver, jadi chromedriver tidak boleh menunggu load
+if config.BROWSER_TABS['enabled']:
+    driver_pool = TabPool(lambda: setup_driver(page_load_strategy='none'))
+else:
+    driver_pool = DriverPool(setup_driver)
+browser_supervisor = BrowserSupervisor(driver_pool)
+
 def search_profile(username, platform):
     """Cari profil dengan multiple metode pencarian yang lebih advanced"""
     driver = None
-    results = {
-        'found': False, 
-        'data': {
-            'username': username,
-            'name': '',
-            'bio': '',
-            'url': '',
-            'status': '',
-            'possible_matches': []
-        }, 
-        'error': None
-    }
+    driver_broken = False
+    token = current_token()
+    stop_abort = None
+    results = SearchResult(platform, profile=ProfileResult(username=username))
     
     try:
+        # 0. Username yang baru saja dikonfirmasi tidak ada langsung dijawab
+        with track_stage('negative_cache', platform) as stage:
+            cached_miss = negative_cache.contains(platform, username)
+            stage.outcome = 'hit' if cached_miss else 'miss'
+        if cached_miss:
+            results.profile.status = 'not_found'
+            results.error = f"Profil {platform} @{username} tidak ditemukan"
+            return results
+            
+        # Platform yang sedang down/memblokir langsung ditolak tanpa buka Chrome
+        if not platform_breakers.allow(platform):
+            results.profile.status = 'unavailable'
+            results.error = config.ERROR_MESSAGES['request_failed']
+            return results
+            
         # 1. Coba pencarian API terlebih dahulu
-        api_result = search_via_api(username, platform)
-        if api_result.get('found'):
+        with track_stage('api', platform) as stage:
+            api_result = search_via_api(username, platform)
+            stage.outcome = 'found' if api_result.found else 'not_found'
+        if api_result.found:
+            platform_breakers.record_success(platform)
             return api_result
             
-        # 2. Setup driver jika API gagal
-        driver = setup_driver()
-        if not driver:
-            raise Exception("Gagal membuat WebDriver")
+        # 2. Ambil driver dari pool jika API gagal
+        with track_stage('driver_acquire', platform):
+            driver = driver_pool.acquire()
+            
+        # Cancel di tengah page load: chromedriver dimatikan biar Selenium langsung berhenti.
+        # Callback cancel bisa jalan setelah driver dikembalikan, jadi abort dibatasi ke peminjaman ini
+        lease = driver_pool.lease(driver)
+        stop_abort = token.on_cancel(lambda: driver_pool.abort(driver, lease)) if token else (lambda: None)
             
         wait = WebDriverWait(driver, config.CHROME_SETTINGS['timeouts']['pageLoad'])
             
         # 3. Gunakan Selenium dengan teknik advanced
         selenium_result = None
-        if platform == "Instagram":
-            selenium_result = search_instagram_advanced(driver, wait, username)
-        elif platform == "Twitter": 
-            selenium_result = search_twitter_advanced(driver, wait, username)
-        elif platform == "Facebook":
-            selenium_result = search_facebook_advanced(driver, wait, username)
-        elif platform == "GitHub":
-            selenium_result = search_github_advanced(driver, wait, username)
-            
-        if selenium_result and selenium_result.get('found'):
+        with track_stage('selenium', platform) as stage:
+            if platform == "Instagram":
+                selenium_result = search_instagram_advanced(driver, wait, username)
+            elif platform == "Twitter": 
+                selenium_result = search_twitter_advanced(driver, wait, username)
+            elif platform == "Facebook":
+                selenium_result = search_facebook_advanced(driver, wait, username)
+            elif platform == "GitHub":
+                selenium_result = search_github_advanced(driver, wait, username)
+            stage.outcome = 'found' if selenium_result and selenium_result.found else 'not_found'
+            
+        # Driver langsung dikembalikan; stage OSINT tambahan di bawah cuma HTTP
+        stop_abort()
+        stop_abort = None
+        # Dikosongkan dulu biar finally di bawah tidak release dua kali kalau release() raise
+        released, driver = driver, None
+        driver_pool.release(released)
+        # Hasil scraper yang driver-nya diputus tidak dihitung ke circuit breaker
+        check_cancelled()
+            
+        if selenium_result and selenium_result.found:
+            platform_breakers.record_success(platform)
             return selenium_result
+        if selenium_result and selenium_result.profile.status == 'not_found':
+            negative_cache.add(platform, username)
+            platform_breakers.record_success(platform)
+        elif selenium_result and selenium_result.error:
+            # Timeout / halaman gagal dimuat dihitung sebagai kegagalan platform
+            platform_breakers.record_failure(platform)
             
         # 4. Jika masih tidak ditemukan, lakukan OSINT tambahan
-        if not results['found']:
+        if not results.found:
             # Cek arsip web
-            archived_results = check_web_archives(username, platform)
+            with track_stage('archive', platform):
+                archived_results = check_web_archives(username, platform)
             if archived_results:
-                results['data']['archived_data'] = archived_results
+                results.archive = archived_results
             
             # Cari username variations
-            variations = generate_username_variations(username)
-            possible_matches = []
-            for var in variations[:5]:  # Cek 5 variasi pertama
-                var_result = quick_check_username(var, platform)
-                if var_result:
-                    possible_matches.append(var_result)
-            results['data']['possible_matches'] = possible_matches
+            with track_stage('variations', platform):
+                results.possible_matches = check_username_variations(username, [platform])
             
             # Cek metadata tambahan
-            metadata = gather_additional_metadata(username, platform)
+            with track_stage('metadata', platform):
+                metadata = gather_additional_metadata(username, platform)
             if metadata:
-                results['data']['metadata'] = metadata
+                results.metadata = metadata
                 
     except Exception as e:
-        error_msg = f"Error in search_profile for {platform}: {str(e)}"
-        logger.error(error_msg)
-        results['error'] = error_msg
+        logger.error("Error in search_profile for %s: %s", platform, e)
+        results.error = f"Error in search_profile for {platform}: {str(e)}"
+        # Gagal launch Chrome atau driver diputus karena cancel bukan salah platform
+        if driver and not (token and token.cancelled):
+            platform_breakers.record_failure(platform)
+            driver_broken = isinstance(e, WebDriverException)
         
     finally:
+        if stop_abort:
+            stop_abort()
         if driver:
-            try:
-                driver.quit()
-            except Exception as e:
-                logger.error(f"Error closing driver: {str(e)}")
+            driver_pool.release(driver, broken=driver_broken)
     
     return results
 
 def search_via_api(username, platform):
     """Pencarian menggunakan API resmi platform"""
-    results = {'found': False, 'data': {}}
+    results = SearchResult(platform)
     
     try:
         if platform == "Instagram":
@@ -191,7 +249,7 @@ def search_via_api(username, platform):
                 
                 try:
                     # Coba dapatkan user ID dulu
-                    response = requests.get(
+                    response = http_client.get(
                         f"https://graph.instagram.com/me?fields=id,username&access_token={config.INSTAGRAM_API_TOKEN}",
                         headers=headers,
                         timeout=10
@@ -201,7 +259,7 @@ def search_via_api(username, platform):
                         data = response.json()
                         if data.get('id'):
                             # Gunakan ID untuk mendapatkan info detail
-                            detail_response = requests.get(
+                            detail_response = http_client.get(
                                 f"https://graph.instagram.com/{data['id']}?fields=id,username,account_type,media_count,biography&access_token={config.INSTAGRAM_API_TOKEN}",
                                 headers=headers,
                                 timeout=10
@@ -209,35 +267,37 @@ def search_via_api(username, platform):
                             
                             if detail_response.status_code == 200:
                                 detail_data = detail_response.json()
-                                results['found'] = True
-                                results['data'] = {
+                                results.found = True
+                                results.profile = ProfileResult.from_dict({
                                     'username': detail_data.get('username'),
                                     'account_type': detail_data.get('account_type'),
                                     'media_count': detail_data.get('media_count'),
-                                    'bio': detail_data.get('biography')
-                                }
+                                    'bio': detail_data.get('biography'),
+                                    'source': 'api'
+                                })
                 except Exception as e:
-                    logger.error(f"Instagram API error: {str(e)}")
+                    logger.error("Instagram API error: %s", e)
                     # Fallback ke web scraping jika API gagal
                     pass
                     
         elif platform == "Twitter" and config.TWITTER_API_TOKEN:
             try:
                 headers = {'Authorization': f'Bearer {config.TWITTER_API_TOKEN}'}
-                response = requests.get(
+                response = http_client.get(
                     f"{config.TWITTER_API_ENDPOINT}{username}",
                     headers=headers,
                     timeout=10
                 )
                 if response.status_code == 200:
-                    data = response.json()
-                    results['found'] = True
-                    results['data'] = extract_twitter_data(data)
+                    profile = extract_twitter_data(response.json())
+                    if profile:
+                        results.found = True
+                        results.profile = profile
             except Exception as e:
-                logger.error(f"Twitter API error: {str(e)}")
+                logger.error("Twitter API error: %s", e)
                 
     except Exception as e:
-        logger.error(f"API search error for {platform}: {str(e)}")
+        logger.error("API search error for %s: %s", platform, e)
         
     return results
 
@@ -245,57 +305,55 @@ def check_web_archives(username, platform):
     """Cek arsip web untuk profil"""
     archives = {}
     base_urls = {
-        'Instagram': f'instagram.com/{username}',
-        'Twitter': f'twitter.com/{username}',
-        'Facebook': f'facebook.com/{username}',
-        'GitHub': f'github.com/{username}'
+        'instagram': f'instagram.com/{username}',
+        'twitter': f'twitter.com/{username}',
+        'facebook': f'facebook.com/{username}',
+        'github': f'github.com/{username}'
     }
     
     try:
-        if platform in base_urls:
-            wayback_url = f'http://web.archive.org/cdx/search/cdx?url={base_urls[platform]}&output=json'
-            
-            # Konfigurasi session dengan retry
-            session = requests.Session()
-            retries = requests.adapters.Retry(
-                total=3,  # Jumlah total retry
-                backoff_factor=0.5,  # Waktu tunggu antara retry
-                status_forcelist=[500, 502, 503, 504]  # Status code yang akan di-retry
-            )
-            session.mount('http://', requests.adapters.HTTPAdapter(max_retries=retries))
-            session.mount('https://', requests.adapters.HTTPAdapter(max_retries=retries))
+        base_url = base_urls.get(platform.lower())
+        if base_url:
+            # Filter di sisi server: cuma N capture terbaru, satu per hari, kolom timestamp saja
+            params = {
+                'url': base_url,
+                'fl': 'timestamp',
+                'collapse': 'timestamp:8',
+                'limit': -config.WAYBACK['snapshots'],
+                'fastLatest': 'true'
+            }
+            wayback_url = f"http://web.archive.org/cdx/search/cdx?{urlencode(params)}"
             
-            # Tambahkan timeout yang lebih lama
-            response = session.get(wayback_url, timeout=30, headers={
+            # Pakai session bersama dengan retry dan timeout yang lebih lama, plus hedging
+            response = http_client.hedged_get(wayback_url, retry=True, timeout=30, stream=True, headers={
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             })
             
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    if len(data) > 1:  # Skip header row
-                        archives['wayback_snapshots'] = []
-                        # Ambil 4 snapshot terbaru
-                        for row in data[1:5]:
-                            try:
-                                snapshot = {
-                                    'timestamp': row[1],
-                                    'url': f'http://web.archive.org/web/{row[1]}/{base_urls[platform]}'
-                                }
-                                archives['wayback_snapshots'].append(snapshot)
-                            except (IndexError, TypeError):
-                                continue
-                except ValueError:
-                    logger.error("Failed to parse Wayback Machine JSON response")
+            with response:
+                if response.status_code == 200:
+                    # Format teks: satu timestamp per baris, dibaca bertahap dengan batas byte
+                    timestamps = [
+                        line.strip() for line in http_client.iter_lines_capped(response, config.WAYBACK['max_bytes'])
+                        if line.strip().isdigit()
+                    ]
+                    if timestamps:
+                        # limit negatif mengembalikan urutan lama -> baru, jadi dibalik
+                        archives['wayback_snapshots'] = [
+                            {
+                                'timestamp': timestamp,
+                                'url': f'http://web.archive.org/web/{timestamp}/{base_url}'
+                            }
+                            for timestamp in reversed(timestamps[-config.WAYBACK['snapshots']:])
+                        ]
                     
     except requests.exceptions.Timeout:
-        logger.warning(f"Timeout while checking archives for {platform}: {username}")
+        logger.warning("Timeout while checking archives for %s: %s", platform, username)
         archives['error'] = "Timeout saat mengakses arsip"
     except requests.exceptions.RequestException as e:
-        logger.error(f"Archive check error: {str(e)}")
+        logger.error("Archive check error: %s", e)
         archives['error'] = f"Gagal mengakses arsip: {str(e)}"
     except Exception as e:
-        logger.error(f"Unexpected error in archive check: {str(e)}")
+        logger.error("Unexpected error in archive check: %s", e)
         archives['error'] = "Terjadi kesalahan saat mengecek arsip"
         
     return archives
@@ -304,10 +362,16 @@ def gather_additional_metadata(username, platform):
     """Kumpulkan metadata tambahan tentang profil"""
     metadata = {}
     
+    domain = f"{username}.{platform.lower()}.com"
+    
     try:
+        # Lookup DNS jalan di background selama query Google
+        dns_lookups = dns_resolver.start_many([domain])
+        
         # 1. Cek mentions di Google
         google_url = f"https://www.google.com/search?q=site:{platform.lower()}.com+\"{username}\""
-        response = requests.get(google_url, headers=config.HEADERS)
+        with track_stage('google', platform):
+            response = http_client.hedged_get(google_url, headers=config.HEADERS)
         if response.status_code == 200:
             soup = BeautifulSoup(response.text, 'html.parser')
             results = soup.find_all('div', class_='g')
@@ -320,30 +384,24 @@ def gather_additional_metadata(username, platform):
             ]
         
         # 2. Cek data DNS jika ada domain terkait
-        try:
-            domain = f"{username}.{platform.lower()}.com"
-            dns_records = dns.resolver.resolve(domain, 'A')
+        with track_stage('dns', platform) as stage:
+            dns_records = dns_resolver.collect(dns_lookups).get(domain)
+            stage.outcome = 'found' if dns_records else 'not_found'
+        if dns_records:
             metadata['dns_info'] = {
                 'domain': domain,
-                'records': [str(record) for record in dns_records]
+                'records': dns_records.get('A', []),
+                'by_type': dns_records
             }
-        except:
-            pass
         
-        # 3. Cek informasi WHOIS jika ada domain
-        try:
-            whois_info = whois.whois(domain)
-            if whois_info:
-                metadata['whois_info'] = {
-                    'registrar': whois_info.registrar,
-                    'creation_date': str(whois_info.creation_date),
-                    'expiration_date': str(whois_info.expiration_date)
-                }
-        except:
-            pass
+        # 3. Cek informasi WHOIS (di-cache per registrable domain)
+        with track_stage('whois', platform) as stage:
+            whois_info, stage.outcome = whois_cache.lookup(domain)
+        if whois_info:
+            metadata['whois_info'] = whois_info
             
     except Exception as e:
-        logger.error(f"Metadata gathering error: {str(e)}")
+        logger.error("Metadata gathering error: %s", e)
         
     return metadata
 
@@ -351,38 +409,46 @@ def quick_check_username(username, platform):
     """Cek cepat keberadaan username"""
     try:
         urls = {
-            'Instagram': f'https://www.instagram.com/{username}/',
-            'Twitter': f'https://twitter.com/{username}',
-            'Facebook': f'https://www.facebook.com/{username}',
-            'GitHub': f'https://github.com/{username}'
+            'instagram': f'https://www.instagram.com/{username}/',
+            'twitter': f'https://twitter.com/{username}',
+            'facebook': f'https://www.facebook.com/{username}',
+            'github': f'https://github.com/{username}'
         }
         
-        if platform in urls:
-            response = requests.head(
-                urls[platform],
+        # Nama platform di kode ini kadang "Instagram", kadang "instagram"
+        url = urls.get(platform.lower())
+        # HEAD sering tetap 200/404 walau scraping diblokir, jadi hasilnya tidak dicatat ke breaker;
+        # state breaker cuma dari API, Selenium, dan probe
+        if url and not negative_cache.contains(platform, username) and not platform_breakers.is_open(platform):
+            response = http_client.head(
+                url,
                 headers=config.HEADERS,
                 timeout=5,
                 allow_redirects=True
             )
             if response.status_code == 200:
-                return {
-                    'username': username,
-                    'url': urls[platform],
-                    'status': 'active'
-                }
-    except:
+                return ProfileResult(username=username, url=url, status='active')
+            if response.status_code == 404:
+                negative_cache.add(platform, username)
+    except Exception:
         pass
     return None
 
+# Thread pool bersama untuk cek variasi username secara paralel
+VARIATION_EXECUTOR = ThreadPoolExecutor(
+    max_workers=config.VARIATION_CHECK['max_workers'],
+    thread_name_prefix='variation-check'
+)
+
 def search_direct(username, platform):
     """Coba pencarian langsung via API"""
-    results = {'found': False, 'error': None}
+    results = SearchResult(platform)
     
     try:
         if platform == "Instagram":
             try:
                 url = f"https://www.instagram.com/{username}/?__a=1&__d=1"
-                response = requests.get(
+                response = http_client.get(
                     url, 
                     headers={
                         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -400,21 +466,19 @@ def search_direct(username, platform):
                         data = response.json()
                         if data and 'graphql' in data:
                             user = data['graphql']['user']
-                            results = {
-                                'found': True,
-                                'url': f"https://www.instagram.com/{username}",
-                                'username': username,
-                                'data': {
-                                    'name': user.get('full_name', ''),
-                                    'bio': user.get('biography', ''),
-                                    'followers': user.get('edge_followed_by', {}).get('count', 0)
-                                }
-                            }
+                            results.found = True
+                            results.profile = ProfileResult(
+                                username=username,
+                                url=f"https://www.instagram.com/{username}",
+                                name=user.get('full_name') or None,
+                                bio=user.get('biography') or None,
+                                followers=user.get('edge_followed_by', {}).get('count', 0)
+                            )
                     except ValueError:
                         # JSON parsing failed, fallback to Selenium
                         pass
             except Exception as e:
-                logger.error(f"Instagram API error: {str(e)}")
+                logger.error("Instagram API error: %s", e)
                 # Don't raise, let Selenium handle it
                 pass
         
@@ -425,23 +489,21 @@ def search_direct(username, platform):
                     'User-Agent': 'v2UserLookupPython'
                 }
                 url = f"https://api.twitter.com/2/users/by/username/{username}"
-                response = requests.get(url, headers=headers)
+                response = http_client.get(url, headers=headers)
                 
                 if response.status_code == 200:
                     data = response.json()
                     if 'data' in data:
-                        results = {
-                            'found': True,
-                            'url': f"https://twitter.com/{username}",
-                            'username': username,
-                            'data': {
-                                'name': data['data'].get('name', ''),
-                                'description': data['data'].get('description', '')
-                            }
-                        }
+                        results.found = True
+                        results.profile = ProfileResult(
+                            username=username,
+                            url=f"https://twitter.com/{username}",
+                            name=data['data'].get('name') or None,
+                            bio=data['data'].get('description') or None
+                        )
                         
     except Exception as e:
-        logger.error(f"Direct search error for {platform}: {str(e)}")
+        logger.error("Direct search error for %s: %s", platform, e)
         # Don't raise exception, let the calling function handle it
         pass
         
@@ -458,7 +520,7 @@ def find_possible_matches(username, platform):
         # Cari di Google
         search_query = f"site:{platform.lower()}.com {username}"
         google_url = f"https://www.google.com/search?q={search_query}"
-        response = requests.get(google_url, headers=config.HEADERS)
+        response = http_client.get(google_url, headers=config.HEADERS)
         
         if response.status_code == 200:
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -469,34 +531,35 @@ def find_possible_matches(username, platform):
                 if link and platform.lower() in link['href']:
                     title = result.find('h3')
                     if title:
-                        possible_matches.append({
-                            'url': link['href'],
-                            'title': title.text,
-                            'source': 'Google Search'
-                        })
+                        possible_matches.append(ProfileResult(
+                            url=link['href'],
+                            name=title.text,
+                            source='Google Search'
+                        ))
                         
         # Cari di platform spesifik
         if platform == "GitHub":
             # Cari repository atau user yang mirip
             search_url = f"https://api.github.com/search/users?q={username}"
-            response = requests.get(search_url)
+            response = http_client.get(search_url)
             if response.status_code == 200:
                 data = response.json()
                 for item in data.get('items', [])[:3]:
-                    possible_matches.append({
-                        'url': item['html_url'],
-                        'username': item['login'],
-                        'source': 'GitHub API'
-                    })
+                    possible_matches.append(ProfileResult(
+                        url=item['html_url'],
+                        username=item['login'],
+                        source='GitHub API'
+                    ))
                     
     except Exception as e:
-        logger.error(f"Error finding possible matches: {str(e)}")
+        logger.error("Error finding possible matches: %s", e)
         
     return possible_matches
 
 def generate_username_variations(username):
-    """Generate variasi username yang mungkin"""
-    variations = set([username])
+    """Generate variasi username yang mungkin, urut dari yang paling masuk akal"""
+    # dict dipakai sebagai ordered set: urutan = tingkat kemungkinan
+    variations = dict.fromkeys([username, username.lower()])
     
     # Split username
     parts = re.split(r'[._-]', username)
@@ -504,25 +567,67 @@ def generate_username_variations(username):
     # Tambah variasi dengan separator berbeda
     separators = ['', '.', '_', '-']
     for sep in separators:
-        variations.add(sep.join(parts))
+        variations[sep.join(parts)] = None
+    
+    # Tambah variasi capitalization
+    variations[username.capitalize()] = None
     
     # Tambah angka umum
     common_numbers = ['123', '1234', '321', '007']
     for num in common_numbers:
-        variations.add(f"{username}{num}")
+        variations[f"{username}{num}"] = None
     
-    # Tambah tahun
+    # Tambah tahun (yang terbaru dulu)
     current_year = datetime.now().year
-    for year in range(current_year-5, current_year+1):
-        variations.add(f"{username}{year}")
+    for year in range(current_year, current_year-6, -1):
+        variations[f"{username}{year}"] = None
     
-    # Tambah variasi capitalization
-    variations.add(username.lower())
-    variations.add(username.upper())
-    variations.add(username.capitalize())
+    variations[username.upper()] = None
     
     return list(variations)
 
+def check_username_variations(username, platforms, limit=None, first_hits=None):
+    """
+    Cek variasi username di beberapa platform secara paralel.
+    Hasil diurutkan sesuai urutan kemungkinan variasi; begitu `first_hits`
+    ditemukan, cek yang belum jalan dibatalkan.
+    """
+    limit = limit or config.VARIATION_CHECK['limit']
+    first_hits = first_hits or config.VARIATION_CHECK['first_hits']
+    
+    # URL profil tidak case-sensitive, jadi variasi beda huruf besar/kecil cukup dicek sekali
+    variations = []
+    seen = set()
+    for variation in generate_username_variations(username):
+        if variation.lower() not in seen:
+            seen.add(variation.lower())
+            variations.append(variation)
+    variations = variations[:limit]
+    
+    jobs = {}
+    for rank, variation in enumerate(variations):
+        for order, platform in enumerate(platforms):
+            future = VARIATION_EXECUTOR.submit(
+                contextvars.copy_context().run, quick_check_username, variation, platform
+            )
+            jobs[future] = (rank, order)
+            
+    hits = []
+    try:
+        for future in as_completed(jobs, timeout=config.VARIATION_CHECK['timeout']):
+            match = future.result()
+            if match:
+                hits.append((jobs[future], match))
+                if len(hits) >= first_hits:
+                    break
+    except FuturesTimeout:
+        logger.warning("Variation check timed out for %s", username)
+    finally:
+        for future in jobs:
+            future.cancel()
+            
+    return [match for _, match in sorted(hits, key=lambda hit: hit[0])]
+
 def format_search_results(results, platform):
     """Format hasil pencarian untuk ditampilkan"""
     if not results:
@@ -539,46 +644,46 @@ def format_search_results(results, platform):
         }
         icon = platform_icons.get(platform, '🔍')
         
-        if results.get('found'):
-            data = results['data']
+        if results.found:
+            data = results.profile
             formatted_text += f"{icon} *Hasil Pencarian {platform}*\n\n"
             
             # Info utama
-            if data.get('name'): 
-                formatted_text += f"📝 *Nama:* {escape_markdown(data['name'])}\n"
-            if data.get('username'):
-                formatted_text += f"🔖 *Username:* {escape_markdown(data['username'])}\n" 
-            if data.get('url'):
-                formatted_text += f"🔗 *URL:* {escape_markdown(data['url'])}\n"
+            if data.name: 
+                formatted_text += f"📝 *Nama:* {escape_markdown(data.name)}\n"
+            if data.username:
+                formatted_text += f"🔖 *Username:* {escape_markdown(data.username)}\n" 
+            if data.url:
+                formatted_text += f"🔗 *URL:* {escape_markdown(data.url)}\n"
                 
             # Info tambahan    
-            if data.get('location'):
-                formatted_text += f"📍 *Lokasi:* {escape_markdown(data['location'])}\n"
-            if data.get('work'):
-                formatted_text += f"💼 *Pekerjaan:* {escape_markdown(data['work'])}\n"
-            if data.get('education'):
-                formatted_text += f"🎓 *Pendidikan:* {escape_markdown(data['education'])}\n"
-            if data.get('bio'):
-                formatted_text += f"\n📋 *Bio:*\n{escape_markdown(data['bio'])}\n"
+            if data.location:
+                formatted_text += f"📍 *Lokasi:* {escape_markdown(data.location)}\n"
+            if data.work:
+                formatted_text += f"💼 *Pekerjaan:* {escape_markdown(data.work)}\n"
+            if data.education:
+                formatted_text += f"🎓 *Pendidikan:* {escape_markdown(data.education)}\n"
+            if data.bio:
+                formatted_text += f"\n📋 *Bio:*\n{escape_markdown(data.bio)}\n"
                 
             # Statistik
             formatted_text += "\n📊 *Statistik:*\n"
-            if data.get('friends'):
-                formatted_text += f"👥 Teman: {data['friends']}\n"
-            if data.get('followers'):
-                formatted_text += f"👥 Pengikut: {data['followers']}\n"
-            if data.get('posts'):
-                formatted_text += f"📝 Post: {data['posts']}\n"
+            if data.friends:
+                formatted_text += f"👥 Teman: {data.friends}\n"
+            if data.followers:
+                formatted_text += f"👥 Pengikut: {data.followers}\n"
+            if data.posts:
+                formatted_text += f"📝 Post: {data.posts}\n"
                 
             # Status & metadata
-            if data.get('verified'):
+            if data.verified:
                 formatted_text += "✅ Akun Terverifikasi\n"
-            if data.get('created_at'):
-                formatted_text += f"📅 Bergabung: {data['created_at']}\n"
+            if data.created_at:
+                formatted_text += f"📅 Bergabung: {data.created_at}\n"
                 
             # Sumber data
             formatted_text += f"\n🔍 *Sumber:* "
-            formatted_text += "🔌 API" if data.get('source') == 'api' else "🌐 Web"
+            formatted_text += "🔌 API" if data.source == 'api' else "🌐 Web"
         else:
             formatted_text += f"❌ *Profil tidak ditemukan di {platform}*\n\n"
             formatted_text += "💡 *Saran:*\n"
@@ -587,36 +692,40 @@ def format_search_results(results, platform):
             formatted_text += "• Coba platform sosial media lain\n"
             
             # Tampilkan kemungkinan akun terkait jika ada
-            if results.get('data', {}).get('possible_matches'):
+            if results.possible_matches:
                 formatted_text += "\n🔍 *Mungkin yang Anda cari:*\n"
-                for match in results['data']['possible_matches'][:3]:
-                    formatted_text += f"• {escape_markdown(match.get('username', ''))}\n"
+                for match in results.possible_matches[:3]:
+                    formatted_text += f"• {escape_markdown(match.username or '')}\n"
                     
         return formatted_text
         
     except Exception as e:
-        logger.error(f"Error formatting search results: {str(e)}")
+        logger.error("Error formatting search results: %s", e)
         return f"❌ Terjadi kesalahan saat memformat hasil: {str(e)}"
 
 def verify_platform_status(platform):
     """Verifikasi status platform sebelum melakukan pencarian"""
     try:
         urls = {
-            "Instagram": "https://www.instagram.com",
-            "Twitter": "https://twitter.com",
-            "Facebook": "https://www.facebook.com",
-            "LinkedIn": "https://www.linkedin.com",
-            "GitHub": "https://github.com"
+            "instagram": "https://www.instagram.com",
+            "twitter": "https://twitter.com",
+            "facebook": "https://www.facebook.com",
+            "linkedin": "https://www.linkedin.com",
+            "github": "https://github.com"
         }
         
-        if platform not in urls:
+        url = urls.get(platform.lower())
+        if not url:
             return True  # Skip check untuk platform yang tidak terdaftar
             
-        response = requests.head(urls[platform], timeout=5)
+        response = http_client.head(url, headers=config.HEADERS, timeout=5, allow_redirects=True)
         return response.status_code == 200
-    except:
+    except Exception:
         return False
 
+# Circuit breaker per platform, ditutup lagi oleh probe verify_platform_status
+platform_breakers = CircuitBreakers(probe=verify_platform_status)
+
 class RateLimiter:
     def __init__(self):
         self.last_request = {}
@@ -656,7 +765,7 @@ def with_rate_limit(platform):
                     try:
                         return func(*args, **kwargs)
                     except Exception as e:
-                        logger.error(f"Error in {platform} request: {str(e)}")
+                        logger.error("Error in %s request: %s", platform, e)
                         retry_count += 1
                         if retry_count >= config.REQUEST_SETTINGS['max_retries']:
                             raise
@@ -689,6 +798,15 @@ def search_linkedin(username):
 def search_github(username):
     return search_profile(username, "GitHub")
 
+# Fungsi pencarian per platform, dipakai ulang saat tombol Refresh ditekan
+PROFILE_SEARCHERS = {
+    'Facebook': search_facebook,
+    'Instagram': search_instagram,
+    'Twitter': search_twitter,
+    'LinkedIn': search_linkedin,
+    'GitHub': search_github
+}
+
 def basic_osint_search(username):
     """Pencarian OSINT dasar untuk username"""
     results = {
@@ -700,25 +818,25 @@ def basic_osint_search(username):
     try:
         # Coba cari di platform utama
         twitter_results = search_twitter(username)
-        if twitter_results.get('found'):
+        if twitter_results.found:
             results['found'] = True
-            results['data']['twitter'] = twitter_results['data']
+            results['data']['twitter'] = twitter_results.profile
             
         instagram_results = search_instagram(username)
-        if instagram_results.get('found'):
+        if instagram_results.found:
             results['found'] = True
-            results['data']['instagram'] = instagram_results['data']
+            results['data']['instagram'] = instagram_results.profile
             
         github_results = search_github(username)
-        if github_results.get('found'):
+        if github_results.found:
             results['found'] = True
-            results['data']['github'] = github_results['data']
+            results['data']['github'] = github_results.profile
             
         # Tambahkan pencarian platform lain sesuai kebutuhan
             
         return results
     except Exception as e:
-        logger.error(f"Error in basic OSINT search: {str(e)}")
+        logger.error("Error in basic OSINT search: %s", e)
         return {'found': False, 'error': str(e)}
 
 def search_name_across_platforms(full_name):
@@ -752,34 +870,36 @@ def search_name_across_platforms(full_name):
             platform_results = {'found': False, 'data': []}
             
             try:
-                # Coba cari dengan nama lengkap
-                if platform == 'facebook':
-                    results_fb = search_facebook_advanced(None, None, full_name)
-                    if results_fb.get('found'):
-                        platform_results['found'] = True
-                        platform_results['data'].append(results_fb['data'])
+                with track_stage('name_search', platform) as stage:
+                    # Coba cari dengan nama lengkap
+                    if platform == 'facebook':
+                        results_fb = search_facebook_advanced(None, None, full_name)
+                        if results_fb.found:
+                            platform_results['found'] = True
+                            platform_results['data'].append(results_fb.profile)
                         
-                elif platform == 'linkedin':
-                    results_li = search_linkedin_advanced(full_name)
-                    if results_li.get('status') == 'success':
-                        platform_results['found'] = True
-                        platform_results['data'].append(results_li['data'])
+                    elif platform == 'linkedin':
+                        results_li = search_linkedin_advanced(full_name)
+                        if results_li.found:
+                            platform_results['found'] = True
+                            platform_results['data'].append(results_li.profile)
                         
-                # Coba setiap kemungkinan username
-                for username in possible_usernames:
-                    if platform == 'twitter':
-                        results_tw = search_twitter(username)
-                    elif platform == 'instagram':
-                        results_ig = search_instagram(username)
-                    elif platform == 'github':
-                        results_gh = search_github(username)
+                    # Coba setiap kemungkinan username
+                    for username in possible_usernames:
+                        if platform == 'twitter':
+                            results_tw = search_twitter(username)
+                        elif platform == 'instagram':
+                            results_ig = search_instagram(username)
+                        elif platform == 'github':
+                            results_gh = search_github(username)
                         
-                    if results.get('found'):
-                        platform_results['found'] = True
-                        platform_results['data'].append(results.get('data', {}))
+                        if results.get('found'):
+                            platform_results['found'] = True
+                            platform_results['data'].append(results.get('data', {}))
+                    stage.outcome = 'found' if platform_results['found'] else 'not_found'
                         
             except Exception as e:
-                logger.error(f"Error searching {platform}: {str(e)}")
+                logger.error("Error searching %s: %s", platform, e)
                 continue
                 
             if platform_results['found']:
@@ -789,25 +909,28 @@ def search_name_across_platforms(full_name):
         # 3. Tambahkan metadata tambahan
         try:
             # Cek Google untuk informasi publik
-            google_results = search_google(full_name)
+            with track_stage('google'):
+                google_results = search_google(full_name)
             if google_results:
                 results['metadata']['google'] = google_results
                 
             # Cek LinkedIn untuk informasi profesional
-            linkedin_results = search_linkedin_advanced(full_name)
-            if linkedin_results.get('status') == 'success':
-                results['metadata']['professional'] = linkedin_results['data']
+            with track_stage('linkedin_profile', 'linkedin'):
+                linkedin_results = search_linkedin_advanced(full_name)
+            if linkedin_results.found:
+                results['metadata']['professional'] = linkedin_results.profile
                 
             # Cek situs berita
-            news_results = search_news(full_name)
+            with track_stage('news'):
+                news_results = search_news(full_name)
             if news_results:
                 results['metadata']['news'] = news_results
                 
         except Exception as e:
-            logger.error(f"Error gathering metadata: {str(e)}")
+            logger.error("Error gathering metadata: %s", e)
             
     except Exception as e:
-        logger.error(f"Error in name search across platforms: {str(e)}")
+        logger.error("Error in name search across platforms: %s", e)
         results['error'] = str(e)
         
     return results
@@ -817,7 +940,7 @@ def search_google(query):
     results = []
     try:
         search_url = f"https://www.google.com/search?q={query}"
-        response = requests.get(search_url, headers=config.HEADERS)
+        response = http_client.hedged_get(search_url, headers=config.HEADERS)
         
         if response.status_code == 200:
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -836,7 +959,7 @@ def search_google(query):
                     })
                     
     except Exception as e:
-        logger.error(f"Error in Google search: {str(e)}")
+        logger.error("Error in Google search: %s", e)
         
     return results
 
@@ -845,7 +968,7 @@ def search_news(query):
     results = []
     try:
         search_url = f"https://www.google.com/search?q={query}&tbm=nws"
-        response = requests.get(search_url, headers=config.HEADERS)
+        response = http_client.hedged_get(search_url, headers=config.HEADERS)
         
         if response.status_code == 200:
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -864,92 +987,216 @@ def search_news(query):
                     })
                     
     except Exception as e:
-        logger.error(f"Error in news search: {str(e)}")
+        logger.error("Error in news search: %s", e)
         
     return results
 
+NAME_SEARCH_HEADER = "👤 *HASIL PENCARIAN NAMA*\n" + "\\="*30 + "\n\n"
+
+def format_profile_lines(profile):
+    """Format satu profil jadi baris-baris ringkas untuk hasil pencarian (MarkdownV2)"""
+    formatted_text = "├─ 👤 "
+    if profile.name:
+        formatted_text += f"*{escape_markdown(profile.name)}*"
+    if profile.username:
+        formatted_text += f" \\(@{escape_markdown(profile.username)}\\)"
+    formatted_text += "\n"
+    
+    if profile.bio:
+        formatted_text += f"├─ 📝 {escape_markdown(profile.bio[:100])}\\.\\.\\.\n"
+    if profile.location:
+        formatted_text += f"├─ 📍 {escape_markdown(profile.location)}\n"
+    if profile.work:
+        formatted_text += f"├─ 💼 {escape_markdown(profile.work)}\n"
+    if profile.education:
+        formatted_text += f"├─ 🎓 {escape_markdown(profile.education)}\n"
+        
+    # Statistik profil
+    stats = []
+    if profile.followers: 
+        stats.append(f"👥 {escape_markdown(str(profile.followers))} pengikut")
+    if profile.friends: 
+        stats.append(f"👥 {escape_markdown(str(profile.friends))} teman")
+    if profile.posts: 
+        stats.append(f"📝 {escape_markdown(str(profile.posts))} post")
+    if stats:
+        formatted_text += "├─ 📊 " + " \\| ".join(stats) + "\n"
+        
+    if profile.url:
+        formatted_text += f"└─ 🔗 {escape_markdown(profile.url)}\n"
+    return formatted_text + "\n"
+
+def render_name_search_blocks(results):
+    """Pecah hasil pencarian nama jadi blok-blok (satu blok per platform/bagian)"""
+    if not results.get('found'):
+        return [
+            "❌ *Tidak ditemukan hasil yang cocok*\n\n"
+            "💡 *Saran:*\n"
+            "• Coba gunakan nama lengkap\n"
+            "• Periksa ejaan nama\n"
+            "• Coba gunakan variasi nama\n"
+        ]
+        
+    blocks = []
+    
+    # Format hasil per platform
+    if results.get('platforms'):
+        for platform, data in results['platforms'].items():
+            if data:  # Pastikan data tidak None
+                block = f"{get_platform_emoji(platform)} *{platform.upper()}*\n"
+                for profile in data:
+                    if isinstance(profile, ProfileResult):
+                        block += format_profile_lines(profile)
+                blocks.append(block)
+                    
+    # Tampilkan kemungkinan profil terkait
+    if results.get('possible_matches'):
+        block = "\n🔍 *Profil Terkait:*\n"
+        for match in results['possible_matches'][:3]:
+            block += f"• {escape_markdown(match.get('name', ''))} "
+            if match.get('platform'):
+                block += f"\\({get_platform_emoji(match['platform'])} {escape_markdown(match['platform'])}\\)\n"
+            else:
+                block += "\n"
+        blocks.append(block)
+                
+    # Tampilkan metadata tambahan jika ada
+    if results.get('metadata'):
+        block = "\nℹ️ *Informasi Tambahan:*\n"
+        for key, value in results['metadata'].items():
+            if isinstance(value, dict):
+                block += f"• {escape_markdown(str(key))}:\n"
+                for k, v in value.items():
+                    block += f"  \\- {escape_markdown(str(k))}: {escape_markdown(str(v))}\n"
+            else:
+                block += f"• {escape_markdown(str(key))}: {escape_markdown(str(value))}\n"
+        blocks.append(block)
+        
+    return blocks
+
 def format_name_search_results(results):
     """Format hasil pencarian berdasarkan nama lengkap"""
     if not results:
         return "❌ Terjadi kesalahan saat memformat hasil pencarian nama."
         
     try:
-        formatted_text = "👤 *HASIL PENCARIAN NAMA*\n" + "="*30 + "\n\n"
-        
-        if not results.get('found'):
-            formatted_text += "❌ *Tidak ditemukan hasil yang cocok*\n\n"
-            formatted_text += "💡 *Saran:*\n"
-            formatted_text += "• Coba gunakan nama lengkap\n"
-            formatted_text += "• Periksa ejaan nama\n"
-            formatted_text += "• Coba gunakan variasi nama\n"
-            return formatted_text
-            
-        # Format hasil per platform
-        if results.get('platforms'):
-            for platform, data in results['platforms'].items():
-                if data:  # Pastikan data tidak None
-                    formatted_text += f"{get_platform_emoji(platform)} *{platform.upper()}*\n"
-                    
-                    for profile in data:
-                        if isinstance(profile, dict):  # Pastikan profile adalah dictionary
-                            formatted_text += "├─ 👤 "
-                            if profile.get('name'):
-                                formatted_text += f"*{escape_markdown(profile['name'])}*"
-                            if profile.get('username'):
-                                formatted_text += f" (@{escape_markdown(profile['username'])})"
-                            formatted_text += "\n"
-                            
-                            if profile.get('bio'):
-                                formatted_text += f"├─ 📝 {escape_markdown(profile['bio'][:100])}...\n"
-                            if profile.get('location'):
-                                formatted_text += f"├─ 📍 {escape_markdown(profile['location'])}\n"
-                            if profile.get('work'):
-                                formatted_text += f"├─ 💼 {escape_markdown(profile['work'])}\n"
-                            if profile.get('education'):
-                                formatted_text += f"├─ 🎓 {escape_markdown(profile['education'])}\n"
-                                
-                            # Statistik profil
-                            stats = []
-                            if profile.get('followers'): 
-                                stats.append(f"👥 {profile['followers']} pengikut")
-                            if profile.get('friends'): 
-                                stats.append(f"👥 {profile['friends']} teman")
-                            if profile.get('posts'): 
-                                stats.append(f"📝 {profile['posts']} post")
-                            if stats:
-                                formatted_text += f"├─ 📊 {' | '.join(stats)}\n"
-                                
-                            if profile.get('url'):
-                                formatted_text += f"└─ 🔗 {escape_markdown(profile['url'])}\n"
-                            formatted_text += "\n"
-                        
-        # Tampilkan kemungkinan profil terkait
-        if results.get('possible_matches'):
-            formatted_text += "\n🔍 *Profil Terkait:*\n"
-            for match in results['possible_matches'][:3]:
-                formatted_text += f"• {escape_markdown(match.get('name', ''))} "
-                if match.get('platform'):
-                    formatted_text += f"({get_platform_emoji(match['platform'])} {match['platform']})\n"
-                else:
-                    formatted_text += "\n"
-                    
-        # Tampilkan metadata tambahan jika ada
-        if results.get('metadata'):
-            formatted_text += "\nℹ️ *Informasi Tambahan:*\n"
-            for key, value in results['metadata'].items():
-                if isinstance(value, dict):
-                    formatted_text += f"• {key}:\n"
-                    for k, v in value.items():
-                        formatted_text += f"  - {escape_markdown(str(k))}: {escape_markdown(str(v))}\n"
-                else:
-                    formatted_text += f"• {key}: {escape_markdown(str(value))}\n"
-                
-        return formatted_text
-        
+        return NAME_SEARCH_HEADER + ''.join(render_name_search_blocks(results))
     except Exception as e:
-        logger.error(f"Error formatting name search results: {str(e)}")
+        logger.error("Error formatting name search results: %s", e)
         return f"❌ Terjadi kesalahan saat memformat hasil: {str(e)}"
 
+def render_deep_search_blocks(results):
+    """Pecah hasil deep search jadi blok-blok (satu blok per platform/bagian)"""
+    data = results.get('data', {})
+    if not results.get('found') and not data:
+        blocks = ["❌ *Tidak ditemukan hasil yang cocok*\n\n"]
+        if results.get('error'):
+            blocks.append(f"⚠️ *Error:* `{escape_markdown(results['error'])}`\n")
+        return blocks
+        
+    blocks = []
+    for platform, profile in data.get('social_media', {}).items():
+        if isinstance(profile, ProfileResult):
+            blocks.append(f"{get_platform_emoji(platform)} *{escape_markdown(platform.upper())}*\n" + format_profile_lines(profile))
+            
+    if data.get('possible_matches'):
+        block = "🔍 *Kemungkinan Username Terkait:*\n"
+        for match in data['possible_matches']:
+            block += f"• `{escape_markdown(match.username or '')}` \\- {escape_markdown(match.url or '')}\n"
+        blocks.append(block + "\n")
+        
+    if data.get('archived_data'):
+        block = "🗄️ *Arsip Web:*\n"
+        for platform, archived in data['archived_data'].items():
+            snapshots = archived.get('wayback_snapshots', [])
+            # wayback_snapshots diurutkan baru -> lama (lihat check_web_archives)
+            if snapshots:
+                block += f"• {escape_markdown(platform)}: {len(snapshots)} snapshot, terbaru {escape_markdown(snapshots[0]['url'])}\n"
+        blocks.append(block + "\n")
+        
+    if data.get('metadata'):
+        block = "ℹ️ *Metadata:*\n"
+        for platform, metadata in data['metadata'].items():
+            block += f"• *{escape_markdown(platform)}*\n"
+            for mention in metadata.get('google_mentions', []):
+                block += f"  📰 {escape_markdown(mention.get('title', ''))}\n"
+            if metadata.get('dns_info'):
+                block += f"  🌐 {escape_markdown(', '.join(metadata['dns_info']['records']))}\n"
+            if metadata.get('whois_info'):
+                block += f"  📇 {escape_markdown(str(metadata['whois_info'].get('registrar')))}\n"
+        blocks.append(block + "\n")
+        
+    return blocks
+
+# Penanda entity MarkdownV2 yang dipakai renderer hasil; '||' dicek duluan sebelum '|'
+MARKDOWN_ENTITY_MARKS = ('||', '*', '_', '~', '`')
+
+def truncate_markdown_line(line, limit):
+    """
+    Potong satu baris MarkdownV2 jadi paling panjang `limit` karakter (termasuk "…\n")
+    tanpa memutus escape `\\x`; entity yang masih terbuka di titik potong ditutup lagi.
+    """
+    # Sisakan tempat untuk penutup entity (paling banyak semua penanda sekaligus) dan "…\n"
+    cut = max(limit - 2 - sum(len(mark) for mark in MARKDOWN_ENTITY_MARKS), 0)
+    text = line.rstrip('\n')[:cut]
+    opened = []
+    index = 0
+    end = 0
+    while index < len(text):
+        if text[index] == '\\':
+            if index + 1 >= len(text):
+                # Escape yang kepotong dibuang, bukan dikirim sebagai backslash gantung
+                break
+            index += 2
+        elif opened and opened[-1] == '`':
+            if text[index] == '`':
+                opened.pop()
+            index += 1
+        else:
+            mark = next((mark for mark in MARKDOWN_ENTITY_MARKS if text.startswith(mark, index)), None)
+            if mark and opened and opened[-1] == mark:
+                opened.pop()
+            elif mark:
+                opened.append(mark)
+            index += len(mark) if mark else 1
+        end = index
+    return text[:end] + ''.join(reversed(opened)) + "…\n"
+
+def paginate_blocks(header, blocks, max_chars=None):
+    """
+    Susun blok-blok teks jadi halaman dengan panjang terbatas.
+    Pemotongan hanya di batas blok/baris supaya entity markdown tidak terpotong;
+    satu baris yang lebih panjang dari halaman dipotong lewat truncate_markdown_line.
+    """
+    max_chars = max_chars or config.PAGINATION['max_page_chars']
+    budget = max_chars - len(header) - config.PAGINATION['footer_reserve']
+    
+    # Blok yang terlalu panjang dipecah per baris dulu
+    pieces = []
+    for block in blocks:
+        if len(block) <= budget:
+            pieces.append(block)
+            continue
+        for line in block.splitlines(keepends=True):
+            pieces.append(line if len(line) <= budget else truncate_markdown_line(line, budget))
+            
+    pages = []
+    current = ""
+    for piece in pieces:
+        if current and len(current) + len(piece) > budget:
+            pages.append(current)
+            current = ""
+        current += piece
+    if current or not pages:
+        pages.append(current)
+        
+    if len(pages) == 1:
+        return [header + pages[0]]
+    return [
+        f"{header}{page}\n📄 Halaman {index}/{len(pages)}"
+        for index, page in enumerate(pages, start=1)
+    ]
+
 def search_instagram_advanced(driver, wait, username):
     """
     Pencarian lanjutan untuk profil Instagram menggunakan multiple metode dan fallback.
@@ -1031,7 +1278,7 @@ def search_instagram_advanced(driver, wait, username):
                         else:
                             element = driver.find_element(By.CSS_SELECTOR, selector)
                         return element
-                    except:
+                    except Exception:
                         continue
                 return None
             
@@ -1046,9 +1293,9 @@ def search_instagram_advanced(driver, wait, username):
                         name = driver.find_element(By.XPATH, "//meta[@property='og:title']").get_attribute('content')
                         if name:
                             results['data']['name'] = name.split('(')[0].strip()
-                    except:
+                    except Exception:
                         results['data']['name'] = username
-            except:
+            except Exception:
                 results['data']['name'] = username
                 
             # 6. Ambil bio dengan multiple attempts
@@ -1062,9 +1309,9 @@ def search_instagram_advanced(driver, wait, username):
                         bio = driver.find_element(By.XPATH, "//meta[@property='og:description']").get_attribute('content')
                         if bio:
                             results['data']['bio'] = bio
-                    except:
+                    except Exception:
                         results['data']['bio'] = "Bio tidak tersedia"
-            except:
+            except Exception:
                 results['data']['bio'] = "Bio tidak tersedia"
                 
             # 7. Ambil statistik dengan multiple attempts
@@ -1087,13 +1334,13 @@ def search_instagram_advanced(driver, wait, username):
                                 return int(float(text.replace('m', '')) * 1000000)
                             else:
                                 return int(text.replace(',', '').replace('.', ''))
-                        except:
+                        except Exception:
                             return 0
                     
                     results['data']['posts'] = parse_count(stats_elements[0].text)
                     results['data']['followers'] = parse_count(stats_elements[1].text)
                     results['data']['following'] = parse_count(stats_elements[2].text)
-            except:
+            except Exception:
                 results['data']['posts'] = 0
                 results['data']['followers'] = 0
                 results['data']['following'] = 0
@@ -1112,7 +1359,7 @@ def search_instagram_advanced(driver, wait, username):
                     len(driver.find_elements(By.XPATH, "//*[contains(text(), 'Private Account')]")) > 0,
                     len(driver.find_elements(By.XPATH, "//*[contains(text(), 'Akun Privat')]")) > 0
                 ])
-            except:
+            except Exception:
                 results['data']['is_verified'] = False
                 results['data']['is_private'] = False
                 
@@ -1124,7 +1371,7 @@ def search_instagram_advanced(driver, wait, username):
                     if url and not url.startswith('https://www.instagram.com'):
                         results['data']['external_url'] = url
                         break
-            except:
+            except Exception:
                 results['data']['external_url'] = None
                 
             # 10. Ambil foto profil dengan multiple attempts
@@ -1138,9 +1385,9 @@ def search_instagram_advanced(driver, wait, username):
                         profile_pic = driver.find_element(By.XPATH, "//meta[@property='og:image']").get_attribute('content')
                         if profile_pic:
                             results['data']['profile_pic'] = profile_pic
-                    except:
+                    except Exception:
                         results['data']['profile_pic'] = None
-            except:
+            except Exception:
                 results['data']['profile_pic'] = None
                 
             # 11. Tambahan: Coba ambil kategori/jenis akun
@@ -1152,7 +1399,7 @@ def search_instagram_advanced(driver, wait, username):
                     results['data']['category'] = category_elements[0].text.strip()
                 else:
                     results['data']['category'] = "Personal Account"
-            except:
+            except Exception:
                 results['data']['category'] = "Personal Account"
                 
         else:
@@ -1160,11 +1407,11 @@ def search_instagram_advanced(driver, wait, username):
             results['error'] = f"Profil Instagram @{username} tidak ditemukan"
             
     except Exception as e:
-        logger.error(f"Error saat mengakses profil Instagram {username}: {str(e)}")
+        logger.error("Error saat mengakses profil Instagram %s: %s", username, e)
         results['error'] = f"Gagal mengakses profil Instagram: {str(e)}"
         results['data']['status'] = 'error'
         
-    return results
+    return SearchResult.from_dict('Instagram', results)
 
 def search_linkedin_advanced(driver, wait, username):
     """Pencarian profil LinkedIn dengan metode advanced"""
@@ -1222,14 +1469,14 @@ def search_linkedin_advanced(driver, wait, username):
                 try:
                     company_elem = driver.find_element(By.CSS_SELECTOR, 'div[aria-label="Current company"]')
                     results['data']['company'] = company_elem.text.strip()
-                except:
+                except Exception:
                     pass
                 
                 # Ambil info pendidikan
                 try:
                     education_elem = driver.find_element(By.CSS_SELECTOR, 'div[aria-label="Education"]')
                     results['data']['education'] = education_elem.text.strip()
-                except:
+                except Exception:
                     pass
                 
                 # Ambil jumlah koneksi
@@ -1237,18 +1484,18 @@ def search_linkedin_advanced(driver, wait, username):
                     connections_elem = driver.find_element(By.CSS_SELECTOR, '.t-bold')
                     if 'connections' in connections_elem.text.lower():
                         results['data']['connections'] = connections_elem.text.strip()
-                except:
+                except Exception:
                     pass
                 
                 # Ambil foto profil
                 try:
                     img_elem = driver.find_element(By.CSS_SELECTOR, '.pv-top-card-profile-picture__image')
                     results['data']['profile_image'] = img_elem.get_attribute('src')
-                except:
+                except Exception:
                     pass
                     
             except Exception as e:
-                logger.warning(f"Error extracting LinkedIn profile details: {str(e)}")
+                logger.warning("Error extracting LinkedIn profile details: %s", e)
                 
         else:
             # Jika profil tidak ditemukan, coba cari melalui pencarian LinkedIn
@@ -1271,23 +1518,23 @@ def search_linkedin_advanced(driver, wait, username):
                 try:
                     headline = driver.find_element(By.CSS_SELECTOR, '.entity-result__primary-subtitle').text.strip()
                     results['data']['headline'] = headline
-                except:
+                except Exception:
                     pass
                     
                 # Ambil lokasi dari hasil pencarian
                 try:
                     location = driver.find_element(By.CSS_SELECTOR, '.entity-result__secondary-subtitle').text.strip()
                     results['data']['location'] = location
-                except:
+                except Exception:
                     pass
-            except:
+            except Exception:
                 results['error'] = 'Profil tidak ditemukan'
                 
     except Exception as e:
-        logger.error(f"Error in LinkedIn search: {str(e)}")
+        logger.error("Error in LinkedIn search: %s", e)
         results['error'] = f"Terjadi error: {str(e)}"
         
-    return results
+    return SearchResult.from_dict('LinkedIn', results)
 
 def search_twitter_advanced(driver, wait, username):
     """Pencarian advanced untuk Twitter"""
@@ -1315,11 +1562,11 @@ def search_twitter_advanced(driver, wait, username):
             
             try:
                 results['data']['name'] = driver.find_element('css selector', 'div[data-testid="UserName"] span').text.strip()
-            except: pass
+            except Exception: pass
             
             try:
                 results['data']['bio'] = driver.find_element('css selector', 'div[data-testid="UserDescription"]').text.strip()
-            except: pass
+            except Exception: pass
             
             # Default ke public karena Twitter profiles biasanya public
             results['data']['status'] = 'public'
@@ -1335,15 +1582,19 @@ def search_twitter_advanced(driver, wait, username):
                         results['data']['following'] = text.split()[0]
                     elif 'tweets' in text:
                         results['data']['tweets'] = text.split()[0]
-            except: pass
+            except Exception: pass
             
         except TimeoutException:
-            results['error'] = "Halaman tidak dapat dimuat"
+            if "This account doesn’t exist" in driver.page_source:
+                results['data']['status'] = 'not_found'
+                results['error'] = f"Profil Twitter @{username} tidak ditemukan"
+            else:
+                results['error'] = "Halaman tidak dapat dimuat"
             
     except Exception as e:
         results['error'] = str(e)
         
-    return results
+    return SearchResult.from_dict('Twitter', results)
 
 def search_facebook_advanced(driver, wait, username):
     """
@@ -1376,7 +1627,7 @@ def search_facebook_advanced(driver, wait, username):
                 # Coba ambil nama
                 name_element = wait.until(EC.presence_of_element_located((By.XPATH, "//h1")))
                 results['data']['name'] = name_element.text.strip()
-            except:
+            except Exception:
                 results['data']['name'] = "Tidak ditemukan"
                 
             try:
@@ -1391,7 +1642,7 @@ def search_facebook_advanced(driver, wait, username):
                     location_elements = driver.find_elements(By.XPATH, "//div[contains(text(), 'Kota') or contains(text(), 'City')]")
                     if location_elements:
                         results['data']['location'] = location_elements[0].text.replace("Kota ", "").replace("City ", "").strip()
-            except:
+            except Exception:
                 results['data']['location'] = "Tidak ditemukan"
                 
             try:
@@ -1406,7 +1657,7 @@ def search_facebook_advanced(driver, wait, username):
                     work_elements = driver.find_elements(By.XPATH, "//div[contains(text(), 'Pekerjaan') or contains(text(), 'Work')]")
                     if work_elements:
                         results['data']['work'] = work_elements[0].text.replace("Pekerjaan ", "").replace("Work ", "").strip()
-            except:
+            except Exception:
                 results['data']['work'] = "Tidak ditemukan"
                 
             try:
@@ -1421,7 +1672,7 @@ def search_facebook_advanced(driver, wait, username):
                     edu_elements = driver.find_elements(By.XPATH, "//div[contains(text(), 'Pendidikan') or contains(text(), 'Education')]")
                     if edu_elements:
                         results['data']['education'] = edu_elements[0].text.replace("Pendidikan ", "").replace("Education ", "").strip()
-            except:
+            except Exception:
                 results['data']['education'] = "Tidak ditemukan"
                 
             try:
@@ -1435,7 +1686,7 @@ def search_facebook_advanced(driver, wait, username):
                         results['data']['friends'] = "Tidak dapat dilihat"
                 else:
                     results['data']['friends'] = "Tidak dapat dilihat"
-            except:
+            except Exception:
                 results['data']['friends'] = "Tidak dapat dilihat"
                 
             # Cek status profil (public/private)
@@ -1444,7 +1695,7 @@ def search_facebook_advanced(driver, wait, username):
                     results['data']['status'] = "private"
                 else:
                     results['data']['status'] = "public"
-            except:
+            except Exception:
                 results['data']['status'] = "unknown"
                 
         # 2. Jika tidak ditemukan, coba cari dengan nama
@@ -1479,19 +1730,19 @@ def search_facebook_advanced(driver, wait, username):
                                 location_elements = driver.find_elements(By.XPATH, "//div[contains(text(), 'Tinggal di')]")
                                 if location_elements:
                                     profile_data['location'] = location_elements[0].text.replace("Tinggal di ", "").strip()
-                            except: pass
+                            except Exception: pass
                             
                             try:
                                 work_elements = driver.find_elements(By.XPATH, "//div[contains(text(), 'Bekerja di')]")
                                 if work_elements:
                                     profile_data['work'] = work_elements[0].text.replace("Bekerja di ", "").strip()
-                            except: pass
+                            except Exception: pass
                             
                             try:
                                 edu_elements = driver.find_elements(By.XPATH, "//div[contains(text(), 'Bersekolah di')]")
                                 if edu_elements:
                                     profile_data['education'] = edu_elements[0].text.replace("Bersekolah di ", "").strip()
-                            except: pass
+                            except Exception: pass
                             
                             try:
                                 friends_element = driver.find_elements(By.XPATH, "//div[contains(text(), 'teman')]")
@@ -1499,12 +1750,12 @@ def search_facebook_advanced(driver, wait, username):
                                     friends_count = re.search(r'\d+', friends_element[0].text)
                                     if friends_count:
                                         profile_data['friends'] = friends_count.group()
-                            except: pass
+                            except Exception: pass
                             
                             results['related_accounts'].append(profile_data)
                             
                     except Exception as profile_error:
-                        logger.error(f"Error processing profile: {str(profile_error)}")
+                        logger.error("Error processing profile: %s", profile_error)
                         continue
                         
                 if results['related_accounts']:
@@ -1514,15 +1765,15 @@ def search_facebook_advanced(driver, wait, username):
                         results['data'] = results['related_accounts'][0]
                         
             except Exception as search_error:
-                logger.error(f"Error in search method: {str(search_error)}")
+                logger.error("Error in search method: %s", search_error)
                 results['error'] = "Gagal melakukan pencarian"
                 
     except Exception as e:
-        logger.error(f"Error in Facebook advanced search: {str(e)}")
+        logger.error("Error in Facebook advanced search: %s", e)
         results['error'] = "Terjadi kesalahan saat mencari profil"
         
     finally:
-        return results
+        return SearchResult.from_dict('Facebook', results)
 
 def search_github_advanced(driver, wait, username):
     """Pencarian advanced untuk GitHub"""
@@ -1546,12 +1797,16 @@ def search_github_advanced(driver, wait, username):
             results['data'] = profile_data
             
         except TimeoutException:
-            results['error'] = "Halaman tidak dapat dimuat"
+            if 'Page not found' in driver.title:
+                results['data'] = {'username': username, 'url': url, 'status': 'not_found'}
+                results['error'] = f"Profil GitHub @{username} tidak ditemukan"
+            else:
+                results['error'] = "Halaman tidak dapat dimuat"
             
     except Exception as e:
         results['error'] = str(e)
         
-    return results
+    return SearchResult.from_dict('GitHub', results)
 
 def extract_twitter_data(data):
     """
@@ -1561,7 +1816,7 @@ def extract_twitter_data(data):
         if not data:
             return None
             
-        result = {
+        return ProfileResult.from_dict({
             'username': data.get('screen_name', ''),
             'name': data.get('name', ''),
             'bio': data.get('description', ''),
@@ -1571,13 +1826,12 @@ def extract_twitter_data(data):
             'verified': data.get('verified', False),
             'created_at': data.get('created_at', ''),
             'location': data.get('location', ''),
-            'url': f"https://twitter.com/{data.get('screen_name', '')}"
-        }
-        
-        return result
+            'url': f"https://twitter.com/{data.get('screen_name', '')}",
+            'source': 'api'
+        })
         
     except Exception as e:
-        logger.error(f"Error extracting Twitter data: {str(e)}")
+        logger.error("Error extracting Twitter data: %s", e)
         return None
 
 def search_linkedin_selenium(driver, wait, full_name):
@@ -1616,7 +1870,7 @@ def search_linkedin_selenium(driver, wait, full_name):
     except Exception as e:
         results['error'] = str(e)
         
-    return results
+    return SearchResult.from_dict('LinkedIn', results)
 
 def format_detailed_results(results):
     """Format hasil pencarian detail"""
@@ -1624,43 +1878,43 @@ def format_detailed_results(results):
         text = "📊 *HASIL DETAIL PENCARIAN*\n"
         text += "━━━━━━━━━━━━━━━\n\n"
         
-        if results.get('found'):
-            profile = results.get('data', {})
+        if results.found:
+            profile = results.profile
             
             # Info Dasar
             text += "👤 *INFO DASAR*\n"
-            if profile.get('username'):
-                text += f"• Username: `{escape_markdown(profile['username'])}`\n"
-            if profile.get('name'):
-                text += f"• Nama: `{escape_markdown(profile['name'])}`\n"
-            if profile.get('url'):
-                text += f"• URL: `{escape_markdown(profile['url'])}`\n"
-            if profile.get('status'):
-                icon = "🔒" if profile['status'].lower() == 'private' else "🔓"
-                text += f"• Status: {icon} `{escape_markdown(profile['status'])}`\n"
+            if profile.username:
+                text += f"• Username: `{escape_markdown(profile.username)}`\n"
+            if profile.name:
+                text += f"• Nama: `{escape_markdown(profile.name)}`\n"
+            if profile.url:
+                text += f"• URL: `{escape_markdown(profile.url)}`\n"
+            if profile.status:
+                icon = "🔒" if profile.status.lower() == 'private' else "🔓"
+                text += f"• Status: {icon} `{escape_markdown(profile.status)}`\n"
             text += "\n"
             
             # Bio & Deskripsi
-            if profile.get('bio'):
+            if profile.bio:
                 text += "📝 *BIO/DESKRIPSI*\n"
-                text += f"`{escape_markdown(profile['bio'])}`\n\n"
+                text += f"`{escape_markdown(profile.bio)}`\n\n"
             
             # Statistik
             stats = []
-            if profile.get('followers'): stats.append(f"👥 Followers: {profile['followers']}")
-            if profile.get('following'): stats.append(f"👣 Following: {profile['following']}")
-            if profile.get('posts'): stats.append(f"📱 Posts: {profile['posts']}")
-            if profile.get('friends'): stats.append(f"👥 Friends: {profile['friends']}")
-            if profile.get('tweets'): stats.append(f"🐦 Tweets: {profile['tweets']}")
+            if profile.followers: stats.append(f"👥 Followers: {profile.followers}")
+            if profile.following: stats.append(f"👣 Following: {profile.following}")
+            if profile.posts: stats.append(f"📱 Posts: {profile.posts}")
+            if profile.friends: stats.append(f"👥 Friends: {profile.friends}")
+            if profile.tweets: stats.append(f"🐦 Tweets: {profile.tweets}")
             
             if stats:
                 text += "📊 *STATISTIK*\n"
                 text += "• " + "\n• ".join([f"`{escape_markdown(stat)}`" for stat in stats]) + "\n\n"
             
             # Metadata tambahan
-            if profile.get('metadata'):
+            if results.metadata:
                 text += "ℹ️ *METADATA TAMBAHAN*\n"
-                for key, value in profile['metadata'].items():
+                for key, value in results.metadata.items():
                     if isinstance(value, dict):
                         text += f"• {key}:\n"
                         for k, v in value.items():
@@ -1670,52 +1924,96 @@ def format_detailed_results(results):
                 text += "\n"
             
             # Kemungkinan profil terkait
-            if profile.get('possible_matches'):
+            if results.possible_matches:
                 text += "🔍 *PROFIL TERKAIT*\n"
-                for match in profile['possible_matches'][:3]:
-                    text += f"• Username: `{escape_markdown(match.get('username', ''))}`\n"
-                    if match.get('url'): 
-                        text += f"  URL: `{escape_markdown(match['url'])}`\n"
+                for match in results.possible_matches[:3]:
+                    text += f"• Username: `{escape_markdown(match.username or '')}`\n"
+                    if match.url: 
+                        text += f"  URL: `{escape_markdown(match.url)}`\n"
                 text += "\n"
                 
         else:
             text += "❌ *PROFIL TIDAK DITEMUKAN*\n"
-            if results.get('error'):
-                text += f"\n⚠️ *Error:* `{escape_markdown(results['error'])}`\n"
+            if results.error:
+                text += f"\n⚠️ *Error:* `{escape_markdown(results.error)}`\n"
             
         return text
     except Exception as e:
-        logger.error(f"Error formatting detailed results: {str(e)}")
+        logger.error("Error formatting detailed results: %s", e)
         return "❌ *Terjadi kesalahan saat memformat hasil detail*"
 
+# Parse mode per jenis hasil pencarian
+RESULT_PARSE_MODES = {
+    'profile': 'MarkdownV2',
+    'name': 'MarkdownV2',
+    'deep': 'MarkdownV2'
+}
+
+def build_result_keyboard(result_id, detail=True, page=0, page_count=1):
+    """Bangun tombol aksi (dan navigasi halaman) untuk hasil pencarian yang tersimpan"""
+    keyboard = []
+    if page_count > 1:
+        navigation = []
+        if page > 0:
+            navigation.append(InlineKeyboardButton("◀️", callback_data=f'page:{result_id}:{page - 1}'))
+        if page < page_count - 1:
+            navigation.append(InlineKeyboardButton("▶️", callback_data=f'page:{result_id}:{page + 1}'))
+        keyboard.append(navigation)
+        
+    actions = [InlineKeyboardButton("🔄 Refresh", callback_data=f'refresh:{result_id}')]
+    if detail:
+        actions.append(InlineKeyboardButton("📊 Detail", callback_data=f'detail:{result_id}'))
+    keyboard.append(actions)
+    keyboard.append([InlineKeyboardButton("🏠 Menu Utama", callback_data='menu')])
+    return InlineKeyboardMarkup(keyboard)
+
+def run_stored_search(entry):
+    """Jalankan ulang pencarian dari entry result store"""
+    if entry['kind'] == 'profile':
+        return PROFILE_SEARCHERS[entry['platform']](entry['query'])
+    if entry['kind'] == 'name':
+        return search_name_across_platforms(entry['query'])
+    return deep_osint_search(entry['query'])
+
+def render_result_pages(entry):
+    """Render semua halaman teks untuk entry result store"""
+    if entry['kind'] == 'profile':
+        return [format_search_results(entry['results'], entry['platform'])]
+    if entry['kind'] == 'name':
+        return paginate_blocks(NAME_SEARCH_HEADER, render_name_search_blocks(entry['results']))
+    header = f"🔎 *HASIL DEEP SEARCH:* `{escape_markdown(entry['query'])}`\n\n"
+    return paginate_blocks(header, render_deep_search_blocks(entry['results']))
+
+def publish_result_pages(result_id):
+    """
+    Pre-render halaman hasil sekali saat pencarian selesai dan simpan di result store,
+    jadi pindah halaman cukup edit_message_text dari cache.
+    """
+    entry = result_store.get(result_id)
+    texts = render_result_pages(entry)
+    # Tampilan detail cuma ada untuk hasil pencarian satu profil
+    detail = entry['kind'] == 'profile'
+    pages = [
+        (text, build_result_keyboard(result_id, detail=detail, page=index, page_count=len(texts)))
+        for index, text in enumerate(texts)
+    ]
+    result_store.set_pages(result_id, pages)
+    return pages
+
+def send_screen(message, screen):
+    """Kirim layar statis sebagai pesan baru"""
+    return message.reply_text(screen.text, reply_markup=screen.reply_markup, parse_mode=screen.parse_mode)
+
+def show_screen(query, screen):
+    """Tampilkan layar statis dengan mengedit pesan callback"""
+    query.edit_message_text(text=screen.text, reply_markup=screen.reply_markup, parse_mode=screen.parse_mode)
+
+@instrument_handler
 def start(update, context):
     """Handler untuk command /start"""
-    keyboard = [
-        [
-            InlineKeyboardButton("🔍 Sosmed Finder", callback_data='sosmed_finder'),
-            InlineKeyboardButton("👥 Cari Nama", callback_data='search_name')
-        ],
-        [
-            InlineKeyboardButton("🌐 Basic OSINT", callback_data='basic_osint'),
-            InlineKeyboardButton("⚙️ Advanced", callback_data='advanced')
-        ],
-        [
-            InlineKeyboardButton("ℹ️ Help", callback_data='help')
-        ]
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    
-    update.message.reply_text(
-        "*🤖 SELAMAT DATANG DI OSINT BOT*\n\n"
-        "Bot ini akan membantu Anda mencari informasi tentang:\n"
-        "• Username di berbagai platform\n"
-        "• Nama lengkap seseorang\n"
-        "• Data OSINT dasar\n\n"
-        "Silakan pilih menu di bawah ini:",
-        parse_mode='MarkdownV2',
-        reply_markup=reply_markup
-    )
+    send_screen(update.message, START_SCREEN)
 
+@instrument_handler
 def help_command(update, context):
     """Handler untuk command /help"""
     update.message.reply_text(
@@ -1734,6 +2032,7 @@ def help_command(update, context):
         parse_mode='MarkdownV2'
     )
 
+@instrument_handler
 def facebook_search(update, context):
     """Handler untuk command /f"""
     if len(context.args) < 1:
@@ -1746,36 +2045,39 @@ def facebook_search(update, context):
         return
         
     username = context.args[0]
+    token_id, token = cancel_registry.create(owner=update.effective_user.id)
     temp_message = update.message.reply_text(
         f"🔍 *Mencari profil Facebook:* `{escape_markdown(username)}`\\.\\.\\.",
-        parse_mode='MarkdownV2'
+        parse_mode='MarkdownV2',
+        reply_markup=cancel_keyboard(token_id)
     )
     
     try:
-        results = search_facebook(username)
-        formatted_results = format_search_results(results, "Facebook")
-        
-        keyboard = [
-            [
-                InlineKeyboardButton("🔄 Refresh", callback_data=f'refresh_fb_{username}'),
-                InlineKeyboardButton("📊 Detail", callback_data=f'detail_fb_{username}')
-            ],
-            [InlineKeyboardButton("🏠 Menu Utama", callback_data='menu')]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        temp_message.edit_text(
-            formatted_results,
-            parse_mode='MarkdownV2',
-            reply_markup=reply_markup
-        )
+        with use_cancel_token(token):
+            results = search_facebook(username)
+        token.check()
+        result_id = result_store.put('profile', username, results, platform="Facebook")
+        with track_stage('format', "Facebook"):
+            formatted_results, reply_markup = publish_result_pages(result_id)[0]
+        
+        with track_stage('telegram_send', "Facebook"):
+            temp_message.edit_text(
+                formatted_results,
+                parse_mode='MarkdownV2',
+                reply_markup=reply_markup
+            )
+    except Cancelled:
+        logger.info("Facebook search cancelled: %s", username)
     except Exception as e:
-        logger.error(f"Error in Facebook search: {str(e)}")
+        logger.error("Error in Facebook search: %s", e)
         temp_message.edit_text(
             f"❌ *Terjadi kesalahan:* `{escape_markdown(str(e))}`",
             parse_mode='MarkdownV2'
         )
+    finally:
+        cancel_registry.discard(token_id)
 
+@instrument_handler
 def instagram_search(update, context):
     """Handler untuk command /i"""
     if len(context.args) < 1:
@@ -1788,36 +2090,39 @@ def instagram_search(update, context):
         return
         
     username = context.args[0]
+    token_id, token = cancel_registry.create(owner=update.effective_user.id)
     temp_message = update.message.reply_text(
         f"🔍 *Mencari profil Instagram:* `{escape_markdown(username)}`\\.\\.\\.",
-        parse_mode='MarkdownV2'
+        parse_mode='MarkdownV2',
+        reply_markup=cancel_keyboard(token_id)
     )
     
     try:
-        results = search_instagram(username)
-        formatted_results = format_search_results(results, "Instagram")
-        
-        keyboard = [
-            [
-                InlineKeyboardButton("🔄 Refresh", callback_data=f'refresh_ig_{username}'),
-                InlineKeyboardButton("📊 Detail", callback_data=f'detail_ig_{username}')
-            ],
-            [InlineKeyboardButton("🏠 Menu Utama", callback_data='menu')]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        temp_message.edit_text(
-            formatted_results,
-            parse_mode='MarkdownV2',
-            reply_markup=reply_markup
-        )
+        with use_cancel_token(token):
+            results = search_instagram(username)
+        token.check()
+        result_id = result_store.put('profile', username, results, platform="Instagram")
+        with track_stage('format', "Instagram"):
+            formatted_results, reply_markup = publish_result_pages(result_id)[0]
+        
+        with track_stage('telegram_send', "Instagram"):
+            temp_message.edit_text(
+                formatted_results,
+                parse_mode='MarkdownV2',
+                reply_markup=reply_markup
+            )
+    except Cancelled:
+        logger.info("Instagram search cancelled: %s", username)
     except Exception as e:
-        logger.error(f"Error in Instagram search: {str(e)}")
+        logger.error("Error in Instagram search: %s", e)
         temp_message.edit_text(
             f"❌ *Terjadi kesalahan:* `{escape_markdown(str(e))}`",
             parse_mode='MarkdownV2'
         )
+    finally:
+        cancel_registry.discard(token_id)
 
+@instrument_handler
 def twitter_search(update, context):
     """Handler untuk command /t"""
     if len(context.args) < 1:
@@ -1830,423 +2135,130 @@ def twitter_search(update, context):
         return
         
     username = context.args[0]
+    token_id, token = cancel_registry.create(owner=update.effective_user.id)
     temp_message = update.message.reply_text(
         f"🔍 *Mencari profil Twitter:* `{escape_markdown(username)}`\\.\\.\\.",
-        parse_mode='MarkdownV2'
+        parse_mode='MarkdownV2',
+        reply_markup=cancel_keyboard(token_id)
     )
     
     try:
-        results = search_twitter(username)
-        formatted_results = format_search_results(results, "Twitter")
-        
-        keyboard = [
-            [
-                InlineKeyboardButton("🔄 Refresh", callback_data=f'refresh_tw_{username}'),
-                InlineKeyboardButton("📊 Detail", callback_data=f'detail_tw_{username}')
-            ],
-            [InlineKeyboardButton("🏠 Menu Utama", callback_data='menu')]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        temp_message.edit_text(
-            formatted_results,
-            parse_mode='MarkdownV2',
-            reply_markup=reply_markup
-        )
+        with use_cancel_token(token):
+            results = search_twitter(username)
+        token.check()
+        result_id = result_store.put('profile', username, results, platform="Twitter")
+        with track_stage('format', "Twitter"):
+            formatted_results, reply_markup = publish_result_pages(result_id)[0]
+        
+        with track_stage('telegram_send', "Twitter"):
+            temp_message.edit_text(
+                formatted_results,
+                parse_mode='MarkdownV2',
+                reply_markup=reply_markup
+            )
+    except Cancelled:
+        logger.info("Twitter search cancelled: %s", username)
     except Exception as e:
-        logger.error(f"Error in Twitter search: {str(e)}")
+        logger.error("Error in Twitter search: %s", e)
         temp_message.edit_text(
             f"❌ *Terjadi kesalahan:* `{escape_markdown(str(e))}`",
             parse_mode='MarkdownV2'
         )
+    finally:
+        cancel_registry.discard(token_id)
 
+@instrument_handler
 def menu_command(update, context):
     """Menampilkan menu utama bot"""
-    keyboard = [
-        [
-            InlineKeyboardButton("🔍 Sosmed Finder", callback_data='sosmed_finder'),
-            InlineKeyboardButton("👥 Cari Nama", callback_data='search_name')
-        ],
-        [
-            InlineKeyboardButton("🌐 Basic OSINT", callback_data='basic_osint'),
-            InlineKeyboardButton("⚙️ Advanced", callback_data='advanced')
-        ],
-        [
-            InlineKeyboardButton("ℹ️ Help", callback_data='help')
-        ]
-    ]
+    send_screen(update.message, COMMAND_MENU_SCREEN)
+
+def handle_static_screen(query, context):
+    """Callback untuk layar statis yang sudah di-prebuild"""
+    show_screen(query, STATIC_SCREENS[query.data])
+
+def handle_result_action(query, context):
+    """Callback Refresh/Detail untuk hasil yang tersimpan di result store"""
+    action, result_id = query.data.split(':', 1)
+    entry = result_store.get(result_id)
     
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    text = (
-        "*🤖 OSINT BOT MENU*\n\n"
-        "*Basic Commands:*\n"
-        "• /cari [query] - Pencarian umum\n"
-        "• /ig [username] - Cek Instagram\n"
-        "• /email [email] - Validasi email\n"
-        "• /deep [query] - Deep OSINT search\n\n"
-        "*Advanced Commands:*\n"
-        "• /scan [domain/IP] - Advanced scanning\n"
-        "• /breach [email] - Cek data breach\n"
-        "• /domain [domain] - Domain intelligence\n"
-        "• /phone [nomor] - Phone intelligence\n\n"
-        "Pilih menu di bawah untuk informasi lebih lanjut 👇"
-    )
+    if not entry:
+        show_screen(query, EXPIRED_RESULT_SCREEN)
+        return
     
-    update.message.reply_text(text, reply_markup=reply_markup, parse_mode='Markdown')
+    if action == 'refresh':
+        # Cuma Refresh yang memicu pencarian baru ke upstream
+        results = run_stored_search(entry)
+        result_store.update(result_id, results)
+        formatted_results, reply_markup = publish_result_pages(result_id)[0]
+        parse_mode = RESULT_PARSE_MODES[entry['kind']]
+        
+    else:
+        # Detail dirender langsung dari hasil yang sudah ada
+        formatted_results = format_detailed_results(entry['results'])
+        parse_mode = 'MarkdownV2'
+        reply_markup = build_result_keyboard(result_id, detail=False)
+        
+    query.edit_message_text(text=formatted_results, reply_markup=reply_markup, parse_mode=parse_mode)
 
+def handle_result_page(query, context):
+    """Callback navigasi halaman hasil, langsung dari halaman yang sudah di-render"""
+    _, result_id, page = query.data.split(':')
+    entry = result_store.get(result_id)
+    
+    if not entry or not entry['pages']:
+        show_screen(query, EXPIRED_RESULT_SCREEN)
+        return
+        
+    page = min(int(page), len(entry['pages']) - 1)
+    formatted_results, reply_markup = entry['pages'][page]
+    query.edit_message_text(
+        text=formatted_results,
+        reply_markup=reply_markup,
+        parse_mode=RESULT_PARSE_MODES[entry['kind']]
+    )
+
+def cancel_keyboard(token_id):
+    """Tombol Cancel untuk pesan status pencarian yang sedang berjalan"""
+    return InlineKeyboardMarkup([[InlineKeyboardButton("❌ Cancel", callback_data=f'cancel:{token_id}')]])
+
+def handle_cancel(query, context):
+    """Callback tombol Cancel: batalkan pencarian milik user ini"""
+    token_id = query.data.split(':', 1)[1]
+    if cancel_registry.cancel(token_id, query.from_user.id):
+        query.edit_message_text("❌ Pencarian dibatalkan.")
+
+# Route table callback: exact match dulu, lalu prefix
+CALLBACK_ROUTES = {data: handle_static_screen for data in STATIC_SCREENS}
+CALLBACK_PREFIX_ROUTES = (
+    ('refresh:', handle_result_action),
+    ('detail:', handle_result_action),
+    ('page:', handle_result_page),
+    ('cancel:', handle_cancel)
+)
+
+def route_callback(data):
+    """Cari handler untuk callback data, None kalau tidak ada yang cocok"""
+    handler = CALLBACK_ROUTES.get(data)
+    if handler:
+        return handler
+    for prefix, handler in CALLBACK_PREFIX_ROUTES:
+        if data.startswith(prefix):
+            return handler
+    return None
+
+@instrument_handler
 def button(update, context):
     """Handle button clicks"""
     query = update.callback_query
     query.answer()
     
-    # Menu Sosmed Finder
-    if query.data == 'sosmed_finder':
-        text = (
-            "*🔍 SOSMED FINDER*\n\n"
-            "Pilih platform untuk mencari username:\n\n"
-            "• `/f username` - Cari di Facebook\n"
-            "• `/i username` - Cari di Instagram\n"
-            "• `/t username` - Cari di Twitter\n"
-            "• `/g username` - Cari di GitHub\n"
-            "• `/l username` - Cari di LinkedIn\n\n"
-            "Contoh: `/i johndoe`"
-        )
-        keyboard = [
-            [
-                InlineKeyboardButton("Facebook", callback_data='search_fb'),
-                InlineKeyboardButton("Instagram", callback_data='search_ig')
-            ],
-            [
-                InlineKeyboardButton("Twitter", callback_data='search_tw'),
-                InlineKeyboardButton("GitHub", callback_data='search_gh')
-            ],
-            [
-                InlineKeyboardButton("LinkedIn", callback_data='search_li'),
-                InlineKeyboardButton("🔙 Kembali", callback_data='menu')
-            ]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        query.edit_message_text(text=text, reply_markup=reply_markup, parse_mode='Markdown')
-
-    # Menu Utama
-    elif query.data == 'menu':
-        keyboard = [
-            [
-                InlineKeyboardButton("🔍 Sosmed Finder", callback_data='sosmed_finder'),
-                InlineKeyboardButton("👥 Cari Nama", callback_data='search_name')
-            ],
-            [
-                InlineKeyboardButton("🌐 Basic OSINT", callback_data='basic_osint'),
-                InlineKeyboardButton("⚙️ Advanced", callback_data='advanced')
-            ],
-            [
-                InlineKeyboardButton("ℹ️ Help", callback_data='help')
-            ]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        text = (
-            "*🤖 SELAMAT DATANG DI OSINT BOT*\n\n"
-            "Bot ini akan membantu Anda mencari informasi tentang:\n"
-            "• Username di berbagai platform\n"
-            "• Nama lengkap seseorang\n"
-            "• Data OSINT dasar\n\n"
-            "Silakan pilih menu di bawah ini:"
-        )
-        query.edit_message_text(text=text, reply_markup=reply_markup, parse_mode='Markdown')
-
-    # Menu Pencarian Nama
-    elif query.data == 'search_name':
-        text = (
-            "*🔍 PENCARIAN NAMA*\n\n"
-            "Untuk memulai pencarian nama, gunakan format berikut:\n\n"
-            "• `/nama John Doe` - Contoh: `/nama Steve Jobs`\n\n"
-            "*Informasi yang akan didapat:*\n"
-            "• Nama lengkap\n"
-            "• Lokasi\n"
-            "• Pekerjaan\n"
-            "• Pendidikan\n"
-            "• Social Media\n"
-            "• Status profil"
-        )
-        keyboard = [
-            [
-                InlineKeyboardButton("📖 Tutorial", callback_data='tutorial_name'),
-                InlineKeyboardButton("❓ FAQ", callback_data='faq_name')
-            ],
-            [
-                InlineKeyboardButton("🏠 Kembali ke Menu Utama", callback_data='menu')
-            ]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        query.edit_message_text(text=text, reply_markup=reply_markup, parse_mode='Markdown')
-
-    # Handle tombol pencarian platform spesifik
-    elif query.data.startswith('search_'):
-        platform = query.data.split('_')[1]
-        text = (
-            f"*🔍 PENCARIAN DI {platform.upper()}*\n\n"
-            "Untuk memulai pencarian, kirim username dengan format:\n\n"
-        )
-        
-        if platform == 'fb':
-            text += "• `/f username` - Contoh: `/f johndoe`\n\n"
-            text += "*Informasi yang akan didapat:*\n"
-            text += "• Nama lengkap\n• Lokasi\n• Pekerjaan\n• Pendidikan\n• Jumlah teman\n• Status profil"
-        elif platform == 'ig':
-            text += "• `/i username` - Contoh: `/i johndoe`\n\n"
-            text += "*Informasi yang akan didapat:*\n"
-            text += "• Nama lengkap\n• Bio\n• Jumlah followers\n• Jumlah following\n• Jumlah post\n• Status profil"
-        elif platform == 'tw':
-            text += "• `/t username` - Contoh: `/t johndoe`\n\n"
-            text += "*Informasi yang akan didapat:*\n"
-            text += "• Nama lengkap\n• Bio\n• Jumlah followers\n• Jumlah following\n• Jumlah tweets\n• Status verifikasi"
-        elif platform == 'gh':
-            text += "• `/g username` - Contoh: `/g johndoe`\n\n"
-            text += "*Informasi yang akan didapat:*\n"
-            text += "• Nama lengkap\n• Bio\n• Repositories\n• Followers\n• Following\n• Kontribusi"
-        elif platform == 'li':
-            text += "• `/l username` - Contoh: `/l johndoe`\n\n"
-            text += "*Informasi yang akan didapat:*\n"
-            text += "• Nama lengkap\n• Headline\n• Pengalaman\n• Pendidikan\n• Skills\n• Koneksi"
-            
-        keyboard = [
-            [
-                InlineKeyboardButton("📖 Tutorial", callback_data=f'tutorial_{platform}'),
-                InlineKeyboardButton("❓ FAQ", callback_data=f'faq_{platform}')
-            ],
-            [
-                InlineKeyboardButton("🔙 Kembali", callback_data='sosmed_finder'),
-                InlineKeyboardButton("🏠 Menu Utama", callback_data='menu')
-            ]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        query.edit_message_text(text=text, reply_markup=reply_markup, parse_mode='Markdown')
-
-    # Handle tutorial untuk setiap platform
-    elif query.data.startswith('tutorial_'):
-        platform = query.data.split('_')[1]
-        text = f"*📖 TUTORIAL PENCARIAN {platform.upper()}*\n\n"
-        
-        if platform == 'fb':
-            text += (
-                "*Langkah-langkah:*\n"
-                "1. Gunakan command `/f username`\n"
-                "2. Username bisa berupa:\n"
-                "   • Username Facebook\n"
-                "   • Nama profil\n"
-                "   • ID Facebook\n\n"
-                "*Tips:*\n"
-                "• Pastikan username sudah benar\n"
-                "• Coba variasi username\n"
-                "• Gunakan nama lengkap jika perlu"
-            )
-        elif platform == 'ig':
-            text += (
-                "*Langkah-langkah:*\n"
-                "1. Gunakan command `/i username`\n"
-                "2. Username harus:\n"
-                "   • Tanpa karakter @\n"
-                "   • Tanpa spasi\n"
-                "   • Sesuai profil Instagram\n\n"
-                "*Tips:*\n"
-                "• Cek spelling username\n"
-                "• Perhatikan underscore (_)\n"
-                "• Coba cari di bio Instagram"
-            )
-        elif platform == 'tw':
-            text += (
-                "*Langkah-langkah:*\n"
-                "1. Gunakan command `/t username`\n"
-                "2. Username Twitter:\n"
-                "   • Tanpa @\n"
-                "   • Case sensitive\n"
-                "   • Max 15 karakter\n\n"
-                "*Tips:*\n"
-                "• Cek handle Twitter\n"
-                "• Perhatikan huruf besar/kecil\n"
-                "• Cari di bio Twitter"
-            )
-        elif platform == 'gh':
-            text += (
-                "*Langkah-langkah:*\n"
-                "1. Gunakan command `/g username`\n"
-                "2. Username GitHub:\n"
-                "   • Case sensitive\n"
-                "   • Tanpa spasi\n"
-                "   • Alfanumerik & dash\n\n"
-                "*Tips:*\n"
-                "• Cek URL GitHub\n"
-                "• Lihat kontributor repo\n"
-                "• Cari di organisasi"
-            )
-        elif platform == 'li':
-            text += (
-                "*Langkah-langkah:*\n"
-                "1. Gunakan command `/l username`\n"
-                "2. Username LinkedIn:\n"
-                "   • Dari URL profil\n"
-                "   • Nama-nama profil\n"
-                "   • Email profil\n\n"
-                "*Tips:*\n"
-                "• Gunakan nama lengkap\n"
-                "• Cek URL profil\n"
-                "• Cari di perusahaan"
-            )
-            
-        keyboard = [
-            [
-                InlineKeyboardButton("🔍 Mulai Cari", callback_data=f'search_{platform}'),
-                InlineKeyboardButton("❓ FAQ", callback_data=f'faq_{platform}')
-            ],
-            [
-                InlineKeyboardButton("🔙 Kembali", callback_data=f'search_{platform}'),
-                InlineKeyboardButton("🏠 Menu Utama", callback_data='menu')
-            ]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        query.edit_message_text(text=text, reply_markup=reply_markup, parse_mode='Markdown')
-
-    # Handle FAQ untuk setiap platform
-    elif query.data.startswith('faq_'):
-        platform = query.data.split('_')[1]
-        text = f"*❓ FAQ PENCARIAN {platform.upper()}*\n\n"
-        
-        if platform == 'fb':
-            text += (
-                "*Q: Mengapa profil tidak ditemukan?*\n"
-                "A: • Profil mungkin private\n"
-                "   • Username salah\n"
-                "   • Profil sudah dihapus\n\n"
-                "*Q: Apakah bisa cari dengan email?*\n"
-                "A: Ya, gunakan format `/f email@domain.com`\n\n"
-                "*Q: Data apa saja yang bisa didapat?*\n"
-                "A: • Info profil dasar\n"
-                "   • Foto profil (jika public)\n"
-                "   • Status aktivitas\n"
-                "   • Informasi publik lainnya"
-            )
-        elif platform == 'ig':
-            text += (
-                "*Q: Profil private bisa dicek?*\n"
-                "A: Hanya info dasar yang tersedia\n\n"
-                "*Q: Bisa lihat story/highlight?*\n"
-                "A: Tidak, hanya info profil publik\n\n"
-                "*Q: Berapa lama hasil search valid?*\n"
-                "A: Data real-time saat pencarian\n\n"
-                "*Q: Bisa cari dengan nama lengkap?*\n"
-                "A: Gunakan `/cari` untuk pencarian nama"
-            )
-        elif platform == 'tw':
-            text += (
-                "*Q: Akun suspended bisa dicek?*\n"
-                "A: Tidak, hanya akun aktif\n\n"
-                "*Q: Bisa lihat tweet protected?*\n"
-                "A: Tidak, hanya tweet publik\n\n"
-                "*Q: Data real-time?*\n"
-                "A: Ya, menggunakan Twitter API\n\n"
-                "*Q: Bisa cek follower/following?*\n"
-                "A: Ya, jumlah dan status verifikasi"
-            )
-        elif platform == 'gh':
-            text += (
-                "*Q: Private repo bisa dilihat?*\n"
-                "A: Tidak, hanya repo publik\n\n"
-                "*Q: Bisa cek organisasi?*\n"
-                "A: Ya, jika status publik\n\n"
-                "*Q: Data kontribusi akurat?*\n"
-                "A: Ya, dari GitHub API\n\n"
-                "*Q: Bisa cek gist?*\n"
-                "A: Ya, gist publik termasuk"
-            )
-        elif platform == 'li':
-            text += (
-                "*Q: Perlu login LinkedIn?*\n"
-                "A: Tidak, pencarian tanpa login\n\n"
-                "*Q: Info pekerjaan akurat?*\n"
-                "A: Sesuai update terakhir profil\n\n"
-                "*Q: Bisa lihat koneksi?*\n"
-                "A: Hanya jumlah, tidak detail\n\n"
-                "*Q: Data endorsement tersedia?*\n"
-                "A: Ya, jika profil publik"
-            )
-            
-        keyboard = [
-            [
-                InlineKeyboardButton("🔍 Mulai Cari", callback_data=f'search_{platform}'),
-                InlineKeyboardButton("📖 Tutorial", callback_data=f'tutorial_{platform}')
-            ],
-            [
-                InlineKeyboardButton("🔙 Kembali", callback_data=f'search_{platform}'),
-                InlineKeyboardButton("🏠 Menu Utama", callback_data='menu')
-            ]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        query.edit_message_text(text=text, reply_markup=reply_markup, parse_mode='Markdown')
-
-    # Handle refresh dan detail view
-    elif query.data.startswith(('refresh_', 'detail_')):
-        action, platform, username = query.data.split('_')
-        
-        if action == 'refresh':
-            if platform == 'fb':
-                results = search_facebook(username)
-            elif platform == 'ig':
-                results = search_instagram(username)
-            elif platform == 'tw':
-                results = search_twitter(username)
-            elif platform == 'gh':
-                results = search_github(username)
-            elif platform == 'li':
-                results = search_linkedin_selenium(None, None, username)
-                
-            formatted_results = format_search_results(results, platform)
-            keyboard = [
-                [
-                    InlineKeyboardButton("🔄 Refresh", callback_data=f'refresh_{platform}_{username}'),
-                    InlineKeyboardButton("📊 Detail", callback_data=f'detail_{platform}_{username}')
-                ],
-                [
-                    InlineKeyboardButton("🔙 Kembali", callback_data=f'search_{platform}'),
-                    InlineKeyboardButton("🏠 Menu Utama", callback_data='menu')
-                ]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            query.edit_message_text(text=formatted_results, reply_markup=reply_markup, parse_mode='MarkdownV2')
-            
-        elif action == 'detail':
-            if platform == 'fb':
-                results = search_facebook(username)
-            elif platform == 'ig':
-                results = search_instagram(username)
-            elif platform == 'tw':
-                results = search_twitter(username)
-            elif platform == 'gh':
-                results = search_github(username)
-            elif platform == 'li':
-                results = search_linkedin_selenium(None, None, username)
-                
-            formatted_results = format_detailed_results(results)
-            keyboard = [
-                [
-                    InlineKeyboardButton("🔄 Refresh", callback_data=f'refresh_{platform}_{username}'),
-                    InlineKeyboardButton("🔙 Kembali", callback_data=f'search_{platform}')
-                ],
-                [InlineKeyboardButton("🏠 Menu Utama", callback_data='menu')]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            query.edit_message_text(text=formatted_results, reply_markup=reply_markup, parse_mode='MarkdownV2')
-
+    handler = route_callback(query.data)
+    if handler:
+        handler(query, context)
     else:
-        query.edit_message_text(
-            "*⚙️ Fitur Dalam Pengembangan*\n\n"
-            "Mohon maaf, fitur ini sedang dalam tahap pengembangan.\n"
-            "Silakan coba fitur lain yang tersedia.",
-            parse_mode='Markdown',
-            reply_markup=InlineKeyboardMarkup([[
-                InlineKeyboardButton("🔙 Kembali ke Menu", callback_data='menu')
-            ]])
-        )
+        show_screen(query, UNDER_DEVELOPMENT_SCREEN)
 
+@instrument_handler
 def cari_command(update, context):
     """Handler untuk command /cari [query]"""
     if not context.args:
@@ -2259,62 +2271,56 @@ def cari_command(update, context):
         return
     
     query = ' '.join(context.args)
-    status_message = update.message.reply_text("🔍 Memulai pencarian...")
+    token_id, token = cancel_registry.create(owner=update.effective_user.id)
+    status_message = update.message.reply_text("🔍 Memulai pencarian...", reply_markup=cancel_keyboard(token_id))
     
     try:
-        # Track penggunaan command
-        track_user(update.effective_user.id, update.effective_user.username)
-        
         # Lakukan pencarian
-        results = deep_osint_search(query)
-        formatted_text = format_search_results(results, "Social Media")
-        
-        # Edit pesan dengan hasil
-        status_message.edit_text(formatted_text, parse_mode='Markdown')
-        
-        # Tambahkan tombol aksi
-        keyboard = [
-            [
-                InlineKeyboardButton("🔄 Refresh", callback_data=f'refresh_search_{query}'),
-                InlineKeyboardButton("📊 Detail", callback_data=f'search_detail_{query}')
-            ],
-            [
-                InlineKeyboardButton("🏠 Menu", callback_data='menu')
-            ]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        update.message.reply_text(
-            "✨ Pencarian selesai! Pilih aksi selanjutnya:",
-            reply_markup=reply_markup
-        )
+        with use_cancel_token(token):
+            results = deep_osint_search(query)
+        token.check()
+        result_id = result_store.put('deep', query, results)
+        with track_stage('format'):
+            formatted_text, reply_markup = publish_result_pages(result_id)[0]
+        
+        # Edit pesan dengan halaman pertama hasil dan tombol aksi
+        with track_stage('telegram_send'):
+            status_message.edit_text(
+                formatted_text,
+                parse_mode=RESULT_PARSE_MODES['deep'],
+                reply_markup=reply_markup
+            )
             
+    except Cancelled:
+        logger.info("Deep search cancelled: %s", query)
     except Exception as e:
-        logger.error(f"Search error: {str(e)}")
+        logger.error("Search error: %s", e)
         status_message.edit_text(f"❌ Error: {str(e)}")
+    finally:
+        cancel_registry.discard(token_id)
 
-def track_user(user_id, username=None):
+def track_user(user_id, username=None, command=None):
     """Melacak pengguna yang menggunakan bot"""
-    global daily_users, total_monthly_users
-    
-    # Reset jika sudah hari baru
-    current_date = datetime.now().date()
-    if current_date > last_reset_date:
-        daily_users.clear()
-        
-    # Reset jika sudah bulan baru    
-    if current_date.replace(day=1) > last_monthly_reset:
-        total_monthly_users.clear()
-    
-    # Tambahkan ke statistik
-    daily_users.add(user_id)
-    total_monthly_users.add(user_id)
+    analytics.record(user_id, command)
     
     # Log aktivitas
-    user_info = f"ID: {user_id}"
     if username:
-        user_info += f", Username: @{username}"
-    logger.info(f"Pengguna menggunakan bot - {user_info}")
+        logger.info("Pengguna menggunakan bot - ID: %s, Username: @%s", user_id, username)
+    else:
+        logger.info("Pengguna menggunakan bot - ID: %s", user_id)
+
+def track_update(update, context):
+    """Catat setiap update yang masuk ke statistik pemakaian (jalan sebelum handler lain)"""
+    user = update.effective_user
+    if not user:
+        return
+        
+    command = None
+    if update.message and update.message.text and update.message.text.startswith('/'):
+        command = update.message.text.split()[0][1:].split('@')[0].lower()
+    elif update.callback_query:
+        command = 'callback'
+    track_user(user.id, user.username, command)
 
 def deep_osint_search(query):
     """Melakukan pencarian OSINT mendalam"""
@@ -2329,40 +2335,38 @@ def deep_osint_search(query):
         social_results = {}
         for platform in SEARCH_PLATFORMS:
             try:
-                if platform == 'twitter':
-                    platform_results = search_twitter(query)
-                elif platform == 'facebook':
-                    platform_results = search_facebook(query)
-                elif platform == 'instagram':
-                    platform_results = search_instagram(query)
-                elif platform == 'github':
-                    platform_results = search_github(query)
+                with track_stage('social', platform) as stage:
+                    if platform == 'twitter':
+                        platform_results = search_twitter(query)
+                    elif platform == 'facebook':
+                        platform_results = search_facebook(query)
+                    elif platform == 'instagram':
+                        platform_results = search_instagram(query)
+                    elif platform == 'github':
+                        platform_results = search_github(query)
+                    stage.outcome = 'found' if platform_results.found else 'not_found'
                 
-                if platform_results.get('found'):
+                if platform_results.found:
                     results['found'] = True
-                    social_results[platform] = platform_results['data']
+                    social_results[platform] = platform_results.profile
             except Exception as e:
-                logger.error(f"Error searching {platform}: {str(e)}")
+                logger.error("Error searching %s: %s", platform, e)
                 continue
         
         if social_results:
             results['data']['social_media'] = social_results
             
         # Cari kemungkinan username terkait
-        variations = generate_username_variations(query)
-        possible_matches = []
-        for var in variations[:5]:
-            for platform in SEARCH_PLATFORMS:
-                match = quick_check_username(var, platform)
-                if match:
-                    possible_matches.append(match)
+        with track_stage('variations'):
+            possible_matches = check_username_variations(query, SEARCH_PLATFORMS)
         
         if possible_matches:
             results['data']['possible_matches'] = possible_matches
             
         # Cek arsip web
         for platform in SEARCH_PLATFORMS:
-            archived = check_web_archives(query, platform)
+            with track_stage('archive', platform):
+                archived = check_web_archives(query, platform)
             if archived and not archived.get('error'):
                 if 'archived_data' not in results['data']:
                     results['data']['archived_data'] = {}
@@ -2370,22 +2374,24 @@ def deep_osint_search(query):
                 
         # Tambahkan metadata
         for platform in SEARCH_PLATFORMS:
-            metadata = gather_additional_metadata(query, platform)
+            with track_stage('metadata', platform):
+                metadata = gather_additional_metadata(query, platform)
             if metadata:
                 if 'metadata' not in results['data']:
                     results['data']['metadata'] = {}
                 results['data']['metadata'][platform] = metadata
                 
     except Exception as e:
-        logger.error(f"Deep search error: {str(e)}")
+        logger.error("Deep search error: %s", e)
         results['error'] = str(e)
         
     return results
 
+@instrument_handler
 def error_handler(update, context):
     """Menangani error yang terjadi saat bot berjalan"""
     try:
-        logger.error(f"Update {update} caused error {context.error}")
+        logger.error("Update %s caused error %s", update, context.error)
         
         error_message = "❌ *Terjadi Kesalahan*\n\n"
         
@@ -2402,8 +2408,9 @@ def error_handler(update, context):
                 parse_mode='MarkdownV2'
             )
     except Exception as e:
-        logger.error(f"Error in error handler: {str(e)}")
+        logger.error("Error in error handler: %s", e)
 
+@instrument_handler
 def search_name_command(update, context):
     """Handle command /nama untuk mencari berdasarkan nama lengkap"""
     if not context.args:
@@ -2416,67 +2423,226 @@ def search_name_command(update, context):
         return
     
     full_name = ' '.join(context.args)
-    update.message.reply_text(f"🔍 Mencari informasi untuk nama: {full_name}...")
+    token_id, token = cancel_registry.create(owner=update.effective_user.id)
+    status_message = update.message.reply_text(
+        f"🔍 Mencari informasi untuk nama: {full_name}...",
+        reply_markup=cancel_keyboard(token_id)
+    )
     
     try:
-        results = search_name_across_platforms(full_name)
-        formatted_text = format_name_search_results(results)  # Menghapus parameter full_name
-        
-        keyboard = [
-            [
-                InlineKeyboardButton("🔄 Refresh", callback_data=f'refresh_name_{full_name}'),
-                InlineKeyboardButton("📊 Detail", callback_data=f'detail_name_{full_name}')
-            ],
-            [InlineKeyboardButton("🏠 Menu Utama", callback_data='menu')]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        update.message.reply_text(
-            formatted_text,
-            parse_mode='MarkdownV2',
-            reply_markup=reply_markup
-        )
+        with use_cancel_token(token):
+            results = search_name_across_platforms(full_name)
+        token.check()
+        result_id = result_store.put('name', full_name, results)
+        with track_stage('format'):
+            formatted_text, reply_markup = publish_result_pages(result_id)[0]
+        
+        # Pesan status diganti hasil, biar tombol Cancel tidak tertinggal
+        with track_stage('telegram_send'):
+            status_message.edit_text(
+                formatted_text,
+                parse_mode='MarkdownV2',
+                reply_markup=reply_markup
+            )
         
+    except Cancelled:
+        logger.info("Name search cancelled: %s", full_name)
     except Exception as e:
-        logger.error(f"Error in name search: {str(e)}")
-        update.message.reply_text(
+        logger.error("Error in name search: %s", e)
+        status_message.edit_text(
             f"❌ *Terjadi kesalahan:* `{escape_markdown(str(e))}`",
             parse_mode='MarkdownV2'
         )
+    finally:
+        cancel_registry.discard(token_id)
+
+def admin_only(func):
+    """Decorator untuk command yang cuma boleh dipakai admin (config.ADMIN_IDS)"""
+    @wraps(func)
+    def wrapper(update, context, *args, **kwargs):
+        if not update.effective_user or update.effective_user.id not in config.ADMIN_IDS:
+            update.message.reply_text("⛔ Command ini khusus admin.")
+            return
+        return func(update, context, *args, **kwargs)
+    return wrapper
+
+@instrument_handler
+@admin_only
+def stats_command(update, context):
+    """Handler untuk command /stats - statistik pemakaian bot"""
+    stats = analytics.snapshot()
+    text = (
+        "📈 STATISTIK BOT\n\n"
+        f"👤 User hari ini: ~{stats['daily_users']}\n"
+        f"👥 User {config.ANALYTICS['window_days']} hari terakhir: ~{stats['monthly_users']}\n"
+    )
+    if stats['commands_today']:
+        text += "\n⌨️ Command hari ini:\n"
+        for command, count in sorted(stats['commands_today'].items(), key=lambda item: -item[1]):
+            text += f"• /{command}: {count}\n"
+    if stats['commands_total']:
+        text += "\n📊 Total command:\n"
+        for command, count in sorted(stats['commands_total'].items(), key=lambda item: -item[1]):
+            text += f"• /{command}: {count}\n"
+    update.message.reply_text(text[:4000])
+
+@instrument_handler
+@admin_only
+def trace_command(update, context):
+    """Handler untuk command /trace - span tree request paling lambat"""
+    traces = slow_traces.slowest()
+    if not traces:
+        update.message.reply_text("Belum ada trace yang tercatat.")
+        return
+        
+    text = '\n\n'.join(format_span_tree(root) for root in traces)
+    update.message.reply_text(text[:4000])
+
+@instrument_handler
+@admin_only
+def profile_command(update, context):
+    """
+    Handler untuk command /profile - atur sampling profiler dan ambil hasilnya.
+    /profile on [rate] | off | slow <detik> | clear, tanpa argumen kirim profil terlambat
+    """
+    args = context.args or []
+    action = args[0].lower() if args else None
+    try:
+        if action == 'on':
+            profiler.configure(enabled=True, sample_rate=float(args[1]) if len(args) > 1 else None)
+        elif action == 'off':
+            profiler.configure(enabled=False)
+        elif action == 'slow' and len(args) > 1:
+            profiler.configure(slow_threshold=float(args[1]))
+        elif action == 'clear':
+            profiler.clear()
+        elif action is not None:
+            update.message.reply_text("Format: /profile [on [rate] | off | slow <detik> | clear]")
+            return
+    except ValueError:
+        update.message.reply_text("⚠️ Angka tidak valid.")
+        return
+        
+    profiles = profiler.slowest()
+    text = (
+        f"🔬 Profiler: {'ON' if profiler.enabled else 'OFF'} "
+        f"(rate {profiler.sample_rate:g}, slow ≥ {profiler.slow_threshold:g}s)\n"
+    )
+    if action is not None or not profiles:
+        if not profiles:
+            text += "\nBelum ada profil yang tersimpan."
+        update.message.reply_text(text)
+        return
+        
+    for item in profiles:
+        text += f"\n⏱ {item.name} {item.duration:.1f}s, {item.samples} sampel, trace {item.trace_id}\n"
+        for frame, share in item.top_frames(3):
+            text += f"  {share:4.0%} {frame}\n"
+    update.message.reply_text(text[:4000])
+    
+    # File collapsed stack untuk flamegraph.pl / speedscope
+    path = profiler.dump()
+    with open(path, 'rb') as handle:
+        update.message.reply_document(handle, filename=os.path.basename(path))
+
+def profile_cost(platform, username):
+    """Kelas biaya pencarian profil; hasil yang pasti tidak butuh Chrome cukup lane api"""
+    if not username:
+        return STATIC
+    if negative_cache.contains(platform, username) or platform in platform_breakers.open_platforms():
+        return API
+    return config.LANES['platform_cost'].get(platform, BROWSER)
+
+def command_cost(platform):
+    """Classifier lane untuk command pencarian profil /f, /i, /t"""
+    def classify(update, context):
+        return profile_cost(platform, context.args[0] if context.args else None)
+    return classify
+
+def search_command_cost(update, context):
+    """/cari dan /nama selalu lewat browser, kecuali cuma balas format salah"""
+    return BROWSER if context.args else STATIC
+
+def callback_cost(update, context):
+    """Cuma Refresh yang menjalankan pencarian ulang; tombol lain render dari cache"""
+    data = update.callback_query.data or ''
+    if not data.startswith('refresh:'):
+        return STATIC
+    entry = result_store.get(data.split(':', 1)[1])
+    if not entry:
+        return STATIC
+    if entry['kind'] == 'profile':
+        return profile_cost(entry['platform'], entry['query'])
+    return BROWSER
+
+def reject_busy(update, context):
+    """Balasan saat antrian lane penuh"""
+    if update.callback_query:
+        update.callback_query.answer(config.ERROR_MESSAGES['busy'], show_alert=True)
+    elif update.effective_message:
+        update.effective_message.reply_text(config.ERROR_MESSAGES['busy'])
 
-def setup_bot():
-    """Setup bot instance"""
+def setup_bot(*, request=None):
+    """Setup bot instance; send/edit lewat outbox kalau diaktifkan"""
     try:
-        bot = telegram.Bot(token=config.TELEGRAM_TOKEN)
+        bot_class = OutboxBot if config.OUTBOX['enabled'] else ExtBot
+        # Default Request PTB cuma punya satu koneksi; polling dan webhook sama-sama butuh lebih
+        bot = bot_class(token=config.TELEGRAM_TOKEN, request=request or make_request())
         return bot
     except Exception as e:
-        logger.error(f"Error setting up bot: {str(e)}")
+        logger.error("Error setting up bot: %s", e)
         raise e
 
 def setup_handlers(dp):
     """Setup message handlers"""
-    dp.add_handler(CommandHandler("start", start))
-    dp.add_handler(CommandHandler("help", help_command))
-    dp.add_handler(CommandHandler("menu", menu_command))
-    dp.add_handler(CommandHandler("cari", cari_command))
-    dp.add_handler(CommandHandler("nama", search_name_command))
-    dp.add_handler(CommandHandler("f", facebook_search))
-    dp.add_handler(CommandHandler("i", instagram_search))
-    dp.add_handler(CommandHandler("t", twitter_search))
-    dp.add_handler(CallbackQueryHandler(button))
+    # Setiap handler jalan di lane sesuai kelas biayanya, dispatcher tidak pernah menunggu
+    def lane(handler, classify):
+        return scheduler.dispatch(handler, classify, on_reject=reject_busy)
+        
+    # Lag dicatat dan backlog basi dibuang sebelum update dihitung ke statistik
+    dp.add_handler(TypeHandler(telegram.Update, update_gate), group=-2)
+    dp.add_handler(TypeHandler(telegram.Update, track_update), group=-1)
+    dp.add_handler(CommandHandler("start", lane(start, STATIC)))
+    dp.add_handler(CommandHandler("help", lane(help_command, STATIC)))
+    dp.add_handler(CommandHandler("menu", lane(menu_command, STATIC)))
+    dp.add_handler(CommandHandler("cari", lane(cari_command, search_command_cost)))
+    dp.add_handler(CommandHandler("nama", lane(search_name_command, search_command_cost)))
+    dp.add_handler(CommandHandler("f", lane(facebook_search, command_cost("Facebook"))))
+    dp.add_handler(CommandHandler("i", lane(instagram_search, command_cost("Instagram"))))
+    dp.add_handler(CommandHandler("t", lane(twitter_search, command_cost("Twitter"))))
+    dp.add_handler(CommandHandler("trace", lane(trace_command, STATIC)))
+    dp.add_handler(CommandHandler("stats", lane(stats_command, STATIC)))
+    dp.add_handler(CommandHandler("profile", lane(profile_command, STATIC)))
+    dp.add_handler(CallbackQueryHandler(lane(button, callback_cost)))
     dp.add_error_handler(error_handler)
 
 def main():
     """Run bot in polling mode for local development"""
     try:
-        updater = Updater(TOKEN, use_context=True)
+        # Pool koneksi bot (lihat ingestion.connection_pool_size) sudah mencakup worker dispatcher ini
+        updater = Updater(bot=setup_bot(), workers=config.POLLING['workers'], use_context=True)
         dp = updater.dispatcher
         setup_handlers(dp)
+        if config.METRICS['enabled']:
+            port = start_metrics_server(health=readiness.status)
+            logger.info("Metrics dan /healthz tersedia di port %s", port)
+        analytics.start()
+        browser_supervisor.start()
+        # Polling baru mulai setelah driver, koneksi, dan DNS sudah hangat
+        warm_start(driver_pool)
         logger.info("Bot started in polling mode...")
-        updater.start_polling()
+        updater.start_polling(**polling_kwargs())
+        # idle() sudah menangani SIGTERM: berhenti polling lalu kembali ke sini
         updater.idle()
+        # Handler yang sedang jalan (termasuk yang memegang driver) diberi waktu selesai
+        # sebelum pool browser di-drain dan outbox di-flush
+        scheduler.shutdown(timeout=config.LANES['shutdown_timeout'])
+        browser_supervisor.drain()
+        # Balasan dari pencarian yang selesai saat drain masih sempat terkirim
+        outbox.flush(config.BROWSER_SUPERVISOR['drain_timeout'])
+        analytics.stop()
     except Exception as e:
-        logger.error(f"Error starting bot: {str(e)}")
+        logger.error("Error starting bot: %s", e)
         raise e
 
 if __name__ == '__main__':
@@ -0,0 +1,314 @@
+# outbox.py
+# Antrian pesan keluar ke Telegram: send/edit dikirim sesuai batas flood per chat dan
+# global, edit yang masih antri untuk pesan yang sama digabung jadi yang terbaru,
+# edit yang isinya tidak berubah dilewati, dan RetryAfter ditunggu sesuai saran server.
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+
+from telegram.error import BadRequest, RetryAfter
+from telegram.ext import ExtBot
+
+import config
+from metrics import OUTBOX_QUEUED, OUTBOX_RETRY_AFTER, OUTBOX_TOTAL, OUTBOX_WAIT
+
+logger = logging.getLogger(__name__)
+
+
+class RateBucket:
+    """Token bucket sederhana; dipakai di bawah lock Outbox jadi tidak punya lock sendiri"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._stamp = time.monotonic()
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def delay(self, now):
+        """Detik sampai ada satu token"""
+        self._refill(now)
+        return 0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+
+    def take(self, now):
+        self._refill(now)
+        self._tokens -= 1
+
+    def full(self, now):
+        self._refill(now)
+        return self._tokens >= self.burst
+
+
+class _Job:
+    __slots__ = ('chat_id', 'method', 'call', 'message_id', 'content', 'future', 'queued', 'retries')
+
+    def __init__(self, chat_id, method, call, message_id, content):
+        self.chat_id = chat_id
+        self.method = method
+        self.call = call
+        self.message_id = message_id
+        self.content = content
+        self.future = Future()
+        self.queued = time.monotonic()
+        self.retries = 0
+
+
+class Outbox:
+    """
+    Scheduler pesan keluar. Tiap chat punya antrian FIFO dan paling banyak satu request
+    yang sedang jalan, jadi urutan send -> edit dalam satu chat tetap terjaga;
+    chat yang berbeda dikirim paralel oleh beberapa worker selama token global masih ada.
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or config.OUTBOX['workers']
+        self._global = RateBucket(config.OUTBOX['global_rate'], config.OUTBOX['global_burst'])
+        self._buckets = OrderedDict()  # chat_id -> RateBucket
+        self._queues = {}  # chat_id -> deque job yang menunggu
+        self._ready = []  # heap (siap_pada, seq, chat_id) untuk chat yang punya job dan tidak sedang kirim
+        self._busy = set()
+        self._pending_edits = {}  # (chat_id, message_id, method) -> job yang belum dikirim
+        self._last = OrderedDict()  # (chat_id, message_id) -> isi terakhir yang terkirim
+        self._seq = itertools.count()
+        self._size = 0
+        self._cond = threading.Condition()
+        self._threads = []
+
+    def _bucket(self, chat_id):
+        bucket = self._buckets.get(chat_id)
+        if bucket is None:
+            # ID negatif = grup / channel, batasnya jauh lebih ketat
+            if isinstance(chat_id, int) and chat_id < 0:
+                bucket = RateBucket(config.OUTBOX['group_rate'], config.OUTBOX['group_burst'])
+            else:
+                bucket = RateBucket(config.OUTBOX['chat_rate'], config.OUTBOX['chat_burst'])
+            self._buckets[chat_id] = bucket
+        return bucket
+
+    def _schedule(self, chat_id, at=None):
+        now = time.monotonic()
+        at = max(at or now, now + self._bucket(chat_id).delay(now))
+        heapq.heappush(self._ready, (at, next(self._seq), chat_id))
+        self._cond.notify()
+
+    def _ensure_workers(self):
+        if not self._threads:
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f'outbox-{index}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, chat_id, method, call, message_id=None, content=None):
+        """
+        Antrikan satu request Bot API, return Future hasilnya. `content` (dict) dipakai
+        untuk skip edit yang tidak mengubah apa-apa; edit dengan `message_id` dan method
+        yang sama yang masih antri digantikan isinya oleh yang terbaru.
+        """
+        with self._cond:
+            self._ensure_workers()
+            key = (chat_id, message_id, method) if message_id is not None else None
+            job = self._pending_edits.get(key) if key else None
+            if job is not None:
+                # Yang menunggu edit lama ikut dapat hasil edit terbaru (itu yang tampil di layar)
+                job.call = call
+                job.content = content
+                OUTBOX_TOTAL.labels(method, 'coalesced').inc()
+                return job.future
+            job = _Job(chat_id, method, call, message_id, content)
+            if key:
+                self._pending_edits[key] = job
+            queue = self._queues.setdefault(chat_id, deque())
+            queue.append(job)
+            self._size += 1
+            OUTBOX_QUEUED.set(self._size)
+            if len(queue) == 1 and chat_id not in self._busy:
+                self._schedule(chat_id)
+            return job.future
+
+    def _take(self):
+        """Tunggu sampai ada chat yang boleh kirim dan token global tersedia"""
+        with self._cond:
+            while True:
+                if not self._ready:
+                    self._cond.wait()
+                    continue
+                now = time.monotonic()
+                at, _, chat_id = self._ready[0]
+                delay = max(at - now, self._global.delay(now))
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                heapq.heappop(self._ready)
+                self._global.take(now)
+                self._bucket(chat_id).take(now)
+                self._buckets.move_to_end(chat_id)
+                job = self._queues[chat_id].popleft()
+                key = (chat_id, job.message_id, job.method)
+                if self._pending_edits.get(key) is job:
+                    del self._pending_edits[key]
+                self._busy.add(chat_id)
+                self._size -= 1
+                OUTBOX_QUEUED.set(self._size)
+                return job
+
+    def _finish(self, job, retry_at=None):
+        with self._cond:
+            chat_id = job.chat_id
+            self._busy.discard(chat_id)
+            queue = self._queues[chat_id]
+            if retry_at is not None:
+                queue.appendleft(job)
+                if job.message_id is not None:
+                    # Edit baru untuk pesan ini selama menunggu ikut digabung ke job ini
+                    self._pending_edits.setdefault((chat_id, job.message_id, job.method), job)
+                self._size += 1
+                OUTBOX_QUEUED.set(self._size)
+            if queue:
+                self._schedule(chat_id, retry_at)
+            else:
+                del self._queues[chat_id]
+                self._prune_buckets()
+            self._cond.notify_all()
+
+    def _prune_buckets(self):
+        # Bucket chat yang sudah penuh lagi sama saja dengan bucket baru, jadi boleh dibuang
+        now = time.monotonic()
+        while len(self._buckets) > config.OUTBOX['tracked_chats']:
+            chat_id, bucket = next(iter(self._buckets.items()))
+            if chat_id in self._queues or not bucket.full(now):
+                break
+            del self._buckets[chat_id]
+
+    def _unchanged(self, job):
+        if job.message_id is None or not job.content:
+            return False
+        with self._cond:
+            last = self._last.get((job.chat_id, job.message_id))
+        return last is not None and all(last.get(field) == value for field, value in job.content.items())
+
+    def _remember(self, job, result):
+        message_id = job.message_id if job.message_id is not None else getattr(result, 'message_id', None)
+        if message_id is None or not job.content:
+            return
+        with self._cond:
+            key = (job.chat_id, message_id)
+            self._last.setdefault(key, {}).update(job.content)
+            self._last.move_to_end(key)
+            while len(self._last) > config.OUTBOX['tracked_messages']:
+                self._last.popitem(last=False)
+
+    def _run(self):
+        while True:
+            job = self._take()
+            OUTBOX_WAIT.observe(time.monotonic() - job.queued)
+            if self._unchanged(job):
+                OUTBOX_TOTAL.labels(job.method, 'unchanged').inc()
+                self._finish(job)
+                job.future.set_result(True)
+                continue
+            try:
+                result = job.call()
+            except RetryAfter as e:
+                OUTBOX_RETRY_AFTER.inc()
+                if job.retries < config.OUTBOX['max_retries'] and e.retry_after <= config.OUTBOX['max_retry_after']:
+                    job.retries += 1
+                    logger.warning("Flood control on chat %s, retrying %s in %ss", job.chat_id, job.method, e.retry_after)
+                    self._finish(job, retry_at=time.monotonic() + e.retry_after)
+                    continue
+                self._fail(job, e)
+            except BadRequest as e:
+                if 'message is not modified' in str(e).lower():
+                    # Isi di layar sudah sama (misalnya diedit dari sesi sebelum restart)
+                    OUTBOX_TOTAL.labels(job.method, 'unchanged').inc()
+                    self._remember(job, None)
+                    self._finish(job)
+                    job.future.set_result(True)
+                else:
+                    self._fail(job, e)
+            except Exception as e:
+                self._fail(job, e)
+            else:
+                OUTBOX_TOTAL.labels(job.method, 'sent').inc()
+                self._remember(job, result)
+                self._finish(job)
+                job.future.set_result(result)
+
+    def _fail(self, job, error):
+        OUTBOX_TOTAL.labels(job.method, 'error').inc()
+        self._finish(job)
+        job.future.set_exception(error)
+
+    def flush(self, timeout):
+        """Tunggu antrian kosong (dipakai saat shutdown), return False kalau masih ada sisa"""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._size or self._busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning("Outbox flush timed out with %s messages pending", self._size)
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+
+outbox = Outbox()
+
+
+def _markup_key(reply_markup):
+    return reply_markup.to_json() if reply_markup is not None else None
+
+
+class OutboxBot(ExtBot):
+    """
+    Bot yang mengirim send/edit lewat outbox. Message.reply_text, Message.edit_text dan
+    CallbackQuery.edit_message_text semuanya memanggil method di sini, jadi handler tidak berubah.
+    Method tetap blocking dan mengembalikan hasil/raise error seperti Bot biasa.
+    """
+
+    def send_message(self, chat_id, text, *args, **kwargs):
+        send = super().send_message
+        call = lambda: send(chat_id, text, *args, **kwargs)
+        content = {
+            'text': (text, str(kwargs.get('parse_mode'))),
+            'markup': _markup_key(kwargs.get('reply_markup'))
+        }
+        return outbox.submit(chat_id, 'send_message', call, content=content).result()
+
+    def edit_message_text(self, text, chat_id=None, message_id=None, inline_message_id=None, **kwargs):
+        edit = super().edit_message_text
+        call = lambda: edit(text, chat_id=chat_id, message_id=message_id, inline_message_id=inline_message_id, **kwargs)
+        if chat_id is None:
+            # Pesan inline tidak punya chat, tidak bisa diantrikan per chat
+            return call()
+        content = {
+            'text': (text, str(kwargs.get('parse_mode'))),
+            'markup': _markup_key(kwargs.get('reply_markup'))
+        }
+        return outbox.submit(chat_id, 'edit_message_text', call, message_id, content).result()
+
+    def edit_message_reply_markup(self, chat_id=None, message_id=None, inline_message_id=None, reply_markup=None, **kwargs):
+        edit = super().edit_message_reply_markup
+        call = lambda: edit(
+            chat_id=chat_id, message_id=message_id, inline_message_id=inline_message_id,
+            reply_markup=reply_markup, **kwargs
+        )
+        if chat_id is None:
+            return call()
+        content = {'markup': _markup_key(reply_markup)}
+        return outbox.submit(chat_id, 'edit_message_reply_markup', call, message_id, content).result()
+
+    def send_document(self, chat_id, document, *args, **kwargs):
+        send = super().send_document
+        if hasattr(document, 'read'):
+            # File handle habis dibaca di percobaan pertama; dibaca sekali biar retry tetap kirim isinya
+            kwargs.setdefault('filename', getattr(document, 'name', None))
+            document = document.read()
+        call = lambda: send(chat_id, document, *args, **kwargs)
+        return outbox.submit(chat_id, 'send_document', call).result()
@@ -0,0 +1,171 @@
+# profiler.py
+# Sampling profiler opt-in untuk handler Telegram: stack thread handler diambil
+# berkala dari thread terpisah (tanpa sys.setprofile), hasilnya format collapsed
+# stack yang bisa langsung dibaca flamegraph.pl / speedscope
+import heapq
+import itertools
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class Profile:
+    """Hasil sampling satu pemanggilan handler"""
+    __slots__ = ('name', 'trace_id', 'started', 'duration', 'samples', 'stacks')
+
+    def __init__(self, name, trace_id=None):
+        self.name = name
+        self.trace_id = trace_id
+        self.started = time.time()
+        self.duration = None
+        self.samples = 0
+        self.stacks = Counter()  # "frame;frame;frame" -> jumlah sampel
+
+    def collapsed(self):
+        """Baris collapsed stack: `handler;frame;...;frame count`"""
+        return '\n'.join(f"{self.name};{stack} {count}" for stack, count in self.stacks.most_common())
+
+    def top_frames(self, count=5):
+        """Frame paling ujung (tempat waktu benar-benar habis) beserta persentasenya"""
+        leaves = Counter()
+        for stack, hits in self.stacks.items():
+            leaves[stack.rsplit(';', 1)[-1]] += hits
+        return [(frame, hits / self.samples) for frame, hits in leaves.most_common(count)] if self.samples else []
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+
+
+def _collapse(frame, max_depth):
+    labels = []
+    while frame is not None and len(labels) < max_depth:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return ';'.join(labels)
+
+
+class SamplingProfiler:
+    """
+    Profil handler yang terpilih (acak sesuai sample_rate) atau yang lewat slow_threshold.
+    Yang disimpan cuma N profil paling lambat, jadi memori tetap kecil.
+    """
+
+    def __init__(self):
+        self.enabled = config.PROFILING['enabled']
+        self.sample_rate = config.PROFILING['sample_rate']
+        self.slow_threshold = config.PROFILING['slow_threshold']
+        self._active = {}  # thread id -> Profile yang sedang jalan
+        self._slowest = []  # min-heap (duration, seq, Profile)
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def configure(self, enabled=None, sample_rate=None, slow_threshold=None):
+        """Ubah mode profiling saat runtime (dipakai command /profile)"""
+        if sample_rate is not None:
+            self.sample_rate = sample_rate
+        if slow_threshold is not None:
+            self.slow_threshold = slow_threshold
+        if enabled is not None:
+            self.enabled = enabled
+
+    def _should_profile(self):
+        # Kalau ada slow_threshold semua request diprofil, tapi yang disimpan cuma yang lambat
+        if not self.enabled:
+            return None
+        if random.random() < self.sample_rate:
+            return 'sampled'
+        if self.slow_threshold:
+            return 'threshold'
+        return None
+
+    def _ensure_sampler(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='profiler', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        interval = config.PROFILING['interval']
+        max_depth = config.PROFILING['max_depth']
+        while True:
+            self._wakeup.wait()
+            time.sleep(interval)
+            # Sampling di dalam lock biar profil yang sudah selesai tidak ditulis lagi
+            with self._lock:
+                if not self._active:
+                    self._wakeup.clear()
+                    continue
+                frames = sys._current_frames()
+                for thread_id, profile in self._active.items():
+                    frame = frames.get(thread_id)
+                    if frame is not None:
+                        profile.stacks[_collapse(frame, max_depth)] += 1
+                        profile.samples += 1
+                del frames
+
+    def _keep(self, profile):
+        entry = (profile.duration, next(self._seq), profile)
+        if len(self._slowest) < config.PROFILING['keep']:
+            heapq.heappush(self._slowest, entry)
+        elif profile.duration > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    @contextmanager
+    def profile(self, name, trace_id=None):
+        """Profil blok ini di thread sekarang kalau terpilih; no-op kalau profiling mati"""
+        mode = self._should_profile()
+        thread_id = threading.get_ident()
+        if mode is None or thread_id in self._active:
+            yield None
+            return
+        current = Profile(name, trace_id)
+        started = time.perf_counter()
+        with self._lock:
+            self._active[thread_id] = current
+            self._ensure_sampler()
+            self._wakeup.set()
+        try:
+            yield current
+        finally:
+            current.duration = time.perf_counter() - started
+            with self._lock:
+                del self._active[thread_id]
+                if current.samples and (mode == 'sampled' or current.duration >= self.slow_threshold):
+                    self._keep(current)
+
+    def slowest(self):
+        """Profil yang tersimpan, paling lambat duluan"""
+        with self._lock:
+            return [profile for _, _, profile in sorted(self._slowest, reverse=True)]
+
+    def clear(self):
+        with self._lock:
+            self._slowest = []
+
+    def dump(self, path=None):
+        """Tulis semua profil tersimpan ke satu file collapsed stack, return path-nya"""
+        profiles = self.slowest()
+        if path is None:
+            os.makedirs(config.PROFILING['dump_dir'], exist_ok=True)
+            path = os.path.join(config.PROFILING['dump_dir'], time.strftime('profile-%Y%m%d-%H%M%S.folded'))
+        with open(path, 'w') as handle:
+            for profile in profiles:
+                handle.write(profile.collapsed() + '\n')
+        logger.info("Wrote %s profiles to %s", len(profiles), path)
+        return path
+
+
+profiler = SamplingProfiler()
@@ -0,0 +1,102 @@
+# result_store.py
+# Simpen hasil pencarian di server, biar tombol inline cukup bawa ID pendek
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+import codec
+import config
+
+
+class ResultStore:
+    """Penyimpanan hasil pencarian dengan ID pendek dan masa berlaku"""
+
+    def __init__(self, ttl=None, max_entries=None, compact=None):
+        self.ttl = ttl or config.RESULT_STORE['ttl']
+        self.max_entries = max_entries or config.RESULT_STORE['max_entries']
+        self.compact = config.RESULT_STORE['compact'] if compact is None else compact
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _new_id(self):
+        # 6 byte acak -> 8 karakter, jauh di bawah limit 64 byte callback_data
+        result_id = secrets.token_urlsafe(config.RESULT_STORE['id_bytes'])
+        while result_id in self._entries:
+            result_id = secrets.token_urlsafe(config.RESULT_STORE['id_bytes'])
+        return result_id
+
+    def _pack(self, value):
+        # Mode compact: yang disimpan bytes codec, bukan object Python
+        return codec.dumps(value) if self.compact and value is not None else value
+
+    def _unpack(self, value):
+        return codec.loads(value) if isinstance(value, bytes) else value
+
+    def _purge(self, now):
+        # Buang yang kedaluwarsa, lalu yang paling lama kalau masih penuh
+        expired = [key for key, entry in self._entries.items() if entry['expires'] <= now]
+        for key in expired:
+            del self._entries[key]
+        while len(self._entries) >= self.max_entries:
+            self._entries.popitem(last=False)
+
+    def put(self, kind, query, results, platform=None):
+        """Simpan hasil pencarian dan kembalikan ID-nya"""
+        now = time.monotonic()
+        results = self._pack(results)
+        with self._lock:
+            self._purge(now)
+            result_id = self._new_id()
+            self._entries[result_id] = {
+                'kind': kind,
+                'query': query,
+                'platform': platform,
+                'results': results,
+                'pages': None,
+                'expires': now + self.ttl
+            }
+            return result_id
+
+    def get(self, result_id):
+        """Ambil entry berdasarkan ID, None kalau tidak ada atau sudah kedaluwarsa"""
+        with self._lock:
+            entry = self._entries.get(result_id)
+            if not entry:
+                return None
+            if entry['expires'] <= time.monotonic():
+                del self._entries[result_id]
+                return None
+            if not self.compact:
+                return entry
+            entry = dict(entry)
+        # Decode di luar lock; pemanggil dapat salinan entry
+        entry['results'] = self._unpack(entry['results'])
+        entry['pages'] = self._unpack(entry['pages'])
+        return entry
+
+    def update(self, result_id, results):
+        """Ganti hasil yang tersimpan (dipakai saat refresh) dan perpanjang masa berlaku"""
+        results = self._pack(results)
+        with self._lock:
+            entry = self._entries.get(result_id)
+            if not entry:
+                return False
+            entry['results'] = results
+            entry['pages'] = None
+            entry['expires'] = time.monotonic() + self.ttl
+            self._entries.move_to_end(result_id)
+            return True
+
+    def set_pages(self, result_id, pages):
+        """Simpan halaman yang sudah di-render (list of (text, reply_markup))"""
+        pages = self._pack(pages)
+        with self._lock:
+            entry = self._entries.get(result_id)
+            if not entry:
+                return False
+            entry['pages'] = pages
+            return True
+
+
+result_store = ResultStore()
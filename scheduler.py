@@ -0,0 +1,136 @@
+# scheduler.py
+# Lane eksekusi per kelas biaya: menu/halaman statis, pencarian API/HTTP, dan pencarian
+# yang butuh browser. Tiap lane punya worker dan antrian sendiri, jadi tap menu tidak
+# ikut antri di belakang crawl Selenium 30 detik.
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import wraps
+
+import config
+from metrics import LANE_QUEUED, LANE_REJECTED, LANE_RUNNING, LANE_WAIT
+
+logger = logging.getLogger(__name__)
+
+STATIC = 'static'
+API = 'api'
+BROWSER = 'browser'
+
+
+class LaneFull(Exception):
+    """Antrian lane sudah penuh, job ditolak"""
+
+
+class Lane:
+    """Satu kelas biaya: thread pool dengan batas worker dan batas antrian"""
+
+    def __init__(self, name, workers, max_queue):
+        self.name = name
+        self.workers = workers
+        self.max_queue = max_queue
+        self.queued = 0
+        self.running = 0
+        self._lock = threading.Lock()
+        self._futures = set()  # Job yang belum selesai, ditunggu saat shutdown
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f'lane-{name}')
+
+    def submit(self, func, *args, **kwargs):
+        """Masukkan job ke lane, raise LaneFull kalau antrian sudah penuh"""
+        with self._lock:
+            if self.queued >= self.max_queue:
+                LANE_REJECTED.labels(self.name).inc()
+                raise LaneFull(self.name)
+            self.queued += 1
+            LANE_QUEUED.labels(self.name).set(self.queued)
+        submitted = time.monotonic()
+
+        def run():
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+                LANE_QUEUED.labels(self.name).set(self.queued)
+                LANE_RUNNING.labels(self.name).set(self.running)
+            LANE_WAIT.labels(self.name).observe(time.monotonic() - submitted)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    LANE_RUNNING.labels(self.name).set(self.running)
+
+        future = self._executor.submit(run)
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._forget)
+        return future
+
+    def _forget(self, future):
+        with self._lock:
+            self._futures.discard(future)
+
+    def shutdown(self):
+        """Buang job yang belum mulai, return job yang masih jalan (tidak ditunggu di sini)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            return [future for future in self._futures if not future.done()]
+
+
+class LaneScheduler:
+    """Kumpulan lane sesuai config.LANES"""
+
+    def __init__(self, lanes=None):
+        lanes = lanes or config.LANES['lanes']
+        self.lanes = {
+            name: Lane(name, settings['workers'], settings['max_queue'])
+            for name, settings in lanes.items()
+        }
+
+    def submit(self, cost_class, func, *args, **kwargs):
+        lane = self.lanes.get(cost_class) or self.lanes[BROWSER]
+        return lane.submit(func, *args, **kwargs)
+
+    def dispatch(self, handler, classify, on_reject=None):
+        """
+        Bungkus handler Telegram supaya jalan di lane sesuai kelas biayanya.
+        `classify` berupa nama kelas atau fungsi (update, context) -> nama kelas.
+        Dispatcher langsung lanjut ke update berikutnya; error di lane diteruskan ke error handler.
+        """
+        @wraps(handler)
+        def wrapper(update, context):
+            cost_class = classify(update, context) if callable(classify) else classify
+
+            def run():
+                try:
+                    handler(update, context)
+                except Exception as e:
+                    if context.dispatcher is not None:
+                        context.dispatcher.dispatch_error(update, e)
+                    else:
+                        logger.error("Unhandled error in %s lane: %s", cost_class, e)
+
+            try:
+                self.submit(cost_class, run)
+            except LaneFull:
+                logger.warning("Lane %s full, rejecting %s", cost_class, handler.__name__)
+                if on_reject:
+                    on_reject(update, context)
+        return wrapper
+
+    def shutdown(self, timeout=None):
+        """
+        Stop semua lane: job antri dibuang, job yang sedang jalan ditunggu sampai `timeout`
+        (None = sampai selesai). Return False kalau masih ada yang jalan setelah timeout.
+        """
+        running = []
+        for lane in self.lanes.values():
+            running.extend(lane.shutdown())
+        if not running:
+            return True
+        _, pending = wait(running, timeout=timeout)
+        if pending:
+            logger.warning("Lane shutdown timed out with %s jobs still running", len(pending))
+        return not pending
+
+
+scheduler = LaneScheduler()
@@ -0,0 +1,346 @@
+# tab_pool.py
+# Mode multi-tab: satu proses Chrome melayani beberapa pencarian sekaligus lewat tab
+# yang masing-masing punya browser context sendiri (cookie & storage terpisah).
+# Interface-nya sama dengan DriverPool, jadi search_profile dan supervisor tidak berubah.
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.switch_to import SwitchTo
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+import config
+from cancellation import check as check_cancelled
+from driver_pool import DriverPoolExhausted
+
+logger = logging.getLogger(__name__)
+
+# Dipasang sebelum navigasi dan hilang begitu dokumen baru dimuat
+_NAVIGATE_SCRIPT = (
+    "var url = arguments[0]; window.__tabPending = true;"
+    "setTimeout(function () { window.location.href = url; }, 0);"
+)
+_LOADED_SCRIPT = "return !window.__tabPending && document.readyState === 'complete';"
+
+
+class TabDriver(RemoteWebDriver):
+    """
+    WebDriver untuk satu tab. Semua command (termasuk command WebElement) lewat execute()
+    di sini: ambil lock browser, pindah ke tab ini kalau perlu, baru kirim ke chromedriver.
+    """
+
+    def __init__(self, browser, handle, context_id=None):
+        # Tidak memanggil super().__init__: session sudah ada, cukup pinjam state driver asli
+        self.__dict__.update(browser.driver.__dict__)
+        self._switch_to = SwitchTo(self)
+        self.owner = browser  # `browser` sudah dipakai RemoteWebDriver (BiDi)
+        self.handle = handle
+        self.context_id = context_id
+        self.aborted = False
+
+    def execute(self, driver_command, params=None):
+        if self.aborted:
+            raise WebDriverException("Tab dibatalkan")
+        return self.owner.run(self.handle, lambda: RemoteWebDriver.execute(self, driver_command, params))
+
+    def get(self, url):
+        """
+        Navigasi tanpa menahan chromedriver: browser di-launch dengan pageLoadStrategy 'none',
+        jadi loading di-poll di sini dan lock dilepas di antara poll biar tab lain tetap jalan.
+        """
+        deadline = time.monotonic() + config.CHROME_SETTINGS['timeouts']['pageLoad']
+        self.execute_script(_NAVIGATE_SCRIPT, url)
+        while True:
+            time.sleep(config.BROWSER_TABS['poll_interval'])
+            check_cancelled()
+            try:
+                if self.execute_script(_LOADED_SCRIPT):
+                    return
+            except WebDriverException as e:
+                # Error sesaat selama dokumen lama dibongkar; renderer crash tetap dilempar
+                if 'crash' in str(e).lower() or self.aborted:
+                    raise
+            if time.monotonic() > deadline:
+                raise TimeoutException(f"Timed out loading {url}")
+
+    def quit(self):
+        # Tab tidak boleh mematikan browser yang dipakai tab lain; tutup lewat pool
+        raise WebDriverException("TabDriver ditutup lewat TabPool.release()")
+
+
+class Browser:
+    """Satu proses Chrome dengan beberapa tab; command ke chromedriver diserialkan per browser"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.tabs = set()
+        self.reserved = 0  # Tab yang sudah dipesan tapi belum selesai dibuka
+        self.retiring = False  # Tidak dapat tab baru, ditutup begitu tab terakhir kembali
+        self._lock = threading.RLock()
+        self._current = driver.current_window_handle
+        self._anchor = self._current  # Tab awal tidak pernah ditutup biar session tetap hidup
+
+    @property
+    def load(self):
+        return len(self.tabs) + self.reserved
+
+    def run(self, handle, command):
+        with self._lock:
+            if self._current != handle:
+                self.driver.execute(Command.SWITCH_TO_WINDOW, {'handle': handle})
+                self._current = handle
+            return command()
+
+    def _cdp(self, cmd, params=None):
+        with self._lock:
+            return self.driver.execute_cdp_cmd(cmd, params or {})
+
+    def open_tab(self):
+        """Buka tab baru di browser context baru, return TabDriver-nya"""
+        context_id = None
+        if config.BROWSER_TABS['isolate_contexts']:
+            context_id = self._cdp('Target.createBrowserContext', {'disposeOnDetach': True})['browserContextId']
+            target_id = self._cdp('Target.createTarget', {'url': 'about:blank', 'browserContextId': context_id})['targetId']
+            with self._lock:
+                handles = self.driver.window_handles
+            handle = next((h for h in handles if h == target_id or h.endswith(target_id)), None)
+            if handle is None:
+                # chromedriver versi ini tidak melihat target di context lain: pakai tab biasa
+                self._cdp('Target.closeTarget', {'targetId': target_id})
+                self._cdp('Target.disposeBrowserContext', {'browserContextId': context_id})
+                context_id = None
+        if context_id is None:
+            with self._lock:
+                self.driver.switch_to.new_window('tab')
+                handle = self._current = self.driver.current_window_handle
+        tab = TabDriver(self, handle, context_id)
+        self.tabs.add(tab)
+        return tab
+
+    def close_tab(self, tab):
+        """Tutup tab beserta context-nya; error berarti browser-nya sendiri yang rusak"""
+        self.tabs.discard(tab)
+        with self._lock:
+            self.driver.execute(Command.SWITCH_TO_WINDOW, {'handle': tab.handle})
+            if not tab.context_id:
+                # Tab tanpa context sendiri berbagi cookie dengan tab lain; bersihkan seperti DriverPool
+                self.driver.delete_all_cookies()
+            self.driver.execute(Command.CLOSE)
+            self.driver.execute(Command.SWITCH_TO_WINDOW, {'handle': self._anchor})
+            self._current = self._anchor
+        if tab.context_id:
+            self._cdp('Target.disposeBrowserContext', {'browserContextId': tab.context_id})
+
+    def alive(self):
+        try:
+            with self._lock:
+                self.driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+
+class TabPool:
+    """
+    Pool tab di atas beberapa proses Chrome. Tab baru diberikan ke browser yang paling
+    sedikit tab aktifnya; browser baru di-launch kalau semua penuh dan jumlahnya belum maksimal.
+    Tab yang crash ditutup sendiri, browser lain dan tab lain di browser yang sama tidak terganggu.
+    """
+
+    def __init__(self, factory, max_browsers=None, tabs_per_browser=None):
+        self.factory = factory
+        self.max_browsers = max_browsers or config.BROWSER_TABS['max_browsers']
+        self.tabs_per_browser = tabs_per_browser or config.BROWSER_TABS['tabs_per_browser']
+        self._browsers = []
+        self._slots = threading.BoundedSemaphore(self.max_browsers * self.tabs_per_browser)
+        self._lock = threading.Lock()
+        # Dibangunkan setiap kali slot tab atau kuota launch berubah (release, discard, launch selesai)
+        self._changed = threading.Condition(self._lock)
+        self._launching = 0
+        self._closed = False
+        self.on_launch = None
+        self.on_discard = None
+
+    @property
+    def size(self):
+        return len(self._browsers)
+
+    @property
+    def in_use(self):
+        return sum(len(browser.tabs) for browser in list(self._browsers))
+
+    @property
+    def idle(self):
+        return sum(1 for browser in list(self._browsers) if not browser.load)
+
+    def drivers(self):
+        """Driver asli setiap browser (untuk supervisor: RSS, PID)"""
+        with self._lock:
+            return [browser.driver for browser in self._browsers]
+
+    def _launch(self):
+        browser = Browser(self.factory())
+        if self.on_launch:
+            self.on_launch(browser.driver)
+        return browser
+
+    def _discard(self, browser):
+        with self._lock:
+            if browser in self._browsers:
+                self._browsers.remove(browser)
+            self._changed.notify_all()
+        for tab in list(browser.tabs):
+            tab.aborted = True
+        try:
+            browser.driver.quit()
+        except Exception as e:
+            logger.error("Error closing browser: %s", e)
+        if self.on_discard:
+            self.on_discard(browser.driver)
+
+    def _browser_of(self, driver):
+        with self._lock:
+            return next((browser for browser in self._browsers if browser.driver is driver), None)
+
+    def recycle(self, driver):
+        """Browser ini tidak dapat tab baru dan ditutup setelah tab terakhirnya kembali"""
+        browser = self._browser_of(driver)
+        if browser is None:
+            return
+        with self._lock:
+            browser.retiring = True
+            # Browser pensiun tidak dihitung ke max_browsers, jadi penggantinya boleh di-launch
+            self._changed.notify_all()
+        if not browser.load:
+            self._discard(browser)
+
+    def _pick(self, deadline):
+        """Pilih browser untuk tab baru; None berarti perlu launch browser baru"""
+        with self._lock:
+            while True:
+                candidates = [
+                    browser for browser in self._browsers
+                    if not browser.retiring and browser.load < self.tabs_per_browser
+                ]
+                if candidates:
+                    browser = min(candidates, key=lambda candidate: candidate.load)
+                    # Tempat dipesan dulu biar thread lain tidak memilih slot yang sama
+                    browser.reserved += 1
+                    return browser
+                active = sum(1 for browser in self._browsers if not browser.retiring)
+                if active + self._launching < self.max_browsers:
+                    self._launching += 1
+                    return None
+                # Semua slot di browser yang sedang di-launch atau tab browser pensiun belum kembali
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DriverPoolExhausted("Tidak ada browser yang bisa menerima tab baru")
+                self._changed.wait(remaining)
+
+    def acquire(self, timeout=None):
+        """Ambil satu tab terisolasi"""
+        timeout = timeout or config.DRIVER_POOL['acquire_timeout']
+        if self._closed:
+            raise DriverPoolExhausted("Pool browser sedang dimatikan")
+        deadline = time.monotonic() + timeout
+        if not self._slots.acquire(timeout=timeout):
+            raise DriverPoolExhausted(f"Tidak ada tab kosong setelah {timeout} detik")
+        try:
+            browser = self._pick(deadline)
+            if browser is None:
+                try:
+                    browser = self._launch()
+                    browser.reserved += 1
+                    with self._lock:
+                        self._browsers.append(browser)
+                finally:
+                    with self._lock:
+                        self._launching -= 1
+                        self._changed.notify_all()
+            try:
+                return browser.open_tab()
+            except WebDriverException:
+                # Gagal buka tab = browser-nya rusak
+                self._discard(browser)
+                raise
+            finally:
+                with self._lock:
+                    browser.reserved -= 1
+                    self._changed.notify_all()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, tab, broken=False):
+        """Tutup tab; browser cuma ikut ditutup kalau memang mati atau sedang pensiun"""
+        browser = tab.owner
+        try:
+            try:
+                browser.close_tab(tab)
+            except Exception as e:
+                logger.warning("Failed to close tab, checking browser: %s", e)
+                if not browser.alive():
+                    self._discard(browser)
+                    return
+            if broken and not browser.alive():
+                self._discard(browser)
+            elif (browser.retiring or self._closed) and not browser.load:
+                self._discard(browser)
+        finally:
+            with self._lock:
+                self._changed.notify_all()
+            self._slots.release()
+
+    def lease(self, tab):
+        # TabDriver tidak pernah dipakai ulang setelah release, jadi tab itu sendiri sudah jadi "lease"
+        return None
+
+    def abort(self, tab, lease=None):
+        """Hentikan tab yang sedang dipakai; get() yang sedang poll langsung berhenti"""
+        tab.aborted = True
+
+    @contextmanager
+    def driver(self, timeout=None):
+        tab = self.acquire(timeout)
+        broken = False
+        try:
+            yield tab
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self.release(tab, broken=broken)
+
+    def prewarm(self, count=None):
+        """Launch browser duluan, return jumlah yang berhasil"""
+        count = min(count or config.DRIVER_POOL['prewarm'], self.max_browsers - self.size)
+        launched = 0
+        for _ in range(max(count, 0)):
+            try:
+                browser = self._launch()
+            except Exception as e:
+                logger.error("Failed to prewarm browser: %s", e)
+                continue
+            with self._lock:
+                self._browsers.append(browser)
+            launched += 1
+        return launched
+
+    def close(self):
+        """Tutup browser yang tidak punya tab aktif"""
+        self._closed = True
+        for browser in list(self._browsers):
+            if not browser.load:
+                self._discard(browser)
+
+    def drain(self, timeout):
+        self.close()
+        deadline = time.monotonic() + timeout
+        while self.size and time.monotonic() < deadline:
+            time.sleep(0.2)
+            self.close()
+        for browser in list(self._browsers):
+            self._discard(browser)
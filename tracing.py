@@ -0,0 +1,164 @@
+# tracing.py
+# Trace per update Telegram: setiap stage dan request keluar jadi span,
+# log ditulis sebagai JSON dengan trace_id biar gampang ditelusuri
+import contextvars
+import json
+import logging
+import secrets
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import config
+
+logger = logging.getLogger('tracing')
+
+# Span yang sedang aktif di context ini (per thread / per task)
+_current_span = contextvars.ContextVar('current_span', default=None)
+
+
+class Span:
+    """Satu unit kerja dalam trace, dengan durasi, outcome, dan child span"""
+    __slots__ = ('trace_id', 'name', 'attrs', 'start', 'duration', 'outcome', 'children')
+
+    def __init__(self, trace_id, name, attrs):
+        self.trace_id = trace_id
+        self.name = name
+        self.attrs = attrs
+        self.start = time.perf_counter()
+        self.duration = None
+        self.outcome = None
+        self.children = []
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'attrs': self.attrs,
+            'duration_ms': round((self.duration or 0) * 1000, 2),
+            'outcome': self.outcome,
+            'children': [child.to_dict() for child in self.children]
+        }
+
+
+class SlowTraceBuffer:
+    """Simpan trace terbaru, dan ambil yang paling lambat untuk diagnosa"""
+
+    def __init__(self, size=None):
+        self._traces = deque(maxlen=size or config.TRACING['recent_traces'])
+        self._lock = threading.Lock()
+
+    def add(self, root):
+        with self._lock:
+            self._traces.append(root)
+
+    def slowest(self, count=None):
+        count = count or config.TRACING['slowest_count']
+        with self._lock:
+            traces = list(self._traces)
+        return sorted(traces, key=lambda root: root.duration or 0, reverse=True)[:count]
+
+
+slow_traces = SlowTraceBuffer()
+
+
+def current_trace_id():
+    """trace_id dari span yang aktif, None kalau di luar trace"""
+    span = _current_span.get()
+    return span.trace_id if span else None
+
+
+@contextmanager
+def span(name, **attrs):
+    """Buka child span di bawah span yang aktif (atau span lepas kalau tidak ada trace)"""
+    parent = _current_span.get()
+    trace_id = parent.trace_id if parent else None
+    current = Span(trace_id, name, attrs)
+    if parent:
+        parent.children.append(current)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except Exception:
+        current.outcome = current.outcome or 'error'
+        raise
+    finally:
+        current.duration = time.perf_counter() - current.start
+        current.outcome = current.outcome or 'ok'
+        _current_span.reset(token)
+        if trace_id and config.TRACING['log_spans'] and logger.isEnabledFor(logging.INFO):
+            logger.info('span', extra={'span': {
+                'name': name,
+                'duration_ms': round(current.duration * 1000, 2),
+                'outcome': current.outcome,
+                **attrs
+            }})
+
+
+@contextmanager
+def start_trace(name, **attrs):
+    """Mulai trace baru (root span) untuk satu update Telegram"""
+    root = Span(secrets.token_hex(8), name, attrs)
+    token = _current_span.set(root)
+    try:
+        yield root
+    except Exception:
+        root.outcome = 'error'
+        raise
+    finally:
+        root.duration = time.perf_counter() - root.start
+        root.outcome = root.outcome or 'ok'
+        _current_span.reset(token)
+        slow_traces.add(root)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('trace', extra={'span': {
+                'name': name,
+                'duration_ms': round(root.duration * 1000, 2),
+                'outcome': root.outcome,
+                'trace_id': root.trace_id,
+                **attrs
+            }})
+
+
+def format_span_tree(root, max_depth=None):
+    """Render span tree jadi teks berindentasi"""
+    max_depth = max_depth or config.TRACING['max_tree_depth']
+    lines = [f"trace {root.trace_id} {root.name} {root.duration * 1000:.0f}ms [{root.outcome}]"]
+
+    def walk(node, depth):
+        for child in node.children:
+            label = ' '.join(f"{key}={value}" for key, value in child.attrs.items())
+            lines.append(
+                f"{'  ' * depth}└ {child.name} {(child.duration or 0) * 1000:.0f}ms "
+                f"[{child.outcome}] {label}".rstrip()
+            )
+            if depth < max_depth:
+                walk(child, depth + 1)
+
+    walk(root, 1)
+    return '\n'.join(lines)
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatter log JSON satu baris, otomatis bawa trace_id kalau ada"""
+
+    def format(self, record):
+        entry = {
+            'ts': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage()
+        }
+        # Record dari queue handler sudah bawa trace_id thread asalnya
+        trace_id = getattr(record, 'trace_id', None) or current_trace_id()
+        if trace_id:
+            entry['trace_id'] = trace_id
+        suppressed = getattr(record, 'suppressed', None)
+        if suppressed:
+            entry['suppressed'] = suppressed
+        span_info = getattr(record, 'span', None)
+        if span_info:
+            entry.update(span_info)
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
@@ -0,0 +1,117 @@
+# warmup.py
+# Fase startup: launch driver, buka koneksi keep-alive ke host API, isi cache DNS,
+# baru setelah itu instance dilaporkan ready di endpoint health
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import config
+import http_client
+from dns_cache import resolver as dns_resolver
+from whois_cache import registrable_domain, whois_cache
+
+logger = logging.getLogger(__name__)
+
+
+class Readiness:
+    """Status warm start: ready setelah semua step selesai (berhasil atau tidak)"""
+
+    def __init__(self):
+        self._ready = threading.Event()
+        self.steps = {}  # nama step -> ringkasan hasil
+        self.started = None
+        self.duration = None
+
+    def is_ready(self):
+        return self._ready.is_set()
+
+    def mark_ready(self):
+        self._ready.set()
+
+    def status(self):
+        """(ready, payload) untuk endpoint /healthz"""
+        return self.is_ready(), {
+            'status': 'ready' if self.is_ready() else 'warming',
+            'steps': dict(self.steps),
+            'warmup_seconds': round(self.duration, 2) if self.duration is not None else None
+        }
+
+
+readiness = Readiness()
+
+
+def warm_hosts():
+    """Host yang koneksi dan DNS-nya dipanaskan: host config.API_ENDPOINTS + tambahan"""
+    hosts = [http_client.host_of(url) for url in config.API_ENDPOINTS.values()]
+    return list(dict.fromkeys(hosts + config.WARMUP['extra_hosts']))
+
+
+def prime_connections(hosts):
+    """Buka koneksi TLS keep-alive ke setiap host, return jumlah host yang menjawab"""
+    def prime(host):
+        http_client.head(f"https://{host}/", timeout=config.WARMUP['connect_timeout'])
+
+    # Tanpa `with`: keluar dari blok with menunggu semua HEAD, termasuk yang menggantung
+    executor = ThreadPoolExecutor(max_workers=len(hosts) or 1, thread_name_prefix='warmup-http')
+    futures = {executor.submit(prime, host): host for host in hosts}
+    executor.shutdown(wait=False)
+    done, pending = wait(futures, timeout=config.WARMUP['timeout'])
+    primed = 0
+    for future, host in futures.items():
+        if future in pending:
+            logger.warning("Timed out priming connection to %s", host)
+        elif future.exception() is not None:
+            logger.warning("Failed to prime connection to %s: %s", host, future.exception())
+        else:
+            primed += 1
+    return primed
+
+
+def warm_start(driver_pool=None):
+    """
+    Jalankan semua step warm start secara paralel lalu tandai ready.
+    Step yang gagal atau lewat batas waktu tidak menahan ready, cuma dicatat.
+    """
+    if not config.WARMUP['enabled']:
+        readiness.mark_ready()
+        return readiness
+
+    readiness.started = time.monotonic()
+    hosts = warm_hosts()
+    # WHOIS platform cukup dipicu; hasilnya masuk cache tanpa ditunggu
+    for host in hosts:
+        whois_cache.lookup(registrable_domain(host), timeout=0.001)
+
+    steps = {
+        'dns': lambda: len(dns_resolver.resolve_many(hosts, ['A', 'AAAA'])),
+        'connections': lambda: prime_connections(hosts)
+    }
+    if driver_pool is not None:
+        steps['drivers'] = lambda: driver_pool.prewarm(config.DRIVER_POOL['prewarm'])
+
+    # Tanpa `with`: keluar dari blok with memanggil shutdown(wait=True) dan menunggu step yang macet
+    executor = ThreadPoolExecutor(max_workers=len(steps), thread_name_prefix='warmup')
+    futures = {executor.submit(step): name for name, step in steps.items()}
+    # Step yang timeout dibiarkan selesai sendiri di background
+    executor.shutdown(wait=False)
+    done, pending = wait(futures, timeout=config.WARMUP['timeout'])
+    for future, name in futures.items():
+        if future in pending:
+            readiness.steps[name] = 'timeout'
+        elif future.exception() is not None:
+            readiness.steps[name] = f"error: {future.exception()}"
+        else:
+            readiness.steps[name] = future.result()
+
+    readiness.duration = time.monotonic() - readiness.started
+    readiness.mark_ready()
+    logger.info("Warm start finished in %.1fs: %s", readiness.duration, readiness.steps)
+    return readiness
+
+
+def start_warmup(driver_pool=None):
+    """Jalankan warm start di background thread (mode webhook)"""
+    thread = threading.Thread(target=warm_start, args=(driver_pool,), name='warmup', daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,89 @@
+# whois_cache.py
+# Cache WHOIS per registrable domain (facebook.com, github.com, ...) dengan TTL panjang,
+# lookup yang miss dijalankan di thread pool terbatas dengan timeout keras
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+
+import whois
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# Suffix dua level yang umum; cukup untuk domain platform yang kita cek
+MULTI_PART_SUFFIXES = {'co.uk', 'co.id', 'co.jp', 'com.au', 'com.br', 'ac.id', 'or.id', 'go.id', 'web.id', 'my.id'}
+
+
+def registrable_domain(domain):
+    """Potong subdomain: 'johndoe.github.com' -> 'github.com'"""
+    labels = domain.lower().strip('.').split('.')
+    size = 3 if '.'.join(labels[-2:]) in MULTI_PART_SUFFIXES else 2
+    return '.'.join(labels[-size:])
+
+
+def _lookup(domain):
+    info = whois.whois(domain)
+    if not info or not info.get('domain_name'):
+        return {}
+    return {
+        'registrar': info.registrar,
+        'creation_date': str(info.creation_date),
+        'expiration_date': str(info.expiration_date)
+    }
+
+
+class WhoisCache:
+    """Cache hasil WHOIS; lookup bersamaan untuk domain yang sama cuma jalan sekali"""
+
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries or config.WHOIS['max_entries']
+        self._entries = OrderedDict()  # domain -> (expires, future)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.WHOIS['max_workers'],
+            thread_name_prefix='whois'
+        )
+
+    def _future(self, domain):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(domain)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(domain)
+                return entry[1]
+            future = self._executor.submit(_lookup, domain)
+            self._entries[domain] = (now + config.WHOIS['ttl'], future)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        future.add_done_callback(lambda done: self._forget_failure(domain, done))
+        return future
+
+    def _forget_failure(self, domain, future):
+        # Lookup yang error tidak disimpan, biar dicoba lagi di request berikutnya
+        if future.exception() is None:
+            return
+        logger.warning("WHOIS lookup failed for %s: %s", domain, future.exception())
+        with self._lock:
+            entry = self._entries.get(domain)
+            if entry and entry[1] is future:
+                del self._entries[domain]
+
+    def lookup(self, domain, timeout=None):
+        """
+        Info WHOIS registrable domain sebagai (info, outcome): outcome 'ok' (info {} kalau
+        tidak ada), 'timeout' kalau belum selesai dalam `timeout`, 'error' kalau lookup gagal
+        """
+        future = self._future(registrable_domain(domain))
+        try:
+            return future.result(timeout=timeout or config.WHOIS['timeout']), 'ok'
+        except FuturesTimeout:
+            return None, 'timeout'
+        except Exception:
+            # Sudah di-log oleh _forget_failure
+            return None, 'error'
+
+
+whois_cache = WhoisCache()